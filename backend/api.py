@@ -44,7 +44,8 @@ from cryptography.hazmat.backends import default_backend
 
 from backend.data import MerkleService, encrypt_record, encrypt_hospital_info_and_key, generate_private_key, generate_public_key
 from backend.roles import Patient, Doctor, GroupManager
-from backend.groupsig_utils import sign_message, verify_signature, open_signature_group_manager, open_signature_revocation_manager, open_signature_full
+from backend.crypto_worker import crypto_worker, CryptoWorkerBusy
+from backend.groupsig_utils import VerificationCoalescer, registry
 
 app = FastAPI(title="Healthcare Data Sharing API")
 
@@ -57,6 +58,29 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Group signature operations run in a pool of worker processes, off the event loop
+@app.on_event("startup")
+async def start_crypto_worker():
+    crypto_worker.start()
+
+@app.on_event("shutdown")
+async def stop_crypto_worker():
+    crypto_worker.stop()
+
+# Concurrent verifications (e.g. ingestion bursts on /api/records/store) are
+# sent to the workers in batches
+verify_coalescer = VerificationCoalescer(crypto_worker.verify_many)
+
+@app.get("/api/groupsig/stats")
+async def groupsig_stats():
+    """Crypto worker queue counters, verification latency and batch size histograms,
+    verdict cache hit rate (of one of the workers, see CryptoWorker.verify_cache_stats)"""
+    return {
+        "workers": crypto_worker.stats(),
+        "verify": verify_coalescer.stats(),
+        "verify_cache": await crypto_worker.verify_cache_stats(),
+    }
+
 # Health check endpoint
 @app.get("/health")
 @app.get("/api/health")
@@ -1183,9 +1207,11 @@ class PurchaseRequest(BaseModel):
 
 # API Endpoints
 @app.post("/api/records/sign")
-async def sign_record(record_data: dict = Body(...), wallet_address: str = Body(...)):
+async def sign_record(record_data: dict = Body(...), wallet_address: str = Body(...), group_id: Optional[str] = Body(None), member_id: Optional[str] = Body(None)):
     """
     Doctor creates and signs a record, which is then returned to be encrypted and stored.
+    The record is signed in the default group, or in a registered (hospital) group by the
+    given member, whose key must be owned by the wallet address.
     """
     try:
         # Check if the wallet address matches the Doctor address
@@ -1194,6 +1220,11 @@ async def sign_record(record_data: dict = Body(...), wallet_address: str = Body(
         else:
             print(f"Warning: Non-doctor address {wallet_address} is attempting to sign a record")
 
+        # Member keys of registered groups are used by their owner only
+        if (group_id is not None or member_id is not None) and not registry.is_owner(group_id, member_id, wallet_address):
+            print(f"Address {wallet_address} does not own member {member_id} of group {group_id}")
+            raise HTTPException(status_code=403, detail="Member key not owned by this wallet address")
+
         # Validate the record data
         if not record_data:
             raise HTTPException(status_code=400, detail="Record data is required")
@@ -1205,7 +1236,11 @@ async def sign_record(record_data: dict = Body(...), wallet_address: str = Body(
 
         # Sign the merkle root with group signature using the doctor's member key
         # The group signature provides cryptographic anonymity
-        signature = sign_message(merkle_root)
+        signature = await crypto_worker.sign(merkle_root, group_id, member_id)
+
+        # Registered groups do not accept mock signatures
+        if signature is None and group_id is not None:
+            raise HTTPException(status_code=500, detail="Group signature failed")
 
         # If group signature fails, fall back to a mock signature
         if signature is None:
@@ -1216,8 +1251,15 @@ async def sign_record(record_data: dict = Body(...), wallet_address: str = Body(
             "record": record_data,  # Return the original record
             "merkleRoot": merkle_root,
             "proofs": proofs,
-            "signature": signature
+            "signature": signature,
+            "groupId": group_id
         }
+    except KeyError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except CryptoWorkerBusy as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -1231,6 +1273,7 @@ async def store_record(data: dict):
         record = data.get("record", {})
         signature = data.get("signature", "")
         merkle_root = data.get("merkleRoot", "")
+        group_id = data.get("groupId")
         patient_address = data.get("patientAddress", "")
         hospital_info = data.get("hospitalInfo", "General Hospital")
 
@@ -1252,7 +1295,7 @@ async def store_record(data: dict):
 
         # 1. Verify the signature on the merkle_root
         try:
-            signature_verified = verify_signature(merkle_root, signature)
+            signature_verified = await verify_coalescer.verify(merkle_root, signature, group_id)
             if not signature_verified:
                 print(f"Signature verification failed for merkle_root: {merkle_root[:20]}...")
                 # For development purposes, we'll continue even if verification fails
@@ -1262,6 +1305,8 @@ async def store_record(data: dict):
                 # raise HTTPException(status_code=400, detail="Invalid signature")
             else:
                 print(f"Signature verified successfully for merkle_root: {merkle_root[:20]}...")
+        except CryptoWorkerBusy as e:
+            raise HTTPException(status_code=503, detail=str(e))
         except Exception as e:
             print(f"Error during signature verification: {e}")
             print("Warning: Continuing despite verification error (for development)")
@@ -1796,6 +1841,8 @@ async def store_record(data: dict):
             import traceback
             traceback.print_exc()
             raise HTTPException(status_code=500, detail=f"Error processing record: {str(inner_e)}")
+    except HTTPException:
+        raise
     except Exception as e:
         print(f"Outer exception: {str(e)}")
         import traceback
@@ -1904,6 +1951,7 @@ async def retrieve_record(data: dict):
         # Extract data
         cid = data.get("cid", "")
         signature = data.get("signature", "")
+        group_id = data.get("groupId")
         eId = data.get("eId", "")
         patient_address = data.get("patientAddress", "")
 
@@ -1939,7 +1987,7 @@ async def retrieve_record(data: dict):
         # Real implementation of signature verification and decryption
 
         # 1. Verify the signature on the merkle_root using the group public key
-        signature_verified = verify_signature(merkle_root, signature)
+        signature_verified = await verify_coalescer.verify(merkle_root, signature, group_id)
         if not signature_verified:
             print(f"Signature verification failed for merkle_root: {merkle_root[:20]}...")
             raise HTTPException(status_code=400, detail="Invalid signature")
@@ -1977,6 +2025,10 @@ async def retrieve_record(data: dict):
             return decrypted_record
         except Exception as e:
             raise HTTPException(status_code=500, detail=f"Error decrypting record: {str(e)}")
+    except CryptoWorkerBusy as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -3107,7 +3159,7 @@ async def compute_partial_opening(
             raise HTTPException(status_code=403, detail="Not authorized as Revocation Manager")
 
         # Compute the opening
-        open_result = open_signature_group_manager(signature)
+        open_result = await crypto_worker.open(signature)
         if open_result is None:
             # Fallback for demo purposes
             print("Warning: Signature opening failed. Using mock value.")
@@ -3120,6 +3172,10 @@ async def compute_partial_opening(
             "manager_type": manager_type,
             "open_result": open_result
         }
+    except CryptoWorkerBusy as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -3143,7 +3199,7 @@ async def get_opening_result(
         # Check if we have all the required information
         if signature and partial_g and partial_r:
             # Use the group signature utilities to open the signature
-            full_open_result = open_signature_full(signature, partial_g, partial_r)
+            full_open_result = await crypto_worker.open(signature, partial_g, partial_r)
 
             if full_open_result is not None:
                 # In a real implementation, we would use the full_open_result to get the signer's identity
@@ -3173,6 +3229,10 @@ async def get_opening_result(
             "signer_details": signer_details,
             "timestamp": int(time.time())
         }
+    except CryptoWorkerBusy as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -4,12 +4,25 @@ import os
 import json
 import time
 from pygroupsig import group, key
+from backend.groupsig_utils import registry
 
 class GroupSignature:
-    def __init__(self):
+    def __init__(self, group_id=None, member=None):
         # Initialize the group signature scheme (using CPY06 which supports revocation manager)
         self.scheme = "cpy06"
 
+        # Use a registered group (shared with the registry's cache, so its keys
+        # and precomputations are loaded once) instead of setting up a new one
+        if group_id is not None:
+            manager = registry.get(group_id)
+            self.group_manager = manager.g
+            self.member_group = manager.gm
+            self.group_key_b64 = manager.gm.group_key.to_b64()
+            self.member_key = registry.member_key(group_id, member) if member else manager.doctor_mk
+            if self.member_key is None:
+                raise Exception(f"No member key for group {group_id}")
+            return
+
         # Create the group manager instance
         self.group_manager = group(self.scheme)()
 
@@ -98,7 +111,8 @@ def initialize():
     global _instance
     if _instance is None:
         try:
-            _instance = GroupSignature()
+            # GROUPSIG_GROUP_ID selects a group of the registry
+            _instance = GroupSignature(os.getenv("GROUPSIG_GROUP_ID"), os.getenv("GROUPSIG_MEMBER"))
             return True
         except Exception as e:
             print(f"Error initializing group signature: {e}")
@@ -0,0 +1,173 @@
+"""
+Process pool running the group signature operations, so that the pairing
+code does not block the API's event loop.
+"""
+
+import asyncio
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+
+class CryptoWorkerBusy(RuntimeError):
+    """Raised when more operations are pending than the queue allows."""
+
+
+# Run in the worker processes. Importing groupsig_utils loads the keys (from
+# the group snapshot when there is one) into the worker's singleton, so every
+# worker keeps its own keys and precomputations
+
+def _init_worker():
+    from backend.groupsig_utils import gsm  # noqa: F401
+
+
+def _sign(message, group_id=None, member=None):
+    from backend.groupsig_utils import sign_message
+    return sign_message(message, group_id, member)
+
+
+def _verify(message, signature, group_id=None):
+    from backend.groupsig_utils import verify_signature
+    return verify_signature(message, signature, group_id)
+
+
+def _verify_many(messages, signatures, group_id=None):
+    from backend.groupsig_utils import verify_signatures
+    return verify_signatures(messages, signatures, group_id)
+
+
+def _verify_cache_stats():
+    from backend.groupsig_utils import gsm
+    # No cache (and no stats) when the worker has no keys
+    return {"pid": os.getpid(), **(gsm.verify_cache_stats() or {})}
+
+
+def _open(signature, partial_g=None, partial_r=None):
+    from backend.groupsig_utils import gsm
+    if partial_g is None:
+        return gsm.open_group_manager(signature)
+    if partial_r is None:
+        return gsm.open_revocation_manager(signature, partial_g)
+    return gsm.open_full(signature, partial_g, partial_r)
+
+
+def _trace(signature):
+    from backend.groupsig_utils import gsm
+    return gsm.trace(signature)
+
+
+class CryptoWorker:
+    def __init__(self, workers=None, max_pending=None):
+        """Pool of worker processes (GROUPSIG_WORKERS, one per CPU by default)
+        accepting up to max_pending operations at once (GROUPSIG_MAX_PENDING,
+        64 per worker by default). The pool is started on first use.
+
+        Each worker loads the keys on its own, so each one has a private
+        copy of the CRL (read from crl.b64 when the worker starts) and, with
+        GROUPSIG_PRESIGN_POOL set, its own presignature pool and refill
+        thread: the pool size applies per worker."""
+        self.workers = workers or int(os.getenv("GROUPSIG_WORKERS", os.cpu_count() or 1))
+        self.max_pending = max_pending or int(os.getenv("GROUPSIG_MAX_PENDING", 64 * self.workers))
+        self.pending = 0
+        self.rejected = 0
+        self._pool = None
+
+    def start(self):
+        """Start the worker processes."""
+        if self._pool is None:
+            # Spawned rather than forked: the workers load their own keys and
+            # do not inherit the API's threads (e.g. the presignature pool)
+            self._pool = ProcessPoolExecutor(
+                self.workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+            )
+            print(f"Started {self.workers} group signature workers")
+
+    def stop(self):
+        """Stop the worker processes once the pending operations are done."""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def _submit(self, calls):
+        """Start operations ((func, *args) each) taking one queue slot each,
+        all of them or none if the slots are not all free. Returns their
+        futures, a slot is freed when its operation is done."""
+        if self.pending + len(calls) > self.max_pending:
+            self.rejected += 1
+            raise CryptoWorkerBusy(f"Too many pending group signature operations ({self.pending})")
+        self.start()
+        pool = self._pool
+        loop = asyncio.get_running_loop()
+        futures = []
+        for func, *args in calls:
+            future = loop.run_in_executor(pool, func, *args)
+            self.pending += 1
+            future.add_done_callback(lambda f: self._done(f, pool))
+            futures.append(future)
+        return futures
+
+    def _done(self, future, pool):
+        self.pending -= 1
+        if not future.cancelled() and isinstance(future.exception(), BrokenProcessPool):
+            # A worker died, the next call starts a new pool (unless another
+            # failed call already did)
+            if self._pool is pool:
+                pool.shutdown(wait=False)
+                self._pool = None
+
+    async def _run(self, func, *args):
+        return await self._submit([(func, *args)])[0]
+
+    # group_id selects a group of the registry (see GroupRegistry), the
+    # default group otherwise. Workers load the groups they are sent
+    async def sign(self, message, group_id=None, member=None):
+        """Sign a message using the doctor's member key, or the key of a
+        member of a registered group."""
+        return await self._run(_sign, message, group_id, member)
+
+    async def verify(self, message, signature, group_id=None):
+        """Verify a signature, rejecting revoked signers."""
+        return await self._run(_verify, message, signature, group_id)
+
+    async def verify_many(self, messages, signatures, group_id=None):
+        """Verify many signatures, split in one batch per worker, rejecting
+        revoked signers. Returns one verdict per signature."""
+        size = -(-len(signatures) // self.workers) or 1
+        # Slots for all the chunks or none: a busy chunk would fail the
+        # whole batch while the others keep running
+        batches = await asyncio.gather(*self._submit([
+            (_verify_many, messages[i:i + size], signatures[i:i + size], group_id)
+            for i in range(0, len(signatures), size)
+        ]))
+        return [verdict for batch in batches for verdict in batch]
+
+    async def open(self, signature, partial_g=None, partial_r=None):
+        """Partial opening as the group manager, then as the revocation
+        manager given partial_g, or full opening given both partials."""
+        return await self._run(_open, signature, partial_g, partial_r)
+
+    async def trace(self, signature):
+        """Whether the signer of a signature is revoked."""
+        return await self._run(_trace, signature)
+
+    async def verify_cache_stats(self):
+        """Verdict cache counters and hit rate of the worker running the
+        call, with its pid. Each worker has its own cache and calls are not
+        routed to a given worker, so this is a sample of one cache rather
+        than a total."""
+        return await self._run(_verify_cache_stats)
+
+    def stats(self):
+        """Pool size and queue counters."""
+        return {
+            "workers": self.workers,
+            "pending": self.pending,
+            "max_pending": self.max_pending,
+            "rejected": self.rejected,
+        }
+
+# Singleton instance
+crypto_worker = CryptoWorker()
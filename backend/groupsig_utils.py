@@ -3,27 +3,159 @@ Utility functions for group signatures in the healthcare data sharing applicatio
 """
 
 import os
+import re
 import json
-from pygroupsig import group, key
+import base64
+import binascii
+import time
+import hashlib
+import asyncio
+import bisect
+import threading
+from pygroupsig import group, key, OfflineSignerCPY06
+from pygroupsig.utils import snapshot
+from pygroupsig.utils.helpers import LRUCache
+
+# Group key, pairing tables, manager keys, GML and member keys in one file
+# (written by cpy06_key_gen.py or GroupSignatureManager.save_snapshot)
+SNAPSHOT_PATH = os.getenv("GROUPSIG_SNAPSHOT", "keys/group_snapshot.bin")
+
+def group_key_fingerprint(group_key):
+    """Group key id: sha256 (hex) of the group key's wire encoding."""
+    return hashlib.sha256(group_key.to_bytes()).hexdigest()
+
+def _is_fallback_signature(signature):
+    """Whether a signature is one of the hex digests sign() falls back to."""
+    return (isinstance(signature, str) and len(signature) == 64
+            and all(c in '0123456789abcdefABCDEF' for c in signature))
+
+def _is_b64_signature(signature):
+    """Whether a signature is a non-empty base64 string, as group signatures are."""
+    if not isinstance(signature, str) or not signature:
+        return False
+    try:
+        base64.b64decode(signature, validate=True)
+    except (binascii.Error, ValueError):
+        return False
+    return True
 
 class GroupSignatureManager:
-    def __init__(self):
-        """Initialize the group signature manager."""
+    def __init__(self, snapshot_path=None, mock_fallback=True):
+        """Initialize the group signature manager, from the given group
+        snapshot only (see GroupRegistry) or from the default keys.
+
+        With mock_fallback, sign() returns a hex digest when signing fails
+        and verify() accepts those digests, for testing without keys.
+        Registered groups are loaded without it."""
+        self.mock_fallback = mock_fallback
         self.g = None  # Group manager's group instance
         self.gm = None  # Doctor's group instance
         self.doctor_mk = None  # Doctor's member key
+        self.signer = None  # Optional offline/online signer for the doctor's key
+        self._group_key_id = None
 
         # Load keys
-        self._load_keys()
+        if snapshot_path is not None:
+            self._load_snapshot(snapshot_path)
+        else:
+            self._load_keys()
+
+        # Verdicts are cached by the doctor's group instance only (see
+        # verify_and_trace), keyed by the group key, message and signature,
+        # and by the CRL version
+        if self.gm is not None:
+            self.gm.verdict_cache.maxsize = int(os.getenv("GROUPSIG_VERIFY_CACHE", "4096"))
 
     def _load_keys(self):
-        """Load keys from files."""
+        """Load keys from the group snapshot if there is one, from the key files otherwise."""
         try:
             # Check if keys directory exists
             if not os.path.exists("keys"):
                 print("Keys directory not found. Please run cpy06_key_gen.py first.")
                 return False
 
+            from_snapshot = os.path.exists(SNAPSHOT_PATH) and self._load_snapshot(SNAPSHOT_PATH)
+            if from_snapshot and self.doctor_mk is None:
+                print(f"No doctor's member key in {SNAPSHOT_PATH}")
+                from_snapshot = False
+            if not from_snapshot and not self._load_key_files():
+                return False
+
+            # Offline/online signing (opt-in): keep a pool of precomputed
+            # signatures for the doctor's key, refilled in the background
+            self._start_signer()
+
+            # The snapshot is written from keys verified at generation time,
+            # so the self-test is off by default when starting from it
+            if os.getenv("GROUPSIG_SELF_TEST", "0" if from_snapshot else "1") == "0":
+                return True
+
+            # Test if the keys are working by signing and verifying a test message
+            try:
+                test_message = "test_message"
+                test_signature = self.sign(test_message)
+                if test_signature:
+                    test_verify = self.verify(test_message, test_signature)
+                    if test_verify:
+                        print("Group signature keys loaded and verified successfully.")
+                        return True
+                    else:
+                        print("Group signature verification test failed.")
+                        return False
+                else:
+                    print("Group signature signing test failed.")
+                    return False
+            except Exception as e:
+                print(f"Error testing group signature keys: {e}")
+                return False
+        except Exception as e:
+            print(f"Error loading group signature keys: {e}")
+            return False
+
+    def _start_signer(self):
+        """Start the presignature pool for the doctor's key if
+        GROUPSIG_PRESIGN_POOL is set. Invalid settings leave it off."""
+        try:
+            pool_size = int(os.getenv("GROUPSIG_PRESIGN_POOL", "0"))
+            if pool_size <= 0:
+                return
+            watermark = int(os.getenv("GROUPSIG_PRESIGN_WATERMARK", pool_size // 4))
+            signer = OfflineSignerCPY06(self.gm, self.doctor_mk, size=pool_size, watermark=watermark)
+        except ValueError as e:
+            print(f"Invalid GROUPSIG_PRESIGN_POOL/GROUPSIG_PRESIGN_WATERMARK, presignature pool disabled: {e}")
+            return
+        signer.start()
+        self.signer = signer
+        print(f"Started presignature pool (size={pool_size}, watermark={watermark})")
+
+    def _load_snapshot(self, path):
+        """Load the group key with its pairing tables, both manager keys, the
+        GML and the doctor's member key (if any) from a snapshot, without
+        setup(). The CRL is read from crl.b64 next to the snapshot."""
+        try:
+            self.g, members = snapshot.load(path)
+            self.doctor_mk = members.get("doctor")
+        except (OSError, ValueError, KeyError) as e:
+            print(f"Error loading group snapshot {path}: {e}")
+            self.g = self.doctor_mk = None
+            return False
+
+        # The doctor's group instance shares the group key (and its
+        # precomputations) with the manager's one
+        self.gm = group("cpy06")()
+        self.gm.group_key = self.g.group_key
+        self.gm.crl = self.g.crl
+        crl_path = os.path.join(os.path.dirname(path), "crl.b64")
+        if os.path.exists(crl_path):
+            with open(crl_path, "r") as f:
+                self.g.crl.set_b64(f.read().strip())
+            print(f"Loaded CRL with {len(self.g.crl)} revoked members")
+        print(f"Loaded group snapshot {path}")
+        return True
+
+    def _load_key_files(self):
+        """Load keys from the individual key files."""
+        try:
             # Check if all required key files exist
             required_files = [
                 "keys/group_public_key.b64",
@@ -48,8 +180,9 @@ class GroupSignatureManager:
 
             # Initialize group manager's group instance
             try:
+                # No setup(): every manager key share is loaded below and the
+                # group key is shared with the doctor's instance
                 self.g = group("cpy06")()
-                self.g.setup()
                 print("Initialized group manager's group instance")
             except Exception as e:
                 print(f"Error initializing group manager's group instance: {e}")
@@ -103,6 +236,14 @@ class GroupSignatureManager:
             try:
                 self.gm = group("cpy06")()
                 self.gm.group_key.set_b64(group_key_b64)
+                # Share the group key with the manager's instance
+                self.g.group_key = self.gm.group_key
+                # Share the manager's CRL so revocations apply to verification
+                self.gm.crl = self.g.crl
+                if os.path.exists("keys/crl.b64"):
+                    with open("keys/crl.b64", "r") as f:
+                        self.g.crl.set_b64(f.read().strip())
+                    print(f"Loaded CRL with {len(self.g.crl)} revoked members")
                 print("Initialized doctor's group instance")
             except Exception as e:
                 print(f"Error initializing doctor's group instance: {e}")
@@ -118,32 +259,20 @@ class GroupSignatureManager:
             except Exception as e:
                 print(f"Error loading doctor's member key: {e}")
                 return False
-
-            # Test if the keys are working by signing and verifying a test message
-            try:
-                test_message = "test_message"
-                test_signature = self.sign(test_message)
-                if test_signature:
-                    test_verify = self.verify(test_message, test_signature)
-                    if test_verify:
-                        print("Group signature keys loaded and verified successfully.")
-                        return True
-                    else:
-                        print("Group signature verification test failed.")
-                        return False
-                else:
-                    print("Group signature signing test failed.")
-                    return False
-            except Exception as e:
-                print(f"Error testing group signature keys: {e}")
-                return False
+            return True
         except Exception as e:
             print(f"Error loading group signature keys: {e}")
             return False
 
-    def sign(self, message):
-        """Sign a message using the doctor's member key."""
-        if not self.gm or not self.doctor_mk:
+    def save_snapshot(self, path=None):
+        """Write the loaded keys to a group snapshot for the next start."""
+        snapshot.save(path or SNAPSHOT_PATH, self.g, {"doctor": self.doctor_mk})
+
+    def sign(self, message, member_key=None):
+        """Sign a message using the given member key, the doctor's by default."""
+        if member_key is None:
+            member_key = self.doctor_mk
+        if not self.gm or not member_key:
             print("Group signature manager not properly initialized.")
             return None
 
@@ -153,7 +282,10 @@ class GroupSignatureManager:
                 message = str(message)
 
             # Sign the message
-            s_msg = self.gm.sign(message, self.doctor_mk)
+            if self.signer is not None and member_key is self.doctor_mk:
+                s_msg = self.signer.sign(message)
+            else:
+                s_msg = self.gm.sign(message, member_key)
 
             # Handle different return types
             if isinstance(s_msg, dict) and "signature" in s_msg:
@@ -164,6 +296,8 @@ class GroupSignatureManager:
                 return s_msg
         except Exception as e:
             print(f"Error signing message: {e}")
+            if not self.mock_fallback:
+                return None
             # Create a fallback signature for testing purposes
             import hashlib
             import time
@@ -171,25 +305,52 @@ class GroupSignatureManager:
             print(f"Using fallback signature: {fallback_signature[:20]}...")
             return fallback_signature
 
+    def presign_stats(self):
+        """Presignature pool counters (None if the pool is disabled)."""
+        if self.signer is None:
+            return None
+        return self.signer.stats()
+
+    @property
+    def group_key_id(self):
+        """Fingerprint of the loaded group key."""
+        if self._group_key_id is None and self.gm:
+            self._group_key_id = group_key_fingerprint(self.gm.group_key)
+        return self._group_key_id
+
+    def verify_cache_stats(self):
+        """Verdict cache counters and hit rate."""
+        if not self.gm:
+            return None
+        return self.gm.verdict_cache.stats()
+
     def verify(self, message, signature):
-        """Verify a signature."""
+        """Verify a signature. Signatures of revoked members fail."""
         if not self.gm:
             print("Group signature manager not properly initialized.")
             return False
 
+        # Cached verdicts are reused by verify_and_trace(). Signatures that
+        # cannot be verified (an error rather than a verdict) are not cached
         try:
             # Convert message to string if it's not already
             if not isinstance(message, str):
                 message = str(message)
 
             # Check if this is a fallback signature (hex string)
-            if isinstance(signature, str) and all(c in '0123456789abcdefABCDEF' for c in signature):
+            if self.mock_fallback and _is_fallback_signature(signature):
                 print("Detected fallback signature, verification will be mocked")
                 # For fallback signatures, we'll just return True for testing
                 return True
+            if not _is_b64_signature(signature):
+                print("Signature verification failed: not a base64 signature")
+                return False
 
-            # Verify the signature
-            result = self.gm.verify(message, signature)
+            # Verify the signature and check the signer against the CRL
+            result = self.gm.verify_and_trace(message, signature)
+            if isinstance(result, dict) and result.get("revoked"):
+                print("Signature verification failed: signer is revoked")
+                return False
 
             # Handle different return types
             if isinstance(result, dict) and "status" in result:
@@ -206,11 +367,61 @@ class GroupSignatureManager:
         except Exception as e:
             print(f"Error verifying signature: {e}")
             # For testing purposes, if verification fails, check if it's a fallback signature
-            if isinstance(signature, str) and all(c in '0123456789abcdefABCDEF' for c in signature):
+            if self.mock_fallback and _is_fallback_signature(signature):
                 print("Fallback verification: treating hex string signature as valid")
                 return True
             return False
 
+    def verify_many(self, messages, signatures):
+        """Verify many signatures with one batch verification (reusing the
+        cached verdicts), rejecting revoked signers. Returns one verdict per
+        signature."""
+        if not self.gm:
+            print("Group signature manager not properly initialized.")
+            return [False] * len(signatures)
+
+        messages = [str(message) for message in messages]
+        verdicts = []
+        todo = []
+        fallback = 0
+        for i, signature in enumerate(signatures):
+            if self.mock_fallback and _is_fallback_signature(signature):
+                verdicts.append(True)
+                fallback += 1
+            else:
+                verdicts.append(False)
+                if _is_b64_signature(signature):
+                    todo.append(i)
+        if fallback:
+            print("Detected fallback signatures, verification will be mocked")
+        if not todo:
+            return verdicts
+
+        try:
+            results = self.gm.verify_and_trace_batch([messages[i] for i in todo], [signatures[i] for i in todo])
+            for i, result in zip(todo, results):
+                verdicts[i] = result["status"] == "success"
+            print(f"Batch verification of {len(todo)} signatures: {len(todo) - sum(verdicts[i] for i in todo)} failed")
+        except Exception as e:
+            # Malformed signatures fail in verify_batch(), this is some other
+            # error: verify one by one so that it only fails its own signature
+            print(f"Error in batch verification, verifying one by one: {e}")
+            for i in todo:
+                verdicts[i] = self.verify(messages[i], signatures[i])
+        return verdicts
+
+    def trace(self, signature):
+        """Check whether the signer of a signature is revoked."""
+        if not self.gm:
+            print("Group signature manager not properly initialized.")
+            return None
+
+        try:
+            return bool(self.gm.trace(signature).get("revoked"))
+        except Exception as e:
+            print(f"Error tracing signature: {e}")
+            return None
+
     def open_group_manager(self, signature):
         """Perform partial opening as the group manager."""
         if not self.g:
@@ -254,25 +465,312 @@ class GroupSignatureManager:
             print(f"Error performing full opening: {e}")
             return None
 
-# Singleton instance
-gsm = GroupSignatureManager()
-
-def sign_message(message):
-    """Sign a message using the doctor's member key."""
-    return gsm.sign(message)
-
-def verify_signature(message, signature):
-    """Verify a signature."""
-    return gsm.verify(message, signature)
+class Histogram:
+    """Number of observed values per bucket (bucket upper bounds, the last
+    bucket is unbounded), with their count and sum."""
+
+    def __init__(self, buckets):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def stats(self):
+        bounds = [str(b) for b in self.buckets] + ["+inf"]
+        return {
+            "buckets": dict(zip(bounds, self.counts)),
+            "count": self.count,
+            "sum": self.sum,
+            "mean": self.sum / self.count if self.count else 0.0,
+        }
+
+class VerificationCoalescer:
+    # Latency of a verify() call in milliseconds, number of signatures per batch
+    LATENCY_BUCKETS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000)
+    BATCH_BUCKETS = (1, 2, 4, 8, 16, 32, 64, 128)
+
+    def __init__(self, verify_many=None, window=None, max_batch=None):
+        """Collect the verify() calls made within window seconds of the first
+        pending one (GROUPSIG_VERIFY_WINDOW_MS, 3 ms by default), or until
+        max_batch are pending (GROUPSIG_VERIFY_BATCH, 32 by default), and
+        verify them with one call to verify_many(messages, signatures,
+        group_id=...), a coroutine returning one verdict per signature.
+        Signatures of different groups are batched separately. By default
+        this runs GroupSignatureManager.verify_many in the event loop's
+        executor."""
+        self.verify_many = verify_many or self._verify_many
+        if window is None:
+            window = float(os.getenv("GROUPSIG_VERIFY_WINDOW_MS", "3")) / 1000
+        self.window = window
+        self.max_batch = max_batch or int(os.getenv("GROUPSIG_VERIFY_BATCH", "32"))
+        self.latency = Histogram(self.LATENCY_BUCKETS_MS)
+        self.batch_size = Histogram(self.BATCH_BUCKETS)
+        # Group id -> pending calls, flush timer
+        self._pending = {}
+        self._timers = {}
+        # Batches being verified: the event loop only keeps weak references
+        # to tasks
+        self._tasks = set()
+
+    @staticmethod
+    async def _verify_many(messages, signatures, group_id=None):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, verify_signatures, messages, signatures, group_id)
+
+    async def verify(self, message, signature, group_id=None):
+        """Verify a signature (of the default or a registered group) along
+        with the others pending, rejecting revoked signers."""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        pending = self._pending.setdefault(group_id, [])
+        pending.append((str(message), signature, future, time.perf_counter()))
+        if len(pending) >= self.max_batch:
+            self._flush(group_id)
+        elif group_id not in self._timers:
+            self._timers[group_id] = loop.call_later(self.window, self._flush, group_id)
+        return await future
+
+    def _flush(self, group_id):
+        timer = self._timers.pop(group_id, None)
+        if timer is not None:
+            timer.cancel()
+        batch = self._pending.pop(group_id, [])
+        if batch:
+            task = asyncio.ensure_future(self._run(group_id, batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, group_id, batch):
+        self.batch_size.observe(len(batch))
+        try:
+            verdicts = list(await self.verify_many(
+                [b[0] for b in batch], [b[1] for b in batch], group_id=group_id
+            ))
+            # The verdicts cannot be matched to the signatures otherwise
+            if len(verdicts) != len(batch):
+                raise RuntimeError(
+                    f"Got {len(verdicts)} verdicts for {len(batch)} signatures"
+                )
+        except Exception as e:
+            for _, _, future, _ in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        now = time.perf_counter()
+        for (_, _, future, start), verdict in zip(batch, verdicts):
+            self.latency.observe((now - start) * 1000)
+            # The caller may have been cancelled meanwhile
+            if not future.done():
+                future.set_result(verdict)
+
+    def stats(self):
+        """Latency (ms) and batch size histograms."""
+        return {
+            "window_ms": self.window * 1000,
+            "max_batch": self.max_batch,
+            "latency_ms": self.latency.stats(),
+            "batch_size": self.batch_size.stats(),
+        }
+
+class GroupRegistry:
+    # Group ids are group key fingerprints, member names end up in file names
+    GROUP_ID = re.compile(r"[0-9a-f]{64}")
+    MEMBER = re.compile(r"[A-Za-z0-9_-][A-Za-z0-9_.-]{0,127}")
+
+    def __init__(self, directory=None, max_groups=None, max_member_keys=None):
+        """Groups (one per hospital) stored under directory
+        (GROUPSIG_GROUPS_DIR, keys/groups by default) as <group id>/group.bin,
+        a group snapshot with its precomputed pairing tables, an optional
+        <group id>/crl.b64 and <group id>/members/<name>.key member keys.
+
+        Groups are loaded on first use into a GroupSignatureManager and kept
+        in an LRU cache of max_groups entries (GROUPSIG_MAX_GROUPS, 16 by
+        default). Member keys are loaded on first use as well and kept in an
+        LRU cache of max_member_keys entries (GROUPSIG_MAX_MEMBER_KEYS, 1024
+        by default).
+
+        A member key can have an owner, the wallet address allowed to sign
+        with it, stored as <group id>/members/<name>.owner."""
+        self.directory = directory or os.getenv("GROUPSIG_GROUPS_DIR", "keys/groups")
+        self.groups = LRUCache(max_groups or int(os.getenv("GROUPSIG_MAX_GROUPS", "16")))
+        self.member_keys = LRUCache(max_member_keys or int(os.getenv("GROUPSIG_MAX_MEMBER_KEYS", "1024")))
+        self._lock = threading.Lock()
+
+    def _path(self, group_id, *parts):
+        if not isinstance(group_id, str) or not self.GROUP_ID.fullmatch(group_id):
+            raise ValueError(f"Invalid group id: {group_id!r}")
+        return os.path.join(self.directory, group_id, *parts)
+
+    def _member_path(self, group_id, name, ext=".key"):
+        if not isinstance(name, str) or not self.MEMBER.fullmatch(name):
+            raise ValueError(f"Invalid member name: {name!r}")
+        return self._path(group_id, "members", f"{name}{ext}")
+
+    @staticmethod
+    def _write(path, data):
+        """Replace a file, readable by its owner only (like the snapshot)."""
+        tmp = f"{path}.tmp"
+        fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+
+    def register(self, gs, members=None, owners=None):
+        """Store a group (its snapshot) and member keys (name -> key), with
+        their owners (name -> wallet address). Returns the group id."""
+        group_id = group_key_fingerprint(gs.group_key)
+        os.makedirs(self._path(group_id, "members"), exist_ok=True)
+        snapshot.save(self._path(group_id, "group.bin"), gs)
+        for name, member_key in (members or {}).items():
+            self.add_member(group_id, name, member_key, (owners or {}).get(name))
+        # A loaded copy would be stale
+        self.groups.discard(group_id)
+        print(f"Registered group {group_id[:16]}... with {len(members or {})} members")
+        return group_id
+
+    def add_member(self, group_id, name, member_key, owner=None):
+        """Store the member key of a member of a registered group, and the
+        wallet address of its owner if given."""
+        self._write(self._member_path(group_id, name), member_key.to_bytes())
+        if owner is not None:
+            self._write(self._member_path(group_id, name, ".owner"), owner.lower().encode())
+        self.member_keys.store((group_id, name), member_key)
+
+    def is_owner(self, group_id, name, wallet_address):
+        """Whether a wallet address owns a member key of a registered group.
+        Invalid or unknown members, and members without an owner, have none."""
+        try:
+            with open(self._member_path(group_id, name, ".owner"), "rb") as f:
+                owner = f.read().decode().strip()
+        except (ValueError, OSError):
+            return False
+        return isinstance(wallet_address, str) and owner == wallet_address.lower()
+
+    def group_ids(self):
+        """Ids of the registered groups."""
+        if not os.path.isdir(self.directory):
+            return []
+        return sorted(
+            d for d in os.listdir(self.directory)
+            if self.GROUP_ID.fullmatch(d) and os.path.exists(self._path(d, "group.bin"))
+        )
+
+    def members(self, group_id):
+        """Names of the members of a registered group."""
+        path = self._path(group_id, "members")
+        if not os.path.isdir(path):
+            return []
+        return sorted(f[:-4] for f in os.listdir(path) if f.endswith(".key"))
+
+    def get(self, group_id):
+        """GroupSignatureManager of a registered group, loaded on first use."""
+        hit, manager = self.groups.lookup(group_id)
+        if hit:
+            return manager
+        path = self._path(group_id, "group.bin")
+        # One load per group, even with concurrent first uses
+        with self._lock:
+            hit, manager = self.groups.lookup(group_id)
+            if hit:
+                return manager
+            if not os.path.exists(path):
+                raise KeyError(f"Unknown group {group_id}")
+            # No mock signatures: a hex digest is never valid in a registered group
+            manager = GroupSignatureManager(snapshot_path=path, mock_fallback=False)
+            if manager.gm is None:
+                raise ValueError(f"Could not load group {group_id}")
+            self.groups.store(group_id, manager)
+        return manager
+
+    def member_key(self, group_id, name):
+        """Member key of a member of a registered group, loaded on first use."""
+        hit, member_key = self.member_keys.lookup((group_id, name))
+        if hit:
+            return member_key
+        path = self._member_path(group_id, name)
+        if not os.path.exists(path):
+            raise KeyError(f"Unknown member {name} of group {group_id}")
+        scheme = self.get(group_id).gm.group_key.info()[0]
+        with open(path, "rb") as f:
+            member_key = key(scheme, "member").from_bytes(f.read())
+        self.member_keys.store((group_id, name), member_key)
+        return member_key
+
+    def sign(self, group_id, member, message):
+        """Sign a message with the key of a member of a registered group."""
+        return self.get(group_id).sign(message, self.member_key(group_id, member))
+
+    def verify(self, group_id, message, signature):
+        """Verify a signature of a registered group."""
+        return self.get(group_id).verify(message, signature)
+
+    def verify_many(self, group_id, messages, signatures):
+        """Verify many signatures of a registered group."""
+        return self.get(group_id).verify_many(messages, signatures)
+
+    def stats(self):
+        """Group and member key cache counters."""
+        return {"groups": self.groups.stats(), "member_keys": self.member_keys.stats()}
+
+registry = GroupRegistry()
+
+# Singleton instance, loaded on first use so that importing this module (for
+# VerificationCoalescer in the API process, say) does not load the keys
+_gsm = None
+_gsm_lock = threading.Lock()
+
+def get_manager(group_id=None):
+    """The GroupSignatureManager singleton (the default group's), or the one
+    of a registered group."""
+    global _gsm
+    with _gsm_lock:
+        if _gsm is None:
+            _gsm = GroupSignatureManager()
+    if group_id is None or group_id == _gsm.group_key_id:
+        return _gsm
+    return registry.get(group_id)
+
+def __getattr__(name):
+    if name == "gsm":
+        return get_manager()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def sign_message(message, group_id=None, member=None):
+    """Sign a message using the doctor's member key, or the key of a member
+    of a registered group."""
+    if member is not None:
+        return registry.sign(group_id, member, message)
+    return get_manager(group_id).sign(message)
+
+def verify_signature(message, signature, group_id=None):
+    """Verify a signature, rejecting revoked signers."""
+    return get_manager(group_id).verify(message, signature)
+
+def verify_signatures(messages, signatures, group_id=None):
+    """Verify many signatures at once, rejecting revoked signers."""
+    return get_manager(group_id).verify_many(messages, signatures)
+
+def verify_cache_stats():
+    """Verdict cache counters and hit rate."""
+    return get_manager().verify_cache_stats()
+
+def trace_signature(signature):
+    """Check whether the signer of a signature is revoked."""
+    return get_manager().trace(signature)
 
 def open_signature_group_manager(signature):
     """Perform partial opening as the group manager."""
-    return gsm.open_group_manager(signature)
+    return get_manager().open_group_manager(signature)
 
 def open_signature_revocation_manager(signature, partial_g):
     """Perform partial opening as the revocation manager."""
-    return gsm.open_revocation_manager(signature, partial_g)
+    return get_manager().open_revocation_manager(signature, partial_g)
 
 def open_signature_full(signature, partial_g, partial_r):
     """Perform full opening of a signature."""
-    return gsm.open_full(signature, partial_g, partial_r)
+    return get_manager().open_full(signature, partial_g, partial_r)
@@ -0,0 +1,112 @@
+"""GL19 blinding and conversion throughput for 100 and 1000 signatures: the
+original per-signature code (generic multiplications by the blinding and
+opening public keys) vs blind_many/convert_many, with one worker and with
+one per CPU
+
+Run with: python -m benchmarks.bench_blind [n ...]
+"""
+
+import hashlib
+import os
+import sys
+from typing import Any
+
+from benchmarks.bench_schemes import add_member
+from benchmarks.helpers import bench, report
+from pygroupsig import group, key
+from pygroupsig.schemes.gl19 import BlindSignature, Signature
+from pygroupsig.utils.mcl import G1, Fr
+
+
+def blind_loop(gs: Any, msgs: list[str], sigs: list[str], bkey: Any) -> None:
+    gk = gs.group_key
+    for message, sig_b64 in zip(msgs, sigs):
+        sig = Signature.from_b64(sig_b64)
+        alpha, beta, gamma = (
+            Fr.from_random(),
+            Fr.from_random(),
+            Fr.from_random(),
+        )
+        bsig = BlindSignature()
+        bsig.nym1.set_object(sig.nym1 + (gk.g * beta))
+        bsig.nym2.set_object(gk.g * alpha)
+        G1.muln([gk.cpk, bkey.pk], [beta, alpha], out=bsig.nym3).iadd(sig.nym2)
+        c = G1.from_hash(hashlib.sha256(message.encode()).digest())
+        bsig.c1.set_object(gk.g * gamma)
+        bsig.c2.set_object(c + (bkey.pk * gamma))
+        bsig.to_b64()
+
+
+def convert_loop(gs: Any, bsigs: list[str], public: str) -> None:
+    g = gs.group_key.g
+    r = Fr.from_random()
+    neg_csk_r = -gs.manager_key.csk * r
+    pk = G1.from_b64(public)
+    for bsig_b64 in bsigs:
+        bsig = BlindSignature.from_b64(bsig_b64)
+        r1, r2 = Fr.from_random(), Fr.from_random()
+        csig = BlindSignature()
+        G1.muln([bsig.nym2, g], [r, r1], out=csig.nym1)
+        G1.muln([bsig.nym1, bsig.nym3, pk], [neg_csk_r, r, r1], out=csig.nym2)
+        csig.c1.set_object(bsig.c1 + (g * r2))
+        csig.c2.set_object(bsig.c2 + (pk * r2))
+        csig.to_b64()
+
+
+def main(sizes: list[int]) -> None:
+    gs = group("gl19")()
+    gs.setup()
+    memkey = add_member(gs)
+    bkey = key("gl19", "blind").from_random(gs.group_key)
+    public = bkey.public()
+    messages = [f"Hello world {i}!" for i in range(max(sizes))]
+    signatures = [gs.sign(msg, memkey)["signature"] for msg in messages]
+    workers = os.cpu_count() or 1
+    rows = []
+    rates = []
+    for n in sizes:
+        msgs, sigs = messages[:n], signatures[:n]
+        bsigs = list(gs.blind_many(zip(msgs, sigs), bkey))
+
+        def blind_many(workers: int) -> None:
+            for _ in gs.blind_many(zip(msgs, sigs), bkey, workers):
+                pass
+
+        def convert_many(workers: int) -> None:
+            for _ in gs.convert_many(bsigs, public, workers):
+                pass
+
+        repeat = 3 if n < 1000 else 1
+        rows += [
+            (
+                f"{n} x blind",
+                bench(lambda: blind_loop(gs, msgs, sigs, bkey), 1, repeat),
+            ),
+            (
+                f"blind_many({n}), 1 worker",
+                bench(lambda: blind_many(1), 1, repeat),
+            ),
+            (
+                f"blind_many({n}), {workers} workers",
+                bench(lambda: blind_many(workers), 1, repeat),
+            ),
+            (
+                f"convert loop({n})",
+                bench(lambda: convert_loop(gs, bsigs, public), 1, repeat),
+            ),
+            (
+                f"convert_many({n}), 1 worker",
+                bench(lambda: convert_many(1), 1, repeat),
+            ),
+            (
+                f"convert_many({n}), {workers} workers",
+                bench(lambda: convert_many(workers), 1, repeat),
+            ),
+        ]
+        rates.append(f"{n}: {n / rows[-1][1]:.0f} conversions/s")
+    report("gl19 blind/convert", rows, unit="ms")
+    print("  convert_many " + ", ".join(rates))
+
+
+if __name__ == "__main__":
+    main([int(n) for n in sys.argv[1:]] or [100, 1000])
@@ -0,0 +1,96 @@
+"""Bursts of concurrent verifications (as on /api/records/store): one
+executor call per signature vs VerificationCoalescer batches, on threads
+and on the crypto worker processes. Every burst verifies new signatures,
+so that no verdict is cached. Uses the keys in ./keys
+
+Run with: python -m benchmarks.bench_coalescer [n ...]
+"""
+
+import asyncio
+import contextlib
+import os
+import sys
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from backend.crypto_worker import CryptoWorker
+from backend.groupsig_utils import VerificationCoalescer, get_manager
+from benchmarks.helpers import report
+
+
+@contextlib.contextmanager
+def quiet():
+    """Silence the backend's prints, the worker processes' too"""
+    sys.stdout.flush()
+    saved = os.dup(1)
+    with open(os.devnull, "w") as devnull:
+        os.dup2(devnull.fileno(), 1)
+    try:
+        with contextlib.redirect_stdout(open(os.devnull, "w")):
+            yield
+    finally:
+        os.dup2(saved, 1)
+        os.close(saved)
+
+
+async def burst(
+    verify: Callable[[str, str], Awaitable[Any]],
+    messages: list[str],
+    signatures: list[str],
+) -> float:
+    t = time.perf_counter()
+    verdicts = await asyncio.gather(*map(verify, messages, signatures))
+    assert all(verdicts)
+    return time.perf_counter() - t
+
+
+async def run(sizes: list[int]) -> tuple[list, list]:
+    gsm = get_manager()
+    count = iter(range(1 << 30))
+
+    def fresh(n: int) -> tuple[list[str], list[str]]:
+        messages = [f"merkle root {next(count)}" for _ in range(n)]
+        return messages, [gsm.sign(m) for m in messages]
+
+    loop = asyncio.get_running_loop()
+    ## Room for one pending call per signature without the coalescer
+    worker = CryptoWorker(max_pending=max(sizes))
+    worker.start()
+    ## Warm up the workers (key loading)
+    await worker.verify(*(v[0] for v in fresh(1)))
+
+    async def thread_verify(message: str, signature: str) -> bool:
+        return await loop.run_in_executor(None, gsm.verify, message, signature)
+
+    rows = []
+    stats = []
+    for n in sizes:
+        threads = VerificationCoalescer()
+        processes = VerificationCoalescer(worker.verify_many)
+        cases = [
+            (f"{n} x executor, threads", thread_verify),
+            (f"coalescer({n}), threads", threads.verify),
+            (f"{n} x executor, {worker.workers} processes", worker.verify),
+            (f"coalescer({n}), {worker.workers} processes", processes.verify),
+        ]
+        for name, verify in cases:
+            rows.append((name, await burst(verify, *fresh(n))))
+        stats.append((n, processes.stats()))
+    worker.stop()
+    return rows, stats
+
+
+def main(sizes: list[int]) -> None:
+    with quiet():
+        rows, stats = asyncio.run(run(sizes))
+    report("verification bursts", rows, unit="ms")
+    for n, s in stats:
+        print(
+            f"  coalescer({n}): {s['batch_size']['mean']:.1f} signatures per"
+            f" batch, {s['latency_ms']['mean']:.1f} ms mean latency"
+        )
+
+
+if __name__ == "__main__":
+    main([int(n) for n in sys.argv[1:]] or [10, 100])
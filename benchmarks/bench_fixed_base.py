@@ -0,0 +1,57 @@
+"""Signatures per second with and without fixed-base comb tables
+
+The group key tables are normally built lazily once the bases have been
+used often enough; here they are either built up front or disabled.
+
+Run with: python -m benchmarks.bench_fixed_base [scheme ...]
+"""
+
+import sys
+
+from benchmarks.bench_schemes import add_member
+from benchmarks.helpers import bench, report
+from pygroupsig import group
+from pygroupsig.utils.mcl import G1, Fr
+
+
+def disable_fixed_base(gs) -> None:  # type: ignore
+    for v in gs.group_key._fixed_base:
+        getattr(gs.group_key, v)._fixed_base = None
+    for v in ("_g1", "_g2"):
+        if hasattr(gs, v):
+            getattr(gs, v)._fixed_base = None
+
+
+def main(schemes: list[str]) -> None:
+    P = G1.from_random()
+    Q = G1.from_object(P)
+    Q.fixed_base()
+    r = Fr.from_random()
+    report(
+        "G1 scalar multiplication",
+        [
+            ("generic", bench(lambda: P * r)),
+            ("comb table", bench(lambda: Q * r)),
+        ],
+    )
+    for name in schemes:
+        gs = group(name)()
+        gs.setup()
+        mkey = add_member(gs)
+        sig = gs.sign("Hello, World!", mkey)["signature"]
+        rows = []
+        for label, prepare in (
+            ("generic", disable_fixed_base),
+            ("comb tables", lambda gs: gs.group_key.fixed_base(lazy=0)),
+        ):
+            prepare(gs)
+            sign = bench(lambda: gs.sign("Hello, World!", mkey), number=50)
+            verify = bench(lambda: gs.verify("Hello, World!", sig), number=50)
+            rows.append((f"{name} sign ({label})", sign))
+            rows.append((f"{name} verify ({label})", verify))
+        report(f"{name} (per call)", rows, unit="ms")
+        print("  " + ", ".join(f"{n}: {1 / t:.1f}/s" for n, t in rows))
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:] or ["cpy06", "bbs04", "gl19", "dl21"])
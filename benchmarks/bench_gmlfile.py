@@ -0,0 +1,52 @@
+"""Loading a GML from its b64 export vs opening the binary GML file, and
+member lookups in both
+
+Run with: python -m benchmarks.bench_gmlfile [members ...]
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+from benchmarks.helpers import bench, report
+from pygroupsig import gml
+from pygroupsig.utils.gmlfile import ContainerFile
+from pygroupsig.utils.mcl import G1
+
+
+def main(sizes: list[int]) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        for n in sizes:
+            ## Same shape as a CPY06 GML: (A, pi)
+            entries = gml()
+            for i in range(n):
+                entries[f"{i:064x}"] = (G1.from_random(), G1.from_random())
+            data = entries.to_b64()
+            path = os.path.join(tmp, f"gml{n}.bin")
+            start = time.perf_counter()
+            ContainerFile.from_b64(path, data).close()
+            export = time.perf_counter() - start
+            f = ContainerFile(path, readonly=True)
+            loaded = gml.from_b64(data)
+            A = entries[f"{n // 2:064x}"][0]
+
+            rows = [
+                ("export b64 -> file", export),
+                ("load b64", bench(lambda: gml.from_b64(data), number=1)),
+                (
+                    "open file",
+                    bench(lambda: ContainerFile(path, True).close(), number=10),
+                ),
+                ("dict lookup", bench(lambda: loaded.lookup(A), number=1000)),
+                ("file lookup", bench(lambda: f.lookup(A), number=1000)),
+            ]
+            print(
+                f"  b64 {len(data)} bytes, file {os.path.getsize(path)} bytes"
+            )
+            report(f"{n} members", rows, unit="ms")
+            f.close()
+
+
+if __name__ == "__main__":
+    main([int(n) for n in sys.argv[1:]] or [1000, 10000])
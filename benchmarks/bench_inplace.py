@@ -0,0 +1,63 @@
+"""Element allocations per sign/verify with the in-place arithmetic API
+
+Counts every mcl element constructed during a call (temporaries included)
+and reports it next to the per-call time.
+
+Run with: python -m benchmarks.bench_inplace [scheme ...]
+"""
+
+import ctypes
+import sys
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator
+
+from benchmarks.bench_schemes import add_member
+from benchmarks.helpers import bench, report
+from pygroupsig import group
+from pygroupsig.utils import mcl
+
+
+@contextmanager
+def count_allocations() -> Iterator[list[int]]:
+    counter = [0]
+
+    def counting_init(self: Any, *args: Any, **kwargs: Any) -> None:
+        counter[0] += 1
+        ctypes.Structure.__init__(self, *args, **kwargs)
+
+    mcl.Base.__init__ = counting_init
+    try:
+        yield counter
+    finally:
+        del mcl.Base.__init__
+
+
+def allocations(func: Callable[[], Any], number: int = 20) -> float:
+    with count_allocations() as counter:
+        for _ in range(number):
+            func()
+    return counter[0] / number
+
+
+def main(schemes: list[str]) -> None:
+    for name in schemes:
+        gs = group(name)()
+        gs.setup()
+        mkey = add_member(gs)
+        sig = gs.sign("Hello, World!", mkey)["signature"]
+
+        def sign() -> None:
+            gs.sign("Hello, World!", mkey)
+
+        def verify() -> None:
+            gs.verify("Hello, World!", sig)
+
+        rows = []
+        for op, func in (("sign", sign), ("verify", verify)):
+            print(f"  {name} {op}: {allocations(func):.0f} elements/call")
+            rows.append((f"{name} {op}", bench(func, number=20)))
+        report(f"{name} time per call", rows, unit="ms")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:] or ["cpy06", "klap20"])
@@ -0,0 +1,148 @@
+"""DL21 linking of 10, 100 and 1000 signatures: the original per-signature
+loops (verify, identify and Hash(scp) for each one) vs link/link_verify
+on top of verify_batch and the cached Hash(scp). For DL21SEQ, link_verify
+followed by a second pass over the sequence vs the single streaming pass
+of seqlink_verify_stream, also when the first signature is invalid
+
+Run with: python -m benchmarks.bench_link [n ...]
+"""
+
+import hashlib
+import sys
+from typing import Any
+
+import pygroupsig.utils.spk as spk
+from benchmarks.bench_schemes import add_member
+from benchmarks.helpers import bench, report
+from pygroupsig import group, signature
+from pygroupsig.utils.mcl import G1
+
+
+def link_loop(gs: Any, msgs: list[str], sigs: list[str], memkey: Any) -> G1:
+    hscp = G1()
+    for msg, sig_b64 in zip(msgs, sigs):
+        if gs.verify(msg, sig_b64)["status"] != "success":
+            break
+        if gs.identify(sig_b64, memkey)["status"] != "success":
+            break
+        hscp += G1.from_hash(hashlib.sha256(b"def").digest())
+    return hscp * memkey.y
+
+
+def link_verify_loop(gs: Any, msgs: list[str], sigs: list[str]) -> G1:
+    hscp = G1()
+    nym = G1()
+    for msg, sig_b64 in zip(msgs, sigs):
+        if gs.verify(msg, sig_b64)["status"] != "success":
+            break
+        hscp += G1.from_hash(hashlib.sha256(b"def").digest())
+        nym += signature("dl21").from_b64(sig_b64).nym
+    return nym
+
+
+def seqlink_verify_two_pass(
+    gs: Any, msgs: list[str], sigs: list[str], proof: str
+) -> bool:
+    proof2 = spk.DiscreteLogProof2.from_b64(proof)
+    proof_ = spk.DiscreteLogProof()
+    proof_.c.set_object(proof2.c)
+    proof_.s.set_object(proof2.s)
+    ret = gs.link_verify("password", msgs, sigs, proof_.to_b64())
+    for idx, sig_b64 in enumerate(sigs):
+        sig = signature("dl21seq").from_b64(sig_b64)
+        xi = bytes.fromhex(proof2.x[idx])
+        if hashlib.sha256(xi).hexdigest() != sig.seq["1"]:
+            return False
+        if idx > 0:
+            xi1 = bytes.fromhex(proof2.x[idx - 1])
+            _xi = bytes(a ^ b for a, b in zip(xi1, xi))
+            if hashlib.sha256(_xi).hexdigest() != sig.seq["2"]:
+                return False
+    return ret["status"] == "success"
+
+
+def main_seq(sizes: list[int]) -> None:
+    gs = group("dl21seq")()
+    gs.setup()
+    memkey = add_member(gs)
+    messages = [f"Hello world {i}!" for i in range(max(sizes))]
+    signatures = [
+        gs.sign(msg, memkey, state=i)["signature"]
+        for i, msg in enumerate(messages)
+    ]
+    rows = []
+    for n in sizes:
+        msgs, sigs = messages[:n], signatures[:n]
+        proof = gs.seqlink("password", msgs, sigs, memkey)["proof"]
+        assert seqlink_verify_two_pass(gs, msgs, sigs, proof)
+        bad = ["World hello!"] + msgs[1:]
+        repeat = 3 if n < 1000 else 1
+        for label, texts in (("", msgs), (", first invalid", bad)):
+            rows += [
+                (
+                    f"two passes({n}){label}",
+                    bench(
+                        lambda: seqlink_verify_two_pass(gs, texts, sigs, proof),
+                        1,
+                        repeat,
+                    ),
+                ),
+                (
+                    f"seqlink_verify_stream({n}){label}",
+                    bench(
+                        lambda: gs.seqlink_verify_stream(
+                            "password", zip(texts, sigs), proof
+                        ),
+                        1,
+                        repeat,
+                    ),
+                ),
+            ]
+    report("dl21seq sequence linking", rows, unit="ms")
+
+
+def main(sizes: list[int]) -> None:
+    gs = group("dl21")()
+    gs.setup()
+    memkey = add_member(gs)
+    messages = [f"Hello world {i}!" for i in range(max(sizes))]
+    signatures = [gs.sign(msg, memkey)["signature"] for msg in messages]
+    rows = []
+    for n in sizes:
+        msgs, sigs = messages[:n], signatures[:n]
+        proof = gs.link("password", msgs, sigs, memkey)["proof"]
+        assert (
+            gs.link_verify("password", msgs, sigs, proof)["status"] == "success"
+        )
+        repeat = 3 if n < 1000 else 1
+        rows += [
+            (
+                f"{n} x verify+identify",
+                bench(lambda: link_loop(gs, msgs, sigs, memkey), 1, repeat),
+            ),
+            (
+                f"link({n})",
+                bench(
+                    lambda: gs.link("password", msgs, sigs, memkey), 1, repeat
+                ),
+            ),
+            (
+                f"{n} x verify",
+                bench(lambda: link_verify_loop(gs, msgs, sigs), 1, repeat),
+            ),
+            (
+                f"link_verify({n})",
+                bench(
+                    lambda: gs.link_verify("password", msgs, sigs, proof),
+                    1,
+                    repeat,
+                ),
+            ),
+        ]
+    report("dl21 linking", rows, unit="ms")
+
+
+if __name__ == "__main__":
+    sizes = [int(n) for n in sys.argv[1:]] or [10, 100, 1000]
+    main(sizes)
+    main_seq(sizes)
@@ -0,0 +1,33 @@
+"""set_object/from_object: raw struct copy vs serialize + deserialize
+
+Run with: python -m benchmarks.bench_mcl_copy
+"""
+
+from benchmarks.helpers import bench, report
+from pygroupsig.utils.mcl import G1, G2, GT, Fr
+
+
+def main() -> None:
+    rows = []
+    for cls in (Fr, G1, G2, GT):
+        x = cls.from_random() if cls is not GT else GT.from_int(42)
+        y = cls()
+
+        def serialized() -> None:
+            y.set_bytes(x.to_bytes())
+
+        def copied() -> None:
+            y.set_object(x)
+
+        rows.append(
+            (f"{cls.__name__} set_object (serialize)", bench(serialized))
+        )
+        rows.append((f"{cls.__name__} set_object (memmove)", bench(copied)))
+        rows.append(
+            (f"{cls.__name__} from_object", bench(lambda: cls.from_object(x)))
+        )
+    report("mcl element copies", rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""Per-operation ffi overhead: bound dispatch tables vs per-call prototyping
+
+Run with: python -m benchmarks.bench_mcl_dispatch
+"""
+
+import ctypes
+
+import pygroupsig.utils.constants as ct
+from benchmarks.helpers import bench, report
+from pygroupsig.utils.mcl import G1, G2, GT, Fr
+
+
+def legacy_call(symbol: str, argtypes: list, restype=None):  # type: ignore
+    """What every operator did before the tables: look up and re-prototype"""
+    func = getattr(ct.lib, symbol)
+    func.argtypes = argtypes
+    func.restype = restype
+    return func
+
+
+def legacy_fr_add(x: Fr, y: Fr) -> Fr:
+    ret = Fr()
+    legacy_call("mclBnFr_add", [ctypes.POINTER(Fr)] * 3)(ret, x, y)
+    return ret
+
+
+def legacy_g1_mul(x: G1, y: Fr) -> G1:
+    ret = G1()
+    legacy_call("mclBnG1_mul", [ctypes.POINTER(G1)] * 2 + [ctypes.POINTER(Fr)])(
+        ret, x, y
+    )
+    return ret
+
+
+def legacy_g1_eq(x: G1, y: G1) -> bool:
+    func = legacy_call(
+        "mclBnG1_isEqual", [ctypes.POINTER(G1)] * 2, ctypes.c_int
+    )
+    return bool(func(x, y))
+
+
+def legacy_pairing(x: G1, y: G2) -> GT:
+    ret = GT()
+    legacy_call(
+        "mclBn_pairing",
+        [ctypes.POINTER(GT), ctypes.POINTER(G1), ctypes.POINTER(G2)],
+    )(ret, x, y)
+    return ret
+
+
+def main() -> None:
+    a, b = Fr.from_random(), Fr.from_random()
+    p, q = G1.from_random(), G1.from_random()
+    pp = G2.from_random()
+    cases = [
+        ("Fr + Fr", lambda: legacy_fr_add(a, b), lambda: a + b, 20000),
+        ("G1 == G1", lambda: legacy_g1_eq(p, q), lambda: p == q, 20000),
+        ("G1 * Fr", lambda: legacy_g1_mul(p, a), lambda: p * a, 2000),
+        (
+            "pairing",
+            lambda: legacy_pairing(p, pp),
+            lambda: GT.pairing(p, pp),
+            200,
+        ),
+    ]
+    rows = []
+    for name, legacy, bound, number in cases:
+        before = bench(legacy, number=number)
+        after = bench(bound, number=number)
+        rows.append((f"{name} (per-call prototype)", before))
+        rows.append((f"{name} (bound table)", after))
+        rows.append((f"{name} saved per op", before - after))
+    report("mcl dispatch overhead", rows)
+
+
+if __name__ == "__main__":
+    main()
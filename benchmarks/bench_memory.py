@@ -0,0 +1,51 @@
+"""Memory used per decoded signature, member key and proof
+
+Decodes a batch of copies of each container and reports the traced
+allocation per object (the mcl elements included).
+
+Run with: python -m benchmarks.bench_memory [scheme ...]
+"""
+
+import sys
+import tracemalloc
+from typing import Any, Callable
+
+from benchmarks.bench_schemes import add_member
+from pygroupsig import group, signature
+from pygroupsig.utils import spk
+
+
+def per_object(factory: Callable[[], Any], number: int = 1000) -> float:
+    tracemalloc.start()
+    try:
+        start = tracemalloc.get_traced_memory()[0]
+        objs = [factory() for _ in range(number)]
+        end = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    del objs
+    return (end - start) / number
+
+
+def main(schemes: list[str]) -> None:
+    for name in schemes:
+        gs = group(name)()
+        gs.setup()
+        mkey = add_member(gs)
+        sig = gs.sign("Hello, World!", mkey)["signature"]
+        sig_cls = signature(name)
+        mkey_b64 = mkey.to_b64()
+        print(
+            f"  {name} signature: "
+            f"{per_object(lambda: sig_cls.from_b64(sig)):.0f} bytes"
+        )
+        print(
+            f"  {name} member key: "
+            f"{per_object(lambda: type(mkey).from_b64(mkey_b64)):.0f} bytes"
+        )
+    for cls in (spk.DiscreteLogProof, spk.GeneralRepresentationProof):
+        print(f"  {cls.__name__}: {per_object(cls):.0f} bytes")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:] or ["bbs04", "ps16", "cpy06", "klap20", "gl19", "dl21"])
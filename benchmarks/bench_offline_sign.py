@@ -0,0 +1,32 @@
+"""CPY06 sign latency: full signature vs online part with a presignature
+pool hit
+
+Run with: python -m benchmarks.bench_offline_sign
+"""
+
+from benchmarks.bench_schemes import add_member
+from benchmarks.helpers import bench, report
+from pygroupsig import group
+from pygroupsig.schemes.cpy06 import OfflineSigner
+
+
+def main() -> None:
+    gs = group("cpy06")()
+    gs.setup()
+    memkey = add_member(gs)
+    number = 100
+    signer = OfflineSigner(gs, memkey, size=5 * number, watermark=0)
+    signer.fill()
+    rows = [
+        ("sign", bench(lambda: gs.sign("Hello world!", memkey), number, 3)),
+        (
+            "OfflineSigner.sign (hit)",
+            bench(lambda: signer.sign("Hello world!"), number, 3),
+        ),
+    ]
+    report("cpy06 sign latency", rows, unit="us")
+    print(f"  {signer.stats()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""Opening against large GMLs: the original per-member loops vs the
+precomputed opening values scanned in parallel (helpers.pairing_find). The
+signer is the last member, so the whole GML is scanned
+
+Run with: python -m benchmarks.bench_open [members ...] [scheme ...]
+"""
+
+import random
+import sys
+import time
+from typing import Any
+
+from benchmarks.bench_schemes import add_member
+from benchmarks.helpers import bench, report
+from pygroupsig import group, signature
+from pygroupsig.utils.mcl import G2, GT, Fr
+
+
+def fill_klap20(gs: Any, n: int) -> None:
+    """GML entries of n members that never joined (valid tau)"""
+    gk = gs.group_key
+    for i in range(n):
+        alpha, s0, s1 = Fr.from_random(), Fr.from_random(), Fr.from_random()
+        ggalpha = gk.gg * alpha
+        gs.gml[f"{i:064x}"] = (
+            gk.gg * s0,
+            gk.gg * s1,
+            ggalpha + gk.ZZ0 * s0,
+            ggalpha + gk.ZZ1 * s1,
+            GT.pairing(gk.g * alpha, gk.gg),
+        )
+
+
+def open_klap20_loop(gs: Any, sig_b64: str) -> str | None:
+    sig = signature("klap20").from_b64(sig_b64)
+    b = random.randint(0, 1)
+    for mem_id, (SS0, SS1, ff0, ff1, tau) in gs.gml.items():
+        if b:
+            ff = ff1 - SS1 * gs.manager_key.z1
+        else:
+            ff = ff0 - SS0 * gs.manager_key.z0
+        e1 = GT.multi_pairing([sig.uu, -sig.ww], [ff, gs.group_key.gg])
+        if e1.is_one() and GT.pairing(gs.group_key.g, ff) == tau:
+            return mem_id
+    return None
+
+
+def fill_ps16(gs: Any, n: int) -> None:
+    """GML entries (tau, ttau) of n members that never joined"""
+    gk = gs.group_key
+    for i in range(n):
+        t = Fr.from_random()
+        gs.gml[f"{i:064x}"] = (gk.g * t, G2.from_object(gk.Y * t).normalize())
+
+
+def open_ps16_loop(gs: Any, sig_b64: str) -> str | None:
+    sig = signature("ps16").from_b64(sig_b64)
+    e4 = GT.multi_pairing(
+        [sig.sigma2, -sig.sigma1], [gs.group_key.gg, gs.group_key.X]
+    )
+    for mem_id, (_, ttau) in gs.gml.items():
+        if GT.pairing(sig.sigma1, ttau) == e4:
+            return mem_id
+    return None
+
+
+SCHEMES = {
+    "ps16": (fill_ps16, open_ps16_loop),
+    "klap20": (fill_klap20, open_klap20_loop),
+}
+
+
+def main(sizes: list[int], schemes: list[str]) -> None:
+    for name in schemes:
+        fill, open_loop = SCHEMES[name]
+        for n in sizes:
+            gs = group(name)()
+            gs.setup()
+            fill(gs, n - 1)
+            mkey = add_member(gs)
+            sig = gs.sign("Hello, World!", mkey)["signature"]
+            start = time.perf_counter()
+            gs.precompute_open()
+            precompute = time.perf_counter() - start
+            assert gs.open(sig)["id"] == open_loop(gs, sig)
+            rows = [
+                ("precompute", precompute),
+                ("per-member loop", bench(lambda: open_loop(gs, sig), 1, 1)),
+                ("open", bench(lambda: gs.open(sig), 1, 3)),
+                ("open, 1 worker", bench(lambda: gs.open(sig, 1), 1, 3)),
+            ]
+            report(f"{name} open, {n} members", rows, unit="ms")
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    main(
+        [int(a) for a in args if a.isdigit()] or [1000, 10000],
+        [a for a in args if not a.isdigit()] or list(SCHEMES),
+    )
@@ -0,0 +1,43 @@
+"""Products of n pairings: n full pairings vs a single multi-pairing, with
+and without precomputed G2 tables
+
+Run with: python -m benchmarks.bench_pairing
+"""
+
+from benchmarks.helpers import bench, report
+from pygroupsig.utils.mcl import G1, G2, GT
+
+
+def main() -> None:
+    rows = []
+    for n in (1, 2, 3, 4):
+        P = [G1.from_random() for _ in range(n)]
+        Q = [G2.from_random() for _ in range(n)]
+        Qp = [G2.from_object(q) for q in Q]
+        for q in Qp:
+            q.precompute()
+
+        def separate() -> None:
+            e = GT.pairing(P[0], Q[0])
+            for i in range(1, n):
+                e.imul(GT.pairing(P[i], Q[i]))
+
+        def multi() -> None:
+            GT.multi_pairing(P, Q)
+
+        def multi_precomputed() -> None:
+            GT.multi_pairing(P, Qp)
+
+        rows.append((f"{n} x pairing", bench(separate, number=100)))
+        rows.append((f"multi_pairing({n})", bench(multi, number=100)))
+        rows.append(
+            (
+                f"multi_pairing({n}) precomputed",
+                bench(multi_precomputed, number=100),
+            )
+        )
+    report("pairing products", rows, unit="ms")
+
+
+if __name__ == "__main__":
+    main()
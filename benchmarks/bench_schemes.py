@@ -0,0 +1,38 @@
+"""Sign and verify throughput of the group signature schemes
+
+Run with: python -m benchmarks.bench_schemes [scheme ...]
+"""
+
+import sys
+
+from benchmarks.helpers import bench, report
+from pygroupsig import group, key
+
+
+def add_member(gs):  # type: ignore
+    memkey = key(gs._name, "member")()
+    msg2 = None
+    for _ in range(0, gs.join_seq() + 1, 2):
+        msg1 = gs.join_mgr(msg2)
+        msg2 = gs.join_mem(msg1, memkey)
+    return memkey
+
+
+def main(schemes: list[str]) -> None:
+    rows = []
+    for scheme in schemes:
+        gs = group(scheme)()
+        gs.setup()
+        memkey = add_member(gs)
+        message = "Hello world!"
+        signature = gs.sign(message, memkey)["signature"]
+        t_sign = bench(lambda: gs.sign(message, memkey), number=20)
+        t_verify = bench(lambda: gs.verify(message, signature), number=20)
+        rows.append((f"{scheme} sign", t_sign))
+        rows.append((f"{scheme} verify", t_verify))
+    report("scheme sign/verify (per call)", rows, unit="ms")
+    print("  " + ", ".join(f"{n}: {1 / t:.1f}/s" for n, t in rows))
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:] or ["cpy06"])
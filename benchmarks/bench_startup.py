@@ -0,0 +1,100 @@
+"""Startup time of the API workers. backend.api itself loads no keys, each
+crypto worker process loads the group keys into the backend.groupsig_utils
+singleton on first use: from the individual key files with the self-test,
+as before, vs from the group snapshot with and without the self-test. Each
+import runs in a fresh interpreter, in a scratch directory with keys made
+by cpy06_key_gen.py. The time to load the keys alone (a new
+GroupSignatureManager) is measured too, since the interpreter start and the
+module imports dominate the import time
+
+Run with: python -m benchmarks.bench_startup [runs]
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+
+from benchmarks.helpers import report
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+IMPORT = """
+import time
+t = time.perf_counter()
+{statement}
+print(time.perf_counter() - t)
+"""
+
+LOAD = """
+import contextlib, io, timeit
+from backend.groupsig_utils import GroupSignatureManager
+with contextlib.redirect_stdout(io.StringIO()):
+    t = min(timeit.repeat(GroupSignatureManager, number=1, repeat={runs}))
+print(t)
+"""
+
+
+def run(code: str, cwd: str, **env: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=cwd,
+        env={**os.environ, "PYTHONPATH": ROOT, **env},
+        capture_output=True,
+        text=True,
+    )
+
+
+def timed(code: str, cwd: str, **env: str) -> float:
+    ret = run(code, cwd, **env)
+    if ret.returncode:
+        raise RuntimeError(ret.stderr.strip().splitlines()[-1])
+    return float(ret.stdout.strip().splitlines()[-1])
+
+
+def import_time(statement: str, cwd: str, runs: int, **env: str) -> float:
+    """Best time to run an import statement in a fresh interpreter, in
+    seconds
+    """
+    return min(
+        timed(IMPORT.format(statement=statement), cwd, **env)
+        for _ in range(runs)
+    )
+
+
+def main(runs: int) -> None:
+    with tempfile.TemporaryDirectory() as cwd:
+        keygen = os.path.join(ROOT, "cpy06_key_gen.py")
+        run(open(keygen).read(), cwd).check_returncode()
+        rows = [
+            ("import pygroupsig", import_time("import pygroupsig", cwd, runs))
+        ]
+        try:
+            rows.append(
+                (
+                    "import backend.api",
+                    import_time("import backend.api", cwd, runs),
+                )
+            )
+        except RuntimeError as e:
+            print(f"backend.api: {e}")
+        load = "from backend.groupsig_utils import gsm"
+        missing = os.path.join(cwd, "missing.bin")
+        cases = [
+            ("key files + self-test", {"GROUPSIG_SNAPSHOT": missing}),
+            ("snapshot + self-test", {"GROUPSIG_SELF_TEST": "1"}),
+            ("snapshot", {}),
+        ]
+        rows += [
+            (f"{load}, {name}", import_time(load, cwd, runs, **env))
+            for name, env in cases
+        ]
+        rows += [
+            (f"load keys, {name}", timed(LOAD.format(runs=runs), cwd, **env))
+            for name, env in cases
+        ]
+    report("startup", rows, unit="ms")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10)
@@ -0,0 +1,54 @@
+"""CPY06 tracing against CRLs of growing size: a pairing per entry vs
+sharing the T4 Miller loop table, sequential vs parallel, and cached
+verify_and_trace verdicts
+
+Run with: python -m benchmarks.bench_trace [crl size ...]
+"""
+
+import os
+import sys
+
+from benchmarks.bench_schemes import add_member
+from benchmarks.helpers import bench, report
+from pygroupsig import group, signature
+from pygroupsig.utils.mcl import G1, GT
+
+
+def main(sizes: list[int]) -> None:
+    gs = group("cpy06")()
+    gs.setup()
+    mkey = add_member(gs)
+    sig_b64 = gs.sign("Hello, World!", mkey)["signature"]
+    sig = signature("cpy06").from_b64(sig_b64)
+    workers = os.cpu_count() or 1
+    for n in sizes:
+        gs.crl.clear()
+        for i in range(n):
+            gs.crl[f"{i:064x}"] = (G1.from_random(), G1.from_random())
+
+        def pairings() -> None:
+            for _, trace_trap in gs.crl.values():
+                if GT.pairing(trace_trap, sig.T4) == sig.T5:
+                    break
+
+        def trace_cached() -> None:
+            gs.verify_and_trace("Hello, World!", sig_b64)
+
+        number = max(1, 200 // n)
+        rows = [
+            ("pairing per entry", bench(pairings, number=number)),
+            (
+                "trace, 1 worker",
+                bench(lambda: gs.trace(sig_b64, workers=1), number=number),
+            ),
+            (
+                f"trace, {workers} workers",
+                bench(lambda: gs.trace(sig_b64), number=number),
+            ),
+            ("verify_and_trace, cached", bench(trace_cached, number=1000)),
+        ]
+        report(f"CRL of {n} entries", rows, unit="ms")
+
+
+if __name__ == "__main__":
+    main([int(n) for n in sys.argv[1:]] or [10, 100, 1000])
@@ -0,0 +1,41 @@
+"""CPY06 verification of 10, 100 and 1000 signatures, one verify call
+each vs a single verify_batch call
+
+Run with: python -m benchmarks.bench_verify_batch [n ...]
+"""
+
+import sys
+
+from benchmarks.bench_schemes import add_member
+from benchmarks.helpers import bench, report
+from pygroupsig import group
+
+
+def main(sizes: list[int]) -> None:
+    gs = group("cpy06")()
+    gs.setup()
+    memkey = add_member(gs)
+    messages = [f"Hello world {i}!" for i in range(max(sizes))]
+    signatures = [gs.sign(msg, memkey)["signature"] for msg in messages]
+    rows = []
+    rates = []
+    for n in sizes:
+        msgs, sigs = messages[:n], signatures[:n]
+
+        def one_by_one() -> None:
+            for msg, sig in zip(msgs, sigs):
+                gs.verify(msg, sig)
+
+        def batch() -> None:
+            gs.verify_batch(msgs, sigs)
+
+        repeat = 3 if n < 1000 else 1
+        rows.append((f"{n} x verify", bench(one_by_one, 1, repeat)))
+        rows.append((f"verify_batch({n})", bench(batch, 1, repeat)))
+        rates.append(f"{n}: {n / rows[-1][1]:.1f} signatures/s")
+    report("cpy06 verification", rows, unit="ms")
+    print("  verify_batch " + ", ".join(rates))
+
+
+if __name__ == "__main__":
+    main([int(n) for n in sys.argv[1:]] or [10, 100, 1000])
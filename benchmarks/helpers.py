@@ -0,0 +1,17 @@
+import timeit
+from typing import Any, Callable
+
+
+def bench(
+    func: Callable[[], Any], number: int = 1000, repeat: int = 5
+) -> float:
+    """Best wall time of a single call to func, in seconds"""
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number
+
+
+def report(title: str, rows: list[tuple[str, float]], unit: str = "us") -> None:
+    scale = {"s": 1, "ms": 1e3, "us": 1e6}[unit]
+    width = max(len(name) for name, _ in rows)
+    print(f"== {title}")
+    for name, seconds in rows:
+        print(f"  {name:<{width}}  {seconds * scale:12.3f} {unit}")
@@ -5,6 +5,7 @@ This scheme supports both group and revocation managers.
 """
 
 from pygroupsig import group, key
+from pygroupsig.utils import snapshot
 import os
 import json
 import base64
@@ -31,9 +32,9 @@ print("Group public key saved to keys/group_public_key.b64")
 print("\nExtracting group manager's secret key...")
 # For CPY06, we need to save the components separately
 gm_key = {
-    "xi1": str(g.manager_key.xi1),
-    "xi2": str(g.manager_key.xi2),
-    "gamma": str(g.manager_key.gamma)
+    "xi1": g.manager_key.xi1.get_str(),
+    "xi2": g.manager_key.xi2.get_str(),
+    "gamma": g.manager_key.gamma.get_str()
 }
 
 # Save group manager key
@@ -44,8 +45,8 @@ print("Group manager key saved to keys/group_manager_key.json")
 # Step 4: Extract and save the revocation manager's secret key
 print("\nExtracting revocation manager's secret key...")
 rm_key = {
-    "xi1": str(g.revocation_manager_key.xi1),
-    "xi2": str(g.revocation_manager_key.xi2)
+    "xi1": g.revocation_manager_key.xi1.get_str(),
+    "xi2": g.revocation_manager_key.xi2.get_str()
 }
 
 # Save revocation manager key
@@ -115,6 +116,12 @@ with open("keys/test_signature.json", "w") as f:
     }, f, indent=2)
 print("Test signature saved to keys/test_signature.json")
 
+# Step 8: Save everything the backend loads at startup in one snapshot
+# (group key with its pairing tables, both managers' keys, the GML and the
+# doctor's member key), so it starts without setup()
+snapshot.save("keys/group_snapshot.bin", g, {"doctor": mk})
+print("Group snapshot saved to keys/group_snapshot.bin")
+
 print("\nAll keys generated and saved successfully!")
 print("Files created:")
 print("  - keys/group_public_key.b64")
@@ -122,3 +129,4 @@ print("  - keys/group_manager_key.json")
 print("  - keys/revocation_manager_key.json")
 print("  - keys/doctor_member_key.b64")
 print("  - keys/test_signature.json")
+print("  - keys/group_snapshot.bin")
@@ -3,6 +3,7 @@
 __all__ = [
     "crl",
     "gml",
+    "signature_cache",
     "key",
     "group",
     "signature",
@@ -21,6 +22,7 @@ __all__ = [
     "ManagerKeyCPY06",
     "MemberKeyCPY06",
     "SignatureCPY06",
+    "OfflineSignerCPY06",
     "GroupKLAP20",
     "GroupKeyKLAP20",
     "ManagerKeyKLAP20",
@@ -53,6 +55,7 @@ from .schemes.cpy06 import Group as GroupCPY06
 from .schemes.cpy06 import GroupKey as GroupKeyCPY06
 from .schemes.cpy06 import ManagerKey as ManagerKeyCPY06
 from .schemes.cpy06 import MemberKey as MemberKeyCPY06
+from .schemes.cpy06 import OfflineSigner as OfflineSignerCPY06
 from .schemes.cpy06 import Signature as SignatureCPY06
 from .schemes.dl21 import Group as GroupDL21
 from .schemes.dl21 import GroupKey as GroupKeyDL21
@@ -82,5 +85,6 @@ from .schemes.ps16 import Signature as SignaturePS16
 from .utils.constants import load_library
 from .utils.helpers import CRL as crl
 from .utils.helpers import GML as gml
+from .utils.helpers import signature_cache
 
 load_library()
@@ -4,6 +4,8 @@ from typing import Any, Generic, KeysView, Type, TypeVar
 
 
 class Container(ABC):
+    __slots__ = ()
+
     _scheme_name: str
     _container_type: str
 
@@ -12,16 +12,20 @@ from pygroupsig.utils.helpers import (
     MetadataManagerKeyMixin,
     MetadataMemberKeyMixin,
     MetadataSignatureMixin,
+    PrecomputeMixin,
     ReprMixin,
+    signature_cache,
 )
 from pygroupsig.utils.mcl import G1, G2, GT, Fr
 
 
 class MetadataMixin:
+    __slots__ = ()
     _name = "bbs04"
 
 
 class GroupKey(
+    PrecomputeMixin,
     B64Mixin,
     InfoMixin,
     ReprMixin,
@@ -39,6 +43,21 @@ class GroupKey(
     hg2: GT
     g1g2: GT
 
+    _precompute = ("g2",)
+    _fixed_base = ("g2", "h", "u", "v", "w")
+
+    __slots__ = (  # noqa: RUF023 (wire order)
+        "g1",
+        "g2",
+        "h",
+        "u",
+        "v",
+        "w",
+        "hw",
+        "hg2",
+        "g1g2",
+    )
+
     def __init__(self) -> None:
         self.g1 = G1()  # Tr(g2)
         self.g2 = G2()  # andom generator of G2
@@ -64,6 +83,8 @@ class ManagerKey(
     xi2: Fr
     gamma: Fr
 
+    __slots__ = ("xi1", "xi2", "gamma")  # noqa: RUF023 (wire order)
+
     def __init__(self) -> None:
         self.xi1 = Fr()  # Exponent for tracing signatures
         self.xi2 = Fr()  # Exponent for tracing signatures
@@ -82,6 +103,8 @@ class MemberKey(
     A: G1
     Ag2: GT
 
+    __slots__ = ("x", "A", "Ag2")  # noqa: RUF023 (wire order)
+
     def __init__(self) -> None:
         self.x = Fr()  # 1st element of the member's key
         self.A = G1()  # 2nd element of the member's key, A = g_1^(1/(gamma+x))
@@ -106,6 +129,18 @@ class Signature(
     sdelta1: Fr
     sdelta2: Fr
 
+    __slots__ = (  # noqa: RUF023 (wire order)
+        "T1",
+        "T2",
+        "T3",
+        "c",
+        "salpha",
+        "sbeta",
+        "sx",
+        "sdelta1",
+        "sdelta2",
+    )
+
     def __init__(self) -> None:
         self.T1 = G1()
         self.T2 = G1()
@@ -174,6 +209,9 @@ class Group(
             GT.pairing(self.group_key.g1, self.group_key.g2)
         )
 
+        ## Pairing tables of the fixed G2 operands
+        self.group_key.precompute()
+
     @staticmethod
     def join_seq() -> int:
         return 1
@@ -261,32 +299,25 @@ class Group(
         rdelta2 = Fr.from_random()
 
         ## Compute R1, R2, R3, R4, R5
-        # Optimized o1 = e(T3, g2) = e(h, g2)**(alpha+beta) * e(A, g2)
-        aux_o1 = (self.group_key.hg2**alphabeta) * member_key.Ag2
-
         # R1 = u*ralpha
         R1 = self.group_key.u * ralpha
         # R2 = v*rbeta
         R2 = self.group_key.v * rbeta
 
         # R3 = e(T3,g2)^rx * e(h,w)^(-ralpha-rbeta) * e(h,g2)^(-rdelta1-rdelta2)
-        # e1 = e(T3,g2)^rx
-        aux_e1 = aux_o1**rx
-
-        # e2 = e(h,w)**(-ralpha-rbeta)
-        aux_e2 = self.group_key.hw ** ((-ralpha) - rbeta)
-
-        # e3 = e(h,g2)**(-rdelta1-rdelta2)
-        aux_e3 = self.group_key.hg2 ** ((-rdelta1) - rdelta2)
-
-        # R3 = e1 * e2 * e3
-        R3 = aux_e1 * aux_e2 * aux_e3
+        ## Optimized with e(T3, g2) = e(h, g2)**(alpha+beta) * e(A, g2):
+        ## R3 = e(h,g2)^(alphabeta*rx-rdelta1-rdelta2) * e(A,g2)^rx
+        ##      * e(h,w)^(-ralpha-rbeta)
+        R3 = GT.pown(
+            [self.group_key.hg2, member_key.Ag2, self.group_key.hw],
+            [(alphabeta * rx) - rdelta1 - rdelta2, rx, (-ralpha) - rbeta],
+        )
 
         # R4 = T1*rx + u*-rdelta1
-        R4 = (sig.T1 * rx) + (self.group_key.u * (-rdelta1))
+        R4 = G1.muln([sig.T1, self.group_key.u], [rx, -rdelta1])
 
         # R5 = T2*rx + v*-rdelta2
-        R5 = (sig.T2 * rx) + (self.group_key.v * (-rdelta2))
+        R5 = G1.muln([sig.T2, self.group_key.v], [rx, -rdelta2])
 
         # c = hash(M,T1,T2,T3,R1,R2,R3,R4,R5) \in Zp
         h = hashlib.sha256()
@@ -321,41 +352,41 @@ class Group(
     def verify(self, message: str, signature: str) -> dict[str, Any]:
         message = str(message)
         ret = {"status": "fail"}
-        sig = Signature.from_b64(signature)
+        sig = signature_cache.get(Signature, signature)
 
         # R1 = u*salpha + T1*(-c)
         aux_neg = -sig.c
-        R1 = (self.group_key.u * sig.salpha) + (sig.T1 * aux_neg)
+        R1 = G1.muln([self.group_key.u, sig.T1], [sig.salpha, aux_neg])
 
         # R2 = v*sbeta + T2*(-c)
-        R2 = (self.group_key.v * sig.sbeta) + (sig.T2 * aux_neg)
+        R2 = G1.muln([self.group_key.v, sig.T2], [sig.sbeta, aux_neg])
 
         ## R3 = e(T3,g2)^sx * e(h,w)^(-salpha-sbeta) * e(h,g2)^(-sdelta1-sdelta2) * (e(T3,w)/e(g1,g2))^c
         ## Optimized R3 =  e(h,w)^(-salpha-sbeta) * e(h,g2)^(-sdelta1-sdelta2) * e(T3, w^c * g2 ^ sx) * e(g1, g2)^-c
 
         ## Optimized e1 = e(T3, g2*sx + w*c)
-        aux_e5 = (self.group_key.g2 * sig.sx) + (self.group_key.w * sig.c)
+        aux_e5 = G2.muln([self.group_key.g2, self.group_key.w], [sig.sx, sig.c])
         aux_e1 = GT.pairing(sig.T3, aux_e5)
 
-        # e2 = e(h,w)**(-salpha-sbeta)
-        aux_neg = (-sig.salpha) - sig.sbeta
-        aux_e2 = self.group_key.hw**aux_neg
-
-        # e3 = e(h,g2)**(-sdelta1-sdelta2)
-        aux_neg = (-sig.sdelta1) - sig.sdelta2
-        aux_e3 = self.group_key.hg2**aux_neg
-
-        # e4 = e(g1,g2)**-c
-        aux_e4 = ~(self.group_key.g1g2**sig.c)
+        # e2 = e(h,w)**(-salpha-sbeta), e3 = e(h,g2)**(-sdelta1-sdelta2)
+        # and e4 = e(g1,g2)**-c
+        aux_e2 = GT.pown(
+            [self.group_key.hw, self.group_key.hg2, self.group_key.g1g2],
+            [
+                (-sig.salpha) - sig.sbeta,
+                (-sig.sdelta1) - sig.sdelta2,
+                -sig.c,
+            ],
+        )
 
         # R3 = e1 * e2 * e3 * e4
-        R3 = aux_e1 * aux_e2 * aux_e3 * aux_e4
+        R3 = aux_e1.imul(aux_e2)
 
         # R4 = T1*sx + u*(-sdelta1)
-        R4 = (sig.T1 * sig.sx) + (self.group_key.u * (-sig.sdelta1))
+        R4 = G1.muln([sig.T1, self.group_key.u], [sig.sx, -sig.sdelta1])
 
         # R5 = T2*sx + v*(-sdelta2)
-        R5 = (sig.T2 * sig.sx) + (self.group_key.v * (-sig.sdelta2))
+        R5 = G1.muln([sig.T2, self.group_key.v], [sig.sx, -sig.sdelta2])
 
         ## Recompute the hash-challenge c
         # c = hash(M,T1,T2,T3,R1,R2,R3,R4,R5) \in Zp
@@ -383,10 +414,10 @@ class Group(
     def open(self, signature: str) -> dict[str, Any]:
         ret = {"status": "fail"}
         ## Recover the signer's A as
-        sig = Signature.from_b64(signature)
+        sig = signature_cache.get(Signature, signature)
         # A = T3 - (T1*xi1 + T2*xi2)
-        A = sig.T3 - (
-            (sig.T1 * self.manager_key.xi1) + (sig.T2 * self.manager_key.xi2)
+        A = sig.T3 - G1.muln(
+            [sig.T1, sig.T2], [self.manager_key.xi1, self.manager_key.xi2]
         )
         h = hashlib.sha256(A.to_bytes())
         mem_id = h.hexdigest()
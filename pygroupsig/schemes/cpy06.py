@@ -1,5 +1,7 @@
 import hashlib
 import logging
+import threading
+from collections import deque
 from typing import Any
 
 import pygroupsig.utils.spk as spk
@@ -10,20 +12,27 @@ from pygroupsig.utils.helpers import (
     B64Mixin,
     InfoMixin,
     JoinMixin,
+    LRUCache,
     MetadataGroupKeyMixin,
     MetadataManagerKeyMixin,
     MetadataMemberKeyMixin,
     MetadataSignatureMixin,
+    PrecomputeMixin,
     ReprMixin,
+    fields,
+    parallel_find,
+    signature_cache,
 )
-from pygroupsig.utils.mcl import G1, G2, GT, Fr
+from pygroupsig.utils.mcl import G1, G2, GT, FixedBaseTable, Fr
 
 
 class MetadataMixin:
+    __slots__ = ()
     _name = "cpy06"
 
 
 class GroupKey(
+    PrecomputeMixin,
     B64Mixin,
     InfoMixin,
     ReprMixin,
@@ -43,6 +52,23 @@ class GroupKey(
     e4: GT
     e5: GT
 
+    _precompute = ("r",)
+    _fixed_base = ("q", "x", "y", "z", "w")
+
+    __slots__ = (  # noqa: RUF023 (wire order)
+        "q",
+        "r",
+        "w",
+        "x",
+        "y",
+        "z",
+        "e1",
+        "e2",
+        "e3",
+        "e4",
+        "e5",
+    )
+
     def __init__(self) -> None:
         self.q = G1()  # Q \in_R G1
         self.r = G2()  # R = g2^\gamma; where g2 is G2's generator
@@ -55,7 +81,7 @@ class GroupKey(
         self.e2 = GT()  # e2 = e(z,g2). Used in sign
         self.e3 = GT()  # e3 = e(z,r). Used in sign
         self.e4 = GT()  # e4 = e(g1,g2). Used in sign
-        self.e5 = GT()  # e5 = e(q,g2). Used in verify
+        self.e5 = GT()  # e5 = e(q,g2). Unused, kept in the exported key
 
 
 class ManagerKey(
@@ -70,6 +96,8 @@ class ManagerKey(
     xi2: Fr
     gamma: Fr
 
+    __slots__ = ("xi1", "xi2", "gamma")  # noqa: RUF023 (wire order)
+
     def __init__(self) -> None:
         self.xi1 = Fr()  # Exponent for tracing signatures. \xi_1 \in_R Z^*_p
         self.xi2 = Fr()  # Exponent for tracing signatures. \xi_2 \in_R Z^*_p
@@ -87,6 +115,8 @@ class RevocationManagerKey(
     xi1: Fr  # Revocation manager's share of ξ₁
     xi2: Fr  # Revocation manager's share of ξ₂
 
+    __slots__ = ("xi1", "xi2")
+
     def __init__(self) -> None:
         self.xi1 = Fr()  # ξ₁_rev = ξ₁ - ξ₁_group (additive share)
         self.xi2 = Fr()  # ξ₂_rev = ξ₂ - ξ₂_group (additive share)
@@ -103,6 +133,8 @@ class MemberKey(
     t: Fr
     A: G1
 
+    __slots__ = ("x", "t", "A")  # noqa: RUF023 (wire order)
+
     def __init__(self) -> None:
         self.x = Fr()  # x \in_R Z^*_p (non-adaptively chosen by member)
         self.t = Fr()  # t \in_R Z^*_p (chosen by manager)
@@ -130,6 +162,21 @@ class Signature(
     sx: Fr
     st: Fr
 
+    __slots__ = (  # noqa: RUF023 (wire order)
+        "T1",
+        "T2",
+        "T3",
+        "T4",
+        "T5",
+        "c",
+        "sr1",
+        "sr2",
+        "sd1",
+        "sd2",
+        "sx",
+        "st",
+    )
+
     def __init__(self) -> None:
         self.T1 = G1()
         self.T2 = G1()
@@ -145,6 +192,29 @@ class Signature(
         self.st = Fr()
 
 
+class Presignature:
+    """Message independent part of a signature, see OfflineSigner"""
+
+    sig: Signature  # T1-T5 set
+    commitments: bytes  # T1-T5 and B1-B6 serialized, as hashed in sign
+    secrets: tuple[Fr, Fr, Fr, Fr]  # r1, r2, d1, d2
+    blinds: tuple[Fr, Fr, Fr, Fr, Fr, Fr]  # br1, br2, bd1, bd2, bx, bt
+
+    __slots__ = ("blinds", "commitments", "secrets", "sig")
+
+    def __init__(
+        self,
+        sig: Signature,
+        commitments: bytes,
+        secrets: tuple[Fr, Fr, Fr, Fr],
+        blinds: tuple[Fr, Fr, Fr, Fr, Fr, Fr],
+    ) -> None:
+        self.sig = sig
+        self.commitments = commitments
+        self.secrets = secrets
+        self.blinds = blinds
+
+
 class Group(
     JoinMixin, ReprMixin, MetadataMixin, Scheme[GroupKey, ManagerKey, MemberKey]
 ):
@@ -161,8 +231,14 @@ class Group(
         self.manager_key = ManagerKey()
         self._g1 = G1.from_generator()
         self._g2 = G2.from_generator()
+        self._g2.precompute()
+        self._g1.fixed_base(FixedBaseTable.LAZY_USES)
+        self._g2.fixed_base(FixedBaseTable.LAZY_USES)
         self.gml = GML()
         self.crl = CRL()
+        ## verify_and_trace verdicts, keyed by group key, message,
+        ## signature and the CRL version
+        self.verdict_cache = LRUCache()
 
     def setup(self) -> None:
         # \xi_1 \in_R Z^*_p
@@ -203,6 +279,9 @@ class Group(
         # e5 = e(q,g2)
         self.group_key.e5.set_object(GT.pairing(self.group_key.q, self._g2))
 
+        ## Pairing tables of the fixed G2 operands
+        self.group_key.precompute()
+
     def join_mgr(self, message: dict[str, Any] | None = None) -> dict[str, Any]:
         ret = {"status": "error"}
         if message is None:
@@ -286,13 +365,7 @@ class Group(
             r = Fr.from_random()
 
             # I = yG1 + rQ
-            e = (G1 * 2)()
-            e[0].set_object(self._g1)
-            e[1].set_object(self.group_key.q)
-            s = (Fr * 2)()
-            s[0].set_object(y)
-            s[1].set_object(r)
-            I_ = G1.muln(e, s)
+            I_ = G1.muln([self._g1, self.group_key.q], [y, r])
 
             ## memkey->x = u*memkey->y + v
             member_key.x.set_object((u * y) + v)
@@ -330,9 +403,9 @@ class Group(
             aux_g2 = (self._g2 * t_) + self.group_key.r
             aux_g1 = (self._g1 * member_key.x) + self.group_key.q
 
-            aux_gt1 = GT.pairing(A_, aux_g2)
-            aux_gt2 = GT.pairing(aux_g1, self._g2)
-            if aux_gt1 == aux_gt2:
+            ## e(A_,aux_g2) == e(aux_g1,g2) <=> e(A_,aux_g2)*e(-aux_g1,g2) == 1
+            aux_gt = GT.multi_pairing([A_, -aux_g1], [aux_g2, self._g2])
+            if aux_gt.is_one():
                 ## All good: transfer all data to memkey
                 member_key.t.set_object(t_)
                 member_key.A.set_object(A_)
@@ -340,7 +413,7 @@ class Group(
             else:
                 ret["status"] = "fail"
                 ret["message"] = "Invalid message content"
-                self._logger.debug("aux_gt1 != aux_gt2")
+                self._logger.debug("e(A_,aux_g2) != e(aux_g1,g2)")
         else:
             ret["message"] = (
                 f"Phase not supported for {self.__class__.__name__}{self._name.upper()}"
@@ -349,8 +422,12 @@ class Group(
         return ret
 
     def sign(self, message: str, member_key: MemberKey) -> dict[str, Any]:
-        message = str(message)
+        return self._sign_presigned(
+            str(message), member_key, self._presign(member_key)
+        )
 
+    def _presign(self, member_key: MemberKey) -> Presignature:
+        """Message independent part of sign(): T1-T5, B1-B6 and nonces"""
         # r1,r2,r3 \in_R Z_p
         r1 = Fr.from_random()
         r2 = Fr.from_random()
@@ -360,18 +437,20 @@ class Group(
         # d2 = t*r2
         d2 = member_key.t * r2
 
+        ## Results are written straight into the signature fields and the
+        ## temporaries are updated in place to avoid allocating new elements
         sig = Signature()
         # T1 = X*r1
-        sig.T1.set_object(self.group_key.x * r1)
+        self.group_key.x.mul(r1, out=sig.T1)
         # T2 = Y*r2
-        sig.T2.set_object(self.group_key.y * r2)
+        self.group_key.y.mul(r2, out=sig.T2)
         # T3 = A + Z*(r1+r2)
-        sig.T3.set_object(member_key.A + (self.group_key.z * (r1 + r2)))
+        self.group_key.z.mul(r1 + r2, out=sig.T3).iadd(member_key.A)
         # T4 = W*r3
-        sig.T4.set_object(self.group_key.w * r3)
+        self.group_key.w.mul(r3, out=sig.T4)
         ## e(...) precalculated in setup
         # T5 = e(g1, T4)**x = e(g1, W)**(r3*x)
-        sig.T5.set_object(self.group_key.e1 ** (r3 * member_key.x))
+        self.group_key.e1.pow(r3 * member_key.x, out=sig.T5)
 
         # br1, br2,bd1,bd2,bt,bx \in_R Z_p
         br1 = Fr.from_random()
@@ -386,94 +465,99 @@ class Group(
         # B2 = Y*br2
         B2 = self.group_key.y * br2
         # B3 = T1*bt - X*bd1
-        B3 = (sig.T1 * bt) - (self.group_key.x * bd1)
+        B3 = G1.muln([sig.T1, self.group_key.x], [bt, -bd1])
         # B4 = T2*bt - Y*bd2
-        B4 = (sig.T2 * bt) - (self.group_key.y * bd2)
-        # B5 = e(g1,T4)^bx
-        B5 = GT.pairing(self._g1, sig.T4) ** bx
+        B4 = G1.muln([sig.T2, self.group_key.y], [bt, -bd2])
+        # B5 = e(g1,T4)^bx = e(g1,W)^(r3*bx), no pairing needed
+        B5 = self.group_key.e1.pow(r3.imul(bx))
         # B6 = e(T3,g2)^bt * e(z,g2)^(-bd1-bd2) * e(z,r)^(-br1-br2) * e(g1,g2)^(-bx)
-        B6 = GT.pairing(sig.T3, self._g2) ** bt
-
-        ## aux_e: the rest (with the help of the optimizations is easier...)
-        e = (GT * 3)()
-        e[0].set_object(self.group_key.e2)
-        e[1].set_object(self.group_key.e3)
-        e[2].set_object(self.group_key.e4)
-        s = (Fr * 3)()
-        s[0].set_object((-bd1) - bd2)
-        s[1].set_object((-br1) - br2)
-        s[2].set_object(-bx)
-        aux_e = GT.pown(e, s)
-        B6 = B6 * aux_e
+        ## Only e(T3,g2) needs a pairing (with the help of the optimizations
+        ## the rest are precomputed)
+        B6 = GT.pown(
+            [
+                GT.pairing(sig.T3, self._g2),
+                self.group_key.e2,
+                self.group_key.e3,
+                self.group_key.e4,
+            ],
+            [bt, (-bd1).isub(bd2), (-br1).isub(br2), -bx],
+        )
+
+        ## Everything hashed after the message, in order
+        commitments = b"".join(
+            el.to_bytes()
+            for el in (sig.T1, sig.T2, sig.T3, sig.T4, sig.T5)
+            + (B1, B2, B3, B4, B5, B6)
+        )
+        return Presignature(
+            sig, commitments, (r1, r2, d1, d2), (br1, br2, bd1, bd2, bx, bt)
+        )
+
+    def _sign_presigned(
+        self, message: str, member_key: MemberKey, pre: Presignature
+    ) -> dict[str, Any]:
+        """Online part of sign(): challenge and responses"""
+        sig = pre.sig
+        r1, r2, d1, d2 = pre.secrets
+        br1, br2, bd1, bd2, bx, bt = pre.blinds
 
         # c = hash(M,T1,T2,T3,T4,T5,B1,B2,B3,B4,B5,B6) \in Zp
         h = hashlib.sha256()
         h.update(message.encode())
-        h.update(sig.T1.to_bytes())
-        h.update(sig.T2.to_bytes())
-        h.update(sig.T3.to_bytes())
-        h.update(sig.T4.to_bytes())
-        h.update(sig.T5.to_bytes())
-        h.update(B1.to_bytes())
-        h.update(B2.to_bytes())
-        h.update(B3.to_bytes())
-        h.update(B4.to_bytes())
-        h.update(B5.to_bytes())
-        h.update(B6.to_bytes())
+        h.update(pre.commitments)
         sig.c.set_hash(h.digest())
 
         # sr1 = br1 + c*r1
-        sig.sr1.set_object(br1 + (sig.c * r1))
+        sig.c.mul(r1, out=sig.sr1).iadd(br1)
         # sr2 = br2 + c*r2
-        sig.sr2.set_object(br2 + (sig.c * r2))
+        sig.c.mul(r2, out=sig.sr2).iadd(br2)
         # sd1 = bd1 + c*d1
-        sig.sd1.set_object(bd1 + (sig.c * d1))
+        sig.c.mul(d1, out=sig.sd1).iadd(bd1)
         # sd2 = bd2 + c*d2
-        sig.sd2.set_object(bd2 + (sig.c * d2))
+        sig.c.mul(d2, out=sig.sd2).iadd(bd2)
         # sx = bx + c*x
-        sig.sx.set_object(bx + (sig.c * member_key.x))
+        sig.c.mul(member_key.x, out=sig.sx).iadd(bx)
         # st = bt + c*t
-        sig.st.set_object(bt + (sig.c * member_key.t))
+        sig.c.mul(member_key.t, out=sig.st).iadd(bt)
         return {
             "status": "success",
             "signature": sig.to_b64(),
         }
 
-    def verify(self, message: str, signature: str) -> dict[str, Any]:
-        message = str(message)
-        ret = {"status": "fail"}
-        sig = Signature.from_b64(signature)
-
+    def _challenge(self, message: str, sig: Signature) -> Fr:
+        """Recompute the hash-challenge c of a signature"""
         ## Re-derive B1, B2, B3, B4, B5 and B6 from the signature
+        neg_c = -sig.c
         # B1 = X*sr1 - T1*c
-        B1 = (self.group_key.x * sig.sr1) - (sig.T1 * sig.c)
+        B1 = G1.muln([self.group_key.x, sig.T1], [sig.sr1, neg_c])
         # B2 = X*sr2 - T2*c
-        B2 = (self.group_key.y * sig.sr2) - (sig.T2 * sig.c)
+        B2 = G1.muln([self.group_key.y, sig.T2], [sig.sr2, neg_c])
         # B3 = T1*st - X*sd1
-        B3 = (sig.T1 * sig.st) - (self.group_key.x * sig.sd1)
+        B3 = G1.muln([sig.T1, self.group_key.x], [sig.st, -sig.sd1])
         # B4 = T2*st - Y*sd2
-        B4 = (sig.T2 * sig.st) - (self.group_key.y * sig.sd2)
+        B4 = G1.muln([sig.T2, self.group_key.y], [sig.st, -sig.sd2])
         # B5 = e(g1,T4)**sx * T5**-c
-        B5 = ((GT.pairing(self._g1, sig.T4)) ** sig.sx) * ~(sig.T5**sig.c)
+        ## Optimized B5 = e(g1*sx,T4) * T5**-c, a G1 multiplication is
+        ## cheaper than a GT exponentiation
+        B5 = GT.pairing(self._g1 * sig.sx, sig.T4).imul(sig.T5**neg_c)
         # B6 = e(T3,g2)^st * e(z,g2)^(-sd1-sd2) * e(z,r)^(-sr1-sr2) * e(g1,g2)^(-sx) * ( e(T3,r)/e(q,g2) )^c
-        # aux_e = e(z,g2)^(-sd1-sd2) * e(z,r)^(-sr1-sr2) * e(g1,g2)^(-sx)
-        e = (GT * 3)()
-        e[0].set_object(self.group_key.e2)
-        e[1].set_object(self.group_key.e3)
-        e[2].set_object(self.group_key.e4)
-        s = (Fr * 3)()
-        s[0].set_object((-sig.sd1) - sig.sd2)
-        s[1].set_object((-sig.sr1) - sig.sr2)
-        s[2].set_object(-sig.sx)
-        aux_e = GT.pown(e, s)
-
-        # aux_GT = (e(T3,r) / e(q,g2))**c
-        aux_GT = (
-            (GT.pairing(sig.T3, self.group_key.r)) / self.group_key.e5
-        ) ** sig.c
-
-        # B6 = e(T3,g2)^st * aux_e * aux_GT
-        B6 = (GT.pairing(sig.T3, self._g2)) ** sig.st * aux_e * aux_GT
+        ## Optimized by moving the exponents into the G1 arguments:
+        ## B6 = e(T3*st + z*(-sd1-sd2) + g1*(-sx) + q*(-c), g2)
+        ##      * e(T3*c + z*(-sr1-sr2), r)
+        ## i.e. a single multi-pairing with precomputed g2 and r
+        B6 = GT.multi_pairing(
+            [
+                G1.muln(
+                    [sig.T3, self.group_key.z, self._g1, self.group_key.q],
+                    [sig.st, (-sig.sd1).isub(sig.sd2), -sig.sx, neg_c],
+                ),
+                G1.muln(
+                    [sig.T3, self.group_key.z],
+                    [sig.c, (-sig.sr1).isub(sig.sr2)],
+                ),
+            ],
+            [self._g2, self.group_key.r],
+        )
 
         ## Recompute the hash-challenge c
         h = hashlib.sha256()
@@ -489,19 +573,59 @@ class Group(
         h.update(B4.to_bytes())
         h.update(B5.to_bytes())
         h.update(B6.to_bytes())
-        c = Fr.from_hash(h.digest())
+        return Fr.from_hash(h.digest())
+
+    def verify(self, message: str, signature: str) -> dict[str, Any]:
+        message = str(message)
+        ret = {"status": "fail"}
+        sig = signature_cache.get(Signature, signature)
 
         ## Compare the result with the received challenge
-        if c == sig.c:
+        if self._challenge(message, sig) == sig.c:
             ret["status"] = "success"
         else:
             ret["message"] = "Invalid signature"
             self._logger.debug("c != sig.c")
         return ret
 
+    def verify_batch(
+        self, messages: list[str], signatures: list[str]
+    ) -> dict[str, Any]:
+        """Verify many (message, signature) pairs.
+
+        The challenge of each signature is a hash over B5 and B6, so
+        these are recomputed exactly per signature (there is no pairing
+        equation to combine across the batch). The indexes of the
+        invalid (or malformed) signatures are returned in "failed"
+        """
+        ret = {"status": "error"}
+        if len(messages) != len(signatures):
+            ret["message"] = (
+                f"Got {len(messages)} messages and {len(signatures)} signatures"
+            )
+            self._logger.error(ret["message"])
+            return ret
+        failed = []
+        for idx, (message, signature) in enumerate(zip(messages, signatures)):
+            try:
+                sig = signature_cache.get(Signature, signature)
+            except (TypeError, ValueError):
+                failed.append(idx)
+                continue
+            if self._challenge(str(message), sig) != sig.c:
+                failed.append(idx)
+        if failed:
+            ret["status"] = "fail"
+            ret["message"] = "Invalid signature"
+            ret["failed"] = failed
+            self._logger.debug(f"c != sig.c for {len(failed)} signatures")
+        else:
+            ret["status"] = "success"
+        return ret
+
     def open(self, signature: str,group_manager_partial: dict[str, Any] = None, revocation_manager_partial: dict[str, Any] = None) -> dict[str, Any]:
         ret = {"status": "fail"}
-        sig = Signature.from_b64(signature)
+        sig = signature_cache.get(Signature, signature)
         ## Recover the signer's A as: A = T3-(T1*xi1 + T2*xi2)
         # A = T1*xi1 + T2*xi2 =
         if group_manager_partial is None:
@@ -522,19 +646,12 @@ class Group(
             xi1_total = group_manager_partial["T1_xi"] + revocation_manager_partial["T1_xi"]
             xi2_total = group_manager_partial["T2_xi"] + revocation_manager_partial["T2_xi"]
 
-            e = (G1 * 2)()
-            e[0].set_object(sig.T1)
-            e[1].set_object(sig.T2)
-            s = (Fr * 2)()
-            s[0].set_object(xi1_total)
-            s[1].set_object(xi2_total)
-            A = G1.muln(e, s)
-            A = sig.T3 - A
-
-        # Lookup A in GML
-            for mem_id, (open_trap, _) in self.gml.items():
-                if A == open_trap:
-                    return {"status": "success", "id": mem_id}
+            A = sig.T3 - G1.muln([sig.T1, sig.T2], [xi1_total, xi2_total])
+
+        # Lookup A in GML (indexed by the serialized A)
+            mem_id = self.gml.lookup(A)
+            if mem_id is not None:
+                return {"status": "success", "id": mem_id}
             return {"status": "fail"}
             
 
@@ -545,15 +662,131 @@ class Group(
             self.crl[member_id] = self.gml[member_id]
         return ret
 
-    def trace(self, signature: str) -> dict[str, Any]:
+    def _revoked(self, sig: Signature, workers: int | None = None) -> bool:
+        """Whether the signer is in the CRL, i.e. e(trace_trap,T4) == T5
+        for one of its entries
+        """
+        trace_traps = [trace_trap for _, trace_trap in self.crl.values()]
+        if not trace_traps:
+            return False
+        ## All the pairings share T4, so its Miller loop lines are computed
+        ## once (on a copy, cached signatures are shared)
+        T4 = G2.from_object(sig.T4)
+        if len(trace_traps) > 1:
+            T4.precompute()
+        return (
+            parallel_find(
+                trace_traps,
+                lambda trace_trap: GT.pairing(trace_trap, T4) == sig.T5,
+                workers,
+            )
+            >= 0
+        )
+
+    def trace(
+        self, signature: str, workers: int | None = None
+    ) -> dict[str, Any]:
         ret = {"status": "fail"}
-        sig = Signature.from_b64(signature)
-        for _, (_, trace_trap) in self.crl.items():
-            e = GT.pairing(trace_trap, sig.T4)
-            if e == sig.T5:
-                ret["status"] = "success"
-                ret["revoked"] = True  # type: ignore
-                break
+        sig = signature_cache.get(Signature, signature)
+        if self._revoked(sig, workers):
+            ret["status"] = "success"
+            ret["revoked"] = True  # type: ignore
+        return ret
+
+    def verify_and_trace(
+        self, message: str, signature: str, workers: int | None = None
+    ) -> dict[str, Any]:
+        """Verify a signature and check that its signer is not revoked.
+
+        Succeeds (with "revoked": False) only for valid signatures of non
+        revoked members, revoked signers fail with "revoked": True. The
+        CRL entries are checked in parallel, see parallel_find(). Verdicts
+        are cached until the CRL changes
+        """
+        message = str(message)
+        k = self._verdict_key(message, signature)
+        hit, ret = self.verdict_cache.lookup(k)
+        if hit:
+            return dict(ret)
+        ret = self._trace_verified(
+            self.verify(message, signature), signature, workers
+        )
+        if k[1] is not None:
+            self.verdict_cache.store(k, dict(ret))
+        return ret
+
+    def verify_and_trace_batch(
+        self,
+        messages: list[str],
+        signatures: list[str],
+        workers: int | None = None,
+    ) -> list[dict[str, Any]]:
+        """verify_and_trace() for many (message, signature) pairs.
+
+        Cached verdicts are reused, the other signatures are verified with
+        one verify_batch() call. Returns one verify_and_trace() result
+        per signature
+        """
+        if len(messages) != len(signatures):
+            raise ValueError(
+                f"Got {len(messages)} messages and {len(signatures)} signatures"
+            )
+        messages = [str(m) for m in messages]
+        keys = [self._verdict_key(m, s) for m, s in zip(messages, signatures)]
+        ret: list[dict[str, Any]] = []
+        todo = []
+        for idx, k in enumerate(keys):
+            hit, verdict = self.verdict_cache.lookup(k)
+            ret.append(dict(verdict) if hit else {})
+            if not hit:
+                todo.append(idx)
+        if not todo:
+            return ret
+        batch = self.verify_batch(
+            [messages[i] for i in todo], [signatures[i] for i in todo]
+        )
+        failed = set(batch.get("failed", ()))
+        for j, idx in enumerate(todo):
+            if j in failed:
+                verdict = {"status": "fail", "message": "Invalid signature"}
+            else:
+                verdict = {"status": "success"}
+            ret[idx] = self._trace_verified(verdict, signatures[idx], workers)
+            if keys[idx][1] is not None:
+                self.verdict_cache.store(keys[idx], dict(ret[idx]))
+        return ret
+
+    def _verdict_key(self, message: str, signature: str) -> tuple:
+        """verdict_cache key: digest of the group key, message and
+        signature, CRL version. Verdicts of a previous group key (setup()
+        or a replaced group_key) are not reused
+        """
+        h = hashlib.sha256()
+        for v in fields(self.group_key).values():
+            h.update(bytes(v))
+        h.update(b"\x00")
+        h.update(message.encode())
+        h.update(b"\x00")
+        if isinstance(signature, str):
+            h.update(signature.encode())
+        else:
+            h.update(signature)
+        return h.digest(), getattr(self.crl, "version", None)
+
+    def _trace_verified(
+        self, ret: dict[str, Any], signature: str, workers: int | None
+    ) -> dict[str, Any]:
+        """Turn a successful verification of a revoked signer into a failure"""
+        if ret["status"] == "success":
+            sig = signature_cache.get(Signature, signature)
+            if self._revoked(sig, workers):
+                ret = {
+                    "status": "fail",
+                    "message": "Revoked signer",
+                    "revoked": True,
+                }
+            else:
+                ret["revoked"] = False
         return ret
 
     def prove_equality(
@@ -572,7 +805,7 @@ class Group(
 
         ## (1) Raise e(g1,T4) of each received signature to r, and put it into the hash
         for s in signatures:
-            sig = Signature.from_b64(s)
+            sig = signature_cache.get(Signature, s)
             e = GT.pairing(self._g1, sig.T4)
             er = e**r
             ## Put the i-th e(g1,T4)^r element of the array
@@ -603,7 +836,7 @@ class Group(
         ## we divide e(g1,T4)^s/T5^c
         proof_ = spk.NizkProof.from_b64(proof)
         for s in signatures:
-            sig = Signature.from_b64(s)
+            sig = signature_cache.get(Signature, s)
             e = GT.pairing(self._g1, sig.T4)
             es = (e**proof_.s) / (sig.T5**proof_.c)
             ## Put the i-th element of the array
@@ -633,3 +866,138 @@ class Group(
         ## A claim verification is just similar to proving "equality verification" of N sigature, but just
         ## for 1 signature
         return self.prove_equality_verify([signature], proof)
+
+
+class OfflineSigner:
+    """Offline/online signer for one member key.
+
+    Keeps a pool of up to size presignatures (everything in sign() that
+    does not depend on the message). A background thread tops the pool up
+    to size whenever it drops to watermark, so sign() only has to hash the
+    message and compute the responses. When the pool is empty, sign()
+    computes a full signature and counts a miss.
+
+    Usage:
+        with OfflineSigner(group, member_key) as signer:
+            signer.sign(message)
+    """
+
+    _logger = logging.getLogger(__name__)
+
+    def __init__(
+        self,
+        group: Group,
+        member_key: MemberKey,
+        size: int = 64,
+        watermark: int = 16,
+    ) -> None:
+        if not 0 <= watermark < size:
+            raise ValueError(
+                f"Expected 0 <= watermark < size, got {watermark}, {size}"
+            )
+        self.group = group
+        self.member_key = member_key
+        self.size = size
+        self.watermark = watermark
+        self.hits = 0
+        self.misses = 0
+        self._pool: deque[Presignature] = deque()
+        self._cond = threading.Condition()
+        self._thread: threading.Thread | None = None
+        self._running = False
+
+    def __enter__(self) -> "OfflineSigner":
+        self.start()
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        self.stop()
+
+    def __len__(self) -> int:
+        return len(self._pool)
+
+    def start(self) -> None:
+        """Start the background refill thread"""
+        with self._cond:
+            if self._running:
+                return
+            self._running = True
+        self._thread = threading.Thread(
+            target=self._refill, name="cpy06-presign", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the background refill thread, keeping the pool"""
+        with self._cond:
+            self._running = False
+            self._cond.notify_all()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def fill(self) -> None:
+        """Top the pool up to size in the calling thread"""
+        while True:
+            with self._cond:
+                if len(self._pool) >= self.size:
+                    return
+            pre = self.group._presign(self.member_key)
+            ## The refill thread may have topped the pool up meanwhile
+            with self._cond:
+                if len(self._pool) >= self.size:
+                    return
+                self._pool.append(pre)
+
+    def stats(self) -> dict[str, int]:
+        with self._cond:
+            return {
+                "size": self.size,
+                "watermark": self.watermark,
+                "available": len(self._pool),
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+    def sign(self, message: str) -> dict[str, Any]:
+        with self._cond:
+            if self._pool:
+                pre = self._pool.popleft()
+                self.hits += 1
+            else:
+                pre = None
+                self.misses += 1
+            if len(self._pool) <= self.watermark:
+                self._cond.notify()
+        if pre is None:
+            pre = self.group._presign(self.member_key)
+        return self.group._sign_presigned(str(message), self.member_key, pre)
+
+    def _refill(self) -> None:
+        while True:
+            with self._cond:
+                self._cond.wait_for(
+                    lambda: not self._running
+                    or len(self._pool) <= self.watermark
+                )
+                if not self._running:
+                    return
+            ## Presignatures are computed outside the lock, sign() keeps
+            ## consuming the pool meanwhile
+            while True:
+                try:
+                    pre = self.group._presign(self.member_key)
+                except Exception:
+                    self._logger.exception("Presignature failed")
+                    with self._cond:
+                        self._running = False
+                    return
+                with self._cond:
+                    if not self._running:
+                        return
+                    ## fill() may have topped the pool up meanwhile
+                    if len(self._pool) < self.size:
+                        self._pool.append(pre)
+                    self._cond.notify_all()
+                    if len(self._pool) >= self.size:
+                        break
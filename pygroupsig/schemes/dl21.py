@@ -1,6 +1,7 @@
+import functools
 import hashlib
 import logging
-from typing import Any, Generic, Type, TypeVar
+from typing import Any, Callable, Generic, Iterable, Sequence, Type, TypeVar
 
 import pygroupsig.utils.spk as spk
 from pygroupsig.interfaces import Container, Scheme
@@ -12,16 +13,33 @@ from pygroupsig.utils.helpers import (
     MetadataManagerKeyMixin,
     MetadataMemberKeyMixin,
     MetadataSignatureMixin,
+    PrecomputeMixin,
     ReprMixin,
+    signature_cache,
 )
 from pygroupsig.utils.mcl import G1, G2, GT, Fr
 
 
 class MetadataMixin:
+    __slots__ = ()
     _name = "dl21"
 
 
+## Signatures verified together by link() and link_verify()
+LINK_CHUNK = 256
+
+
+@functools.lru_cache(maxsize=1024)
+def hash_scope(scope: str) -> G1:
+    """Hash(scp), cached since every signature of a scope uses the same
+    point. It is shared: use it as an operand, do not modify it
+    """
+    h = hashlib.sha256(scope.encode())
+    return G1.from_hash(h.digest())
+
+
 class GroupKey(
+    PrecomputeMixin,
     B64Mixin,
     InfoMixin,
     ReprMixin,
@@ -35,6 +53,11 @@ class GroupKey(
     h2: G1
     ipk: G2
 
+    _precompute = ("g2", "ipk")
+    _fixed_base = ("g1", "h1", "h2")
+
+    __slots__ = ("g1", "g2", "h1", "h2", "ipk")
+
     def __init__(self) -> None:
         self.g1 = G1()  # Params. Random generator of G1
         self.g2 = G2()  # Params. Random generator of G2
@@ -53,6 +76,8 @@ class ManagerKey(
 ):
     isk: Fr
 
+    __slots__ = ("isk",)
+
     def __init__(self) -> None:
         self.isk = Fr()  # Issuer secret key
 
@@ -72,6 +97,8 @@ class MemberKey(
     H: G1
     h2s: G1
 
+    __slots__ = ("A", "x", "y", "s", "H", "h2s")  # noqa: RUF023 (wire order)
+
     def __init__(self) -> None:
         self.A = G1()  # A = (H*h2^s*g1)^(1/isk+x)
         self.x = Fr()  # Randomly picked by the Issuer
@@ -95,6 +122,8 @@ class Signature(
     pi: spk.GeneralRepresentationProof
     nym: G1
 
+    __slots__ = ("AA", "A_", "d", "pi", "nym")  # noqa: RUF023 (wire order)
+
     def __init__(self) -> None:
         self.AA = G1()
         self.A_ = G1()
@@ -135,6 +164,9 @@ class Group(
         ## Set the Issuer public key
         self.group_key.ipk.set_object(self.group_key.g2 * self.manager_key.isk)
 
+        ## Pairing tables of the fixed G2 operands
+        self.group_key.precompute()
+
     def join_mgr(self, message: dict[str, Any] | None = None) -> dict[str, Any]:
         ret = {"status": "error"}
         if message is None:
@@ -232,14 +264,14 @@ class Group(
             ## it must not be 0)
             if not member_key.A.is_zero():
                 # Check correctness: e(v,gg) = e(u,XX)e(w,YY)
-                e1 = (
-                    GT.pairing(member_key.A, self.group_key.g2)
-                ) ** member_key.x
-                e2 = GT.pairing(member_key.A, self.group_key.ipk)
-                e4 = e1 * e2
+                ## e(A,g2)^x * e(A,ipk) == e(aux,g2)
+                ## <=> e(A*x - aux,g2) * e(A,ipk) == 1
                 aux = (member_key.h2s + member_key.H) + self.group_key.g1
-                e3 = GT.pairing(aux, self.group_key.g2)
-                if e4 == e3:
+                e = GT.multi_pairing(
+                    [(member_key.A * member_key.x).isub(aux), member_key.A],
+                    [self.group_key.g2, self.group_key.ipk],
+                )
+                if e.is_one():
                     ret["status"] = "success"
                 else:
                     ret["status"] = "fail"
@@ -278,8 +310,7 @@ class Group(
 
         sig = self._scheme_signature()
         # nym = Hash(scp)*y
-        h = hashlib.sha256(scope.encode())
-        hscp = G1.from_hash(h.digest())
+        hscp = hash_scope(scope)
         sig.nym.set_object(hscp * member_key.y)
 
         # AA = A*r1
@@ -328,33 +359,17 @@ class Group(
         message = str(message)
         scope = str(scope)
         ret = {"status": "fail"}
-        sig = self._scheme_signature.from_b64(signature)
+        sig = signature_cache.get(self._scheme_signature, signature)
         ## AA must not be 1 (since we use additive notation for G1,
         ## it must not be 0)
         if not sig.AA.is_zero():
-            ## e(AA,ipk) must equal e(A_,g2)
-            e1 = GT.pairing(sig.AA, self.group_key.ipk)
-            e2 = GT.pairing(sig.A_, self.group_key.g2)
-            if e1 == e2:
-                ## Recompute hscp
-                h = hashlib.sha256(scope.encode())
-                hscp = G1.from_hash(h.digest())
-                A_d = sig.A_ - sig.d
-                y = [sig.nym, A_d, self.group_key.g1]
-                g = [hscp, sig.AA, self.group_key.h2, sig.d, self.group_key.h1]
-                i = [
-                    (1, 0),  # hscp^y = (g[0],x[1])
-                    (0, 1),  # AA^-x = (g[1],x[0])
-                    (2, 2),  # h2^r2 = (g[2],x[2])
-                    (3, 3),  # d^r3 = (g[3],x[3])
-                    (4, 2),  # h2^-ss = (g[2],x[4])
-                    (5, 4),  # h1^-y = (g[4],x[5])
-                ]
-                prods = [1, 2, 3]
+            ## e(AA,ipk) must equal e(A_,g2), i.e. e(AA,ipk)*e(-A_,g2) == 1
+            e = GT.multi_pairing(
+                [sig.AA, -sig.A_], [self.group_key.ipk, self.group_key.g2]
+            )
+            if e.is_one():
                 ## Verify SPK
-                if spk.general_representation_verify(
-                    y, g, i, prods, sig.pi, message
-                ):
+                if self._verify_spk(message, sig, hash_scope(scope)):
                     ret["status"] = "success"
                 else:
                     ret["message"] = "Invalid signature"
@@ -367,18 +382,143 @@ class Group(
             self._logger.debug("AA is zero")
         return ret
 
+    def _verify_spk(self, message: str, sig: SignatureT, hscp: G1) -> bool:
+        A_d = sig.A_ - sig.d
+        y = [sig.nym, A_d, self.group_key.g1]
+        g = [hscp, sig.AA, self.group_key.h2, sig.d, self.group_key.h1]
+        i = [
+            (1, 0),  # hscp^y = (g[0],x[1])
+            (0, 1),  # AA^-x = (g[1],x[0])
+            (2, 2),  # h2^r2 = (g[2],x[2])
+            (3, 3),  # d^r3 = (g[3],x[3])
+            (4, 2),  # h2^-ss = (g[2],x[4])
+            (5, 4),  # h1^-y = (g[4],x[5])
+        ]
+        prods = [1, 2, 3]
+        return spk.general_representation_verify(
+            y, g, i, prods, sig.pi, message
+        )
+
+    def _failed(
+        self, messages: Sequence[str], sigs: Sequence[SignatureT], scope: str
+    ) -> set[int]:
+        """Indexes of the invalid signatures, see verify_batch()"""
+        ## AA must not be 0
+        failed = {idx for idx, sig in enumerate(sigs) if sig.AA.is_zero()}
+        batch = [idx for idx in range(len(sigs)) if idx not in failed]
+        if batch:
+            r = [Fr.from_random() for _ in batch]
+            AA = G1.muln([sigs[idx].AA for idx in batch], r)
+            A_ = G1.muln([sigs[idx].A_ for idx in batch], r)
+            e = GT.multi_pairing(
+                [AA, -A_], [self.group_key.ipk, self.group_key.g2]
+            )
+            if not e.is_one():
+                self._logger.debug("Batched e1 != e2")
+                for idx in batch:
+                    sig = sigs[idx]
+                    e = GT.multi_pairing(
+                        [sig.AA, -sig.A_],
+                        [self.group_key.ipk, self.group_key.g2],
+                    )
+                    if not e.is_one():
+                        failed.add(idx)
+        hscp = hash_scope(scope)
+        for idx, (message, sig) in enumerate(zip(messages, sigs)):
+            if idx not in failed and not self._verify_spk(
+                str(message), sig, hscp
+            ):
+                failed.add(idx)
+        return failed
+
+    def verify_batch(
+        self, messages: list[str], signatures: list[str], scope: str = "def"
+    ) -> dict[str, Any]:
+        """Verify many (message, signature) pairs of a scope.
+
+        The pairing equations e(AA,ipk) == e(A_,g2) are combined with
+        random weights r into e(sum r*AA, ipk) == e(sum r*A_, g2), i.e.
+        two multi-scalar multiplications and a single pairing product
+        for the whole batch. Only if that fails are they checked one by
+        one. The SPKs are verified per signature. The indexes of the
+        invalid (or malformed) signatures are returned in "failed"
+        """
+        scope = str(scope)
+        ret = {"status": "error"}
+        if len(messages) != len(signatures):
+            ret["message"] = (
+                f"Got {len(messages)} messages and {len(signatures)} signatures"
+            )
+            self._logger.error(ret["message"])
+            return ret
+        ## Malformed signatures fail on their own, the rest are batched
+        failed = set()
+        decoded = []
+        for idx, s in enumerate(signatures):
+            try:
+                sig = signature_cache.get(self._scheme_signature, s)
+            except (TypeError, ValueError):
+                failed.add(idx)
+                continue
+            decoded.append((idx, sig))
+        failed.update(
+            decoded[i][0]
+            for i in self._failed(
+                [messages[idx] for idx, _ in decoded],
+                [sig for _, sig in decoded],
+                scope,
+            )
+        )
+        if failed:
+            ret["status"] = "fail"
+            ret["message"] = "Invalid signature"
+            ret["failed"] = sorted(failed)
+            self._logger.debug(f"{len(failed)} invalid signatures")
+        else:
+            ret["status"] = "success"
+        return ret
+
+    def _link_scan(
+        self,
+        pairs: Iterable[tuple[str, str]],
+        scope: str,
+        check: Callable[[int, SignatureT], bool] | None = None,
+    ) -> tuple[str | None, int, G1]:
+        """Single pass over (message, signature) pairs, stopping at the
+        first failure: check(index, signature) as each signature is read,
+        batch verification every LINK_CHUNK signatures and the sum of the
+        nyms. Returns the failure ("check", "verify" or None), the number
+        of signatures and the sum of their nyms
+        """
+        n = 0
+        nym = G1()
+        messages: list[str] = []
+        sigs: list[SignatureT] = []
+        for message, sig_b64 in pairs:
+            sig = signature_cache.get(self._scheme_signature, sig_b64)
+            if check is not None and not check(n, sig):
+                return "check", n, nym
+            nym.iadd(sig.nym)
+            n += 1
+            messages.append(str(message))
+            sigs.append(sig)
+            if len(sigs) == LINK_CHUNK:
+                if self._failed(messages, sigs, scope):
+                    return "verify", n, nym
+                messages, sigs = [], []
+        if sigs and self._failed(messages, sigs, scope):
+            return "verify", n, nym
+        return None, n, nym
+
     # noinspection PyUnresolvedReferences
     def identify(
         self, signature: str, member_key: MemberKey, scope: str = "def"
     ) -> dict[str, Any]:
         scope = str(scope)
         ret = {"status": "fail"}
-        sig = self._scheme_signature.from_b64(signature)
+        sig = signature_cache.get(self._scheme_signature, signature)
         ## Recompute nym
-        h = hashlib.sha256()
-        h.update(scope.encode())
-        hscp = G1.from_hash(h.digest())
-        nym = hscp * member_key.y
+        nym = hash_scope(scope) * member_key.y
         ## Check if nym = h(scp)*y
         if nym == sig.nym:
             ret["status"] = "success"
@@ -392,31 +532,35 @@ class Group(
         member_key: MemberKey,
         scope: str = "def",
     ) -> dict[str, Any]:
-        scope = str(scope)
+        return self._link(
+            message, zip(messages, signatures), member_key, str(scope)
+        )
+
+    def _link(
+        self,
+        message: str,
+        pairs: Iterable[tuple[str, str]],
+        member_key: MemberKey,
+        scope: str,
+        check: Callable[[int, SignatureT], bool] | None = None,
+    ) -> dict[str, Any]:
         ret = {"status": "fail"}
-        hscp = G1()
-        for msg, sig_b64 in zip(messages, signatures):
-            ## Verify signature
-            ver_msg = self.verify(msg, sig_b64, scope=scope)
-            ## Check if it is a signature issued by memkey
-            iden_msg = self.identify(sig_b64, member_key, scope=scope)
-            h = hashlib.sha256()
-            if (
-                ver_msg["status"] == "success"
-                and iden_msg["status"] == "success"
-            ):
-                h.update(scope.encode())
-                ## "Accumulate" scp
-                hscp += G1.from_hash(h.digest())
-            else:
-                if ver_msg["status"] != "success":
-                    ret["message1"] = "Invalid messages/signatures"
-                    self._logger.debug("Signature verify failed")
-                if iden_msg["status"] != "success":
-                    ret["message2"] = "Invalid messages/signatures"
-                    self._logger.debug("Signature identify failed")
-                break
+        ## Signatures issued by memkey have nym = Hash(scp)*y
+        nym = hash_scope(scope) * member_key.y
+
+        def identify(idx: int, sig: SignatureT) -> bool:
+            return sig.nym == nym and (check is None or check(idx, sig))
+
+        failure, n, _ = self._link_scan(pairs, scope, identify)
+        if failure == "verify":
+            ret["message1"] = "Invalid messages/signatures"
+            self._logger.debug("Signature verify failed")
+        elif failure == "check":
+            ret["message2"] = "Invalid messages/signatures"
+            self._logger.debug("Signature identify failed")
         else:
+            ## "Accumulate" scp: hscp = Hash(scp)*n
+            hscp = hash_scope(scope) * Fr.from_int(n)
             # nym_ = hscp * y
             nym = hscp * member_key.y
             ## Do the SPK
@@ -434,27 +578,32 @@ class Group(
         proof: str,
         scope: str = "def",
     ) -> dict[str, Any]:
-        scope = str(scope)
-        ret = {"status": "fail"}
         proof_ = spk.DiscreteLogProof.from_b64(proof)
-        hscp = G1()
-        nym = G1()
-        for msg, sig_b64 in zip(messages, signatures):
-            ver_msg = self.verify(msg, sig_b64)
-            if ver_msg["status"] == "success":
-                h = hashlib.sha256()
-                h.update(scope.encode())
-                ## "Accumulate" scp
-                hscp += G1.from_hash(h.digest())
-                ## "Accumulate" nym
-                sig = self._scheme_signature.from_b64(sig_b64)
-                nym += sig.nym
-            else:
-                ret["message"] = "Invalid messages/signatures"
-                self._logger.debug("Signature verify failed")
-                break
+        return self._link_verify(
+            message, zip(messages, signatures), proof_, str(scope)
+        )
+
+    def _link_verify(
+        self,
+        message: str,
+        pairs: Iterable[tuple[str, str]],
+        proof: spk.DiscreteLogProof,
+        scope: str,
+        check: Callable[[int, SignatureT], bool] | None = None,
+    ) -> dict[str, Any]:
+        ret = {"status": "fail"}
+        ## "Accumulate" nym while reading the signatures
+        failure, n, nym = self._link_scan(pairs, scope, check)
+        if failure == "verify":
+            ret["message"] = "Invalid messages/signatures"
+            self._logger.debug("Signature verify failed")
+        elif failure == "check":
+            ret["message"] = "Invalid signature sequence"
+            self._logger.debug("Signature check failed")
         else:
-            if spk.discrete_log_verify(nym, hscp, proof_, message):
+            ## "Accumulate" scp: hscp = Hash(scp)*n
+            hscp = hash_scope(scope) * Fr.from_int(n)
+            if spk.discrete_log_verify(nym, hscp, proof, message):
                 ret["status"] = "success"
             else:
                 ret["message"] = "Invalid proof"
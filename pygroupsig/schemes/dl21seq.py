@@ -1,7 +1,7 @@
 import hashlib
 import hmac
 import logging
-from typing import Any, Type, TypeVar
+from typing import Any, Iterable, Type, TypeVar
 
 import pygroupsig.utils.spk as spk
 from pygroupsig.interfaces import Container
@@ -10,10 +10,13 @@ from pygroupsig.schemes.dl21 import GroupKey as GroupKeyDL21
 from pygroupsig.schemes.dl21 import ManagerKey as ManagerKeyDL21
 from pygroupsig.schemes.dl21 import MemberKey as MemberKeyDL21
 from pygroupsig.schemes.dl21 import Signature as SignatureDL21
-from pygroupsig.utils.mcl import G1, GT, Fr
+from pygroupsig.schemes.dl21 import hash_scope
+from pygroupsig.utils.helpers import fields, signature_cache
+from pygroupsig.utils.mcl import GT, Fr
 
 
 class MetadataMixin:
+    __slots__ = ()
     _name = "dl21seq"
 
 
@@ -22,10 +25,12 @@ U = TypeVar("U")
 
 
 class FromDL21Mixin:
+    __slots__ = ()
+
     @classmethod
     def from_dl21(cls: Type[T], o: U) -> T:  # type: ignore
         ret = cls()
-        for v in vars(o):
+        for v in fields(o):
             s_obj = getattr(o, v)
             d_obj = getattr(ret, v)
             d_obj.set_object(s_obj)
@@ -33,17 +38,19 @@ class FromDL21Mixin:
 
 
 class GroupKey(FromDL21Mixin, GroupKeyDL21):
-    pass
+    __slots__ = ()
 
 
 class ManagerKey(FromDL21Mixin, ManagerKeyDL21):
-    pass
+    __slots__ = ()
 
 
 class MemberKey(FromDL21Mixin, MemberKeyDL21):
     k: str
     kk: str
 
+    __slots__ = ("k", "kk")
+
     def __init__(self) -> None:
         super().__init__()
         self.k = ""
@@ -53,6 +60,8 @@ class MemberKey(FromDL21Mixin, MemberKeyDL21):
 class Signature(FromDL21Mixin, SignatureDL21):
     seq: dict[str, str]
 
+    __slots__ = ("seq",)
+
     def __init__(self) -> None:
         super().__init__()
         ## seq(1): Computed as Hash(k',PRF(k,seq3)),
@@ -61,7 +70,7 @@ class Signature(FromDL21Mixin, SignatureDL21):
         self.seq = {}
 
 
-class Group(GroupDL21[Signature]):
+class Group(MetadataMixin, GroupDL21[Signature]):
     _logger = logging.getLogger(__name__)
 
     def __init__(self) -> None:
@@ -126,17 +135,17 @@ class Group(GroupDL21[Signature]):
         message = str(message)
         scope = str(scope)
         ret = {"status": "fail"}
-        sig = self._scheme_signature.from_b64(signature)
+        sig = signature_cache.get(self._scheme_signature, signature)
         ## AA must not be 1 (since we use additive notation for G1,
         ## it must not be 0)
         if not sig.AA.is_zero():
-            ## e(AA,ipk) must equal e(A_,g2)
-            e1 = GT.pairing(sig.AA, self.group_key.ipk)
-            e2 = GT.pairing(sig.A_, self.group_key.g2)
-            if e1 == e2:
+            ## e(AA,ipk) must equal e(A_,g2), i.e. e(AA,ipk)*e(-A_,g2) == 1
+            e = GT.multi_pairing(
+                [sig.AA, -sig.A_], [self.group_key.ipk, self.group_key.g2]
+            )
+            if e.is_one():
                 ## Recompute hscp
-                hc = hashlib.sha256(scope.encode()).digest()
-                hscp = G1.from_hash(hc)
+                hscp = hash_scope(scope)
                 A_d = sig.A_ - sig.d
                 y = [sig.nym, A_d, self.group_key.g1]
                 g = [hscp, sig.AA, self.group_key.h2, sig.d, self.group_key.h1]
@@ -173,13 +182,21 @@ class Group(GroupDL21[Signature]):
         key: MemberKey,
         scope: str = "def",
     ) -> dict[str, Any]:
-        ret = self.link(message, messages, signatures, key, scope)
-        _proof = spk.DiscreteLogProof2.from_b64(ret["proof"])
-        ## x[i] = PRF(k',n[i]) = PRF(k',seq3[i])
-        for sig_b64 in signatures:
-            sig = self._scheme_signature.from_b64(sig_b64)
-            _proof.x.append(prf_compute(key.kk, sig.seq["3"]))
-        ret["proof"] = _proof.to_b64()
+        ## x[i] = PRF(k',n[i]) = PRF(k',seq3[i]), collected in the same
+        ## pass that identifies and verifies the signatures
+        x = []
+
+        def collect(idx: int, sig: Signature) -> bool:
+            x.append(prf_compute(key.kk, sig.seq["3"]))
+            return True
+
+        ret = self._link(
+            message, zip(messages, signatures), key, str(scope), collect
+        )
+        if ret["status"] == "success":
+            _proof = spk.DiscreteLogProof2.from_b64(ret["proof"])
+            _proof.x.extend(x)
+            ret["proof"] = _proof.to_b64()
         return ret
 
     def seqlink_verify(
@@ -190,35 +207,48 @@ class Group(GroupDL21[Signature]):
         proof: str,
         scope: str = "def",
     ) -> dict[str, str]:
+        return self.seqlink_verify_stream(
+            message, zip(messages, signatures), proof, scope
+        )
+
+    def seqlink_verify_stream(
+        self,
+        message: str,
+        pairs: Iterable[tuple[str, str]],
+        proof: str,
+        scope: str = "def",
+    ) -> dict[str, str]:
+        """seqlink_verify() over an iterable of (message, signature)
+        pairs, e.g. read from an audit trail. The pairs are consumed once
+        and the verification stops at the first invalid one: the
+        sequence is checked as each signature is read and the signatures
+        are batch verified by chunks (see GroupDL21._link_scan())
+        """
         _proof2 = spk.DiscreteLogProof2.from_b64(proof)
         _proof = spk.DiscreteLogProof()
         _proof.c.set_object(_proof2.c)
         _proof.s.set_object(_proof2.s)
-        ret = self.link_verify(
-            message, messages, signatures, _proof.to_b64(), scope
-        )
-        ## Iterate through sigs and check that
-        ## sig[i]->seq1 = Hash(x[i]) and sig[i]->seq2 = Hash(x[i] xor x[i-1])
-        for idx, sig_b64 in enumerate(signatures):
-            sig = self._scheme_signature.from_b64(sig_b64)
-            _hash = hashlib.sha256(bytes.fromhex(_proof2.x[idx])).hexdigest()
-            if _hash == sig.seq["1"]:
-                if idx > 0:
-                    xi1_b = bytes.fromhex(_proof2.x[idx - 1])
-                    xi_b = bytes.fromhex(_proof2.x[idx])
-                    # seq2 = Hash(x_i \xor x_{i-1})
-                    _xi = bytearray(a ^ b for a, b in zip(xi1_b, xi_b))
-                    _hash2 = hashlib.sha256(_xi).hexdigest()
-                    if _hash2 != sig.seq["2"]:
-                        ret["status"] = "fail"
-                        ret["message"] = "Invalid signature sequence"
-                        self._logger.debug("_hash2 != seq2")
-            else:
-                ret["status"] = "fail"
-                ret["message"] = "Invalid signature sequence"
+
+        ## Check that sig[i]->seq1 = Hash(x[i]) and
+        ## sig[i]->seq2 = Hash(x[i] xor x[i-1])
+        def sequence(idx: int, sig: Signature) -> bool:
+            if idx >= len(_proof2.x):
+                self._logger.debug("Missing x[i]")
+                return False
+            xi_b = bytes.fromhex(_proof2.x[idx])
+            if hashlib.sha256(xi_b).hexdigest() != sig.seq["1"]:
                 self._logger.debug("_hash != seq1")
-                break
-        return ret
+                return False
+            if idx > 0:
+                xi1_b = bytes.fromhex(_proof2.x[idx - 1])
+                # seq2 = Hash(x_i \xor x_{i-1})
+                _xi = bytearray(a ^ b for a, b in zip(xi1_b, xi_b))
+                if hashlib.sha256(_xi).hexdigest() != sig.seq["2"]:
+                    self._logger.debug("_hash2 != seq2")
+                    return False
+            return True
+
+        return self._link_verify(message, pairs, _proof, str(scope), sequence)
 
 
 def prf_compute(key: str, state: int | str) -> str:
@@ -1,8 +1,8 @@
 import hashlib
 import logging
-import random
+import secrets
 import time
-from typing import Any, Type
+from typing import Any, Iterable, Iterator, Sequence, Type
 
 import pygroupsig.utils.spk as spk
 from pygroupsig.interfaces import Container, Scheme
@@ -14,16 +14,21 @@ from pygroupsig.utils.helpers import (
     MetadataManagerKeyMixin,
     MetadataMemberKeyMixin,
     MetadataSignatureMixin,
+    PrecomputeMixin,
     ReprMixin,
+    parallel_map,
+    signature_cache,
 )
-from pygroupsig.utils.mcl import G1, G2, GT, Fr
+from pygroupsig.utils.mcl import G1, G2, GT, FixedBaseTable, Fr
 
 
 class MetadataMixin:
+    __slots__ = ()
     _name = "gl19"
 
 
 class GroupKey(
+    PrecomputeMixin,
     B64Mixin,
     InfoMixin,
     ReprMixin,
@@ -42,6 +47,22 @@ class GroupKey(
     cpk: G1
     epk: G1
 
+    _precompute = ("g2", "ipk")
+    _fixed_base = ("g", "h", "h1", "h2", "h3", "cpk", "epk")
+
+    __slots__ = (  # noqa: RUF023 (wire order)
+        "g1",
+        "g2",
+        "g",
+        "h",
+        "h1",
+        "h2",
+        "h3",
+        "ipk",
+        "cpk",
+        "epk",
+    )
+
     def __init__(self) -> None:
         self.g1 = G1()  # Random generator of G1
         self.g2 = G2()  # Random generator of G2
@@ -67,6 +88,8 @@ class ManagerKey(
     csk: Fr
     esk: Fr
 
+    __slots__ = ("isk", "csk", "esk")  # noqa: RUF023 (wire order)
+
     def __init__(self) -> None:
         self.isk = Fr()  # Issuer secret key
         self.csk = Fr()  # Converter secret key
@@ -91,6 +114,18 @@ class MemberKey(
     h2s: G1
     h3d: G1
 
+    __slots__ = (  # noqa: RUF023 (wire order)
+        "A",
+        "x",
+        "y",
+        "s",
+        "l",
+        "d",
+        "H",
+        "h2s",
+        "h3d",
+    )
+
     def __init__(self) -> None:
         self.A = G1()  # A = (H*h2^s*g1)^(1/isk+x)
         self.x = Fr()  # Randomly picked by the Issuer
@@ -114,6 +149,8 @@ class BlindKey(
     pk: G1
     sk: Fr
 
+    __slots__ = ("pk", "sk")
+
     def __init__(self) -> None:
         self.pk = G1()  # Public key. Equals g^sk
         self.sk = Fr()  # Randomly chosen private key
@@ -147,6 +184,18 @@ class Signature(
     ehy2: G1
     expiration: int
 
+    __slots__ = (  # noqa: RUF023 (wire order)
+        "AA",
+        "A_",
+        "d",
+        "pi",
+        "nym1",
+        "nym2",
+        "ehy1",
+        "ehy2",
+        "expiration",
+    )
+
     def __init__(self) -> None:
         self.AA = G1()
         self.A_ = G1()
@@ -178,6 +227,14 @@ class BlindSignature(
     c1: G1
     c2: G1
 
+    __slots__ = (  # noqa: RUF023 (wire order)
+        "nym1",
+        "nym2",
+        "nym3",
+        "c1",
+        "c2",
+    )
+
     def __init__(self) -> None:
         self.nym1 = G1()
         self.nym2 = G1()
@@ -232,6 +289,9 @@ class Group(
         ## Add the Extractor's public key to the group key
         self.group_key.epk.set_object(self.group_key.g * self.manager_key.esk)
 
+        ## Pairing tables of the fixed G2 operands
+        self.group_key.precompute()
+
     def join_mgr(self, message: dict[str, Any] | None = None) -> dict[str, Any]:
         ret = {"status": "error"}
         if message is None:
@@ -270,9 +330,10 @@ class Group(
                     d = Fr.from_hash(h.digest())
 
                     ## Set A = (H+h_2*s+h3*d+g_1)*((isk+x)**-1)
-                    h2s = self.group_key.h2 * s
-                    h3d = self.group_key.h3 * d
-                    A = (H + h2s + h3d + self.group_key.g1) * ~(
+                    h2sh3d = G1.muln(
+                        [self.group_key.h2, self.group_key.h3], [s, d]
+                    )
+                    A = (H + h2sh3d + self.group_key.g1) * ~(
                         self.manager_key.isk + x
                     )
 
@@ -345,19 +406,19 @@ class Group(
             # A must not be 1 (since we use additive notation for G1,
             # it must not be 0)
             if not member_key.A.is_zero():
-                e1 = (
-                    GT.pairing(member_key.A, self.group_key.g2)
-                ) ** member_key.x
-                e2 = GT.pairing(member_key.A, self.group_key.ipk)
-                e4 = e1 * e2
+                ## e(A,g2)^x * e(A,ipk) == e(aux,g2)
+                ## <=> e(A*x - aux,g2) * e(A,ipk) == 1
                 aux = (
                     member_key.H
                     + member_key.h2s
                     + member_key.h3d
                     + self.group_key.g1
                 )
-                e3 = GT.pairing(aux, self.group_key.g2)
-                if e4 == e3:
+                e = GT.multi_pairing(
+                    [(member_key.A * member_key.x).isub(aux), member_key.A],
+                    [self.group_key.g2, self.group_key.ipk],
+                )
+                if e.is_one():
                     ret["status"] = "success"
                 else:
                     ret["status"] = "fail"
@@ -386,8 +447,10 @@ class Group(
         sig.nym1.set_object(self.group_key.g * alpha)
 
         # nym2 = cpk*alpha+h*y
-        sig.nym2.set_object(
-            (self.group_key.cpk * alpha) + (self.group_key.h * member_key.y)
+        G1.muln(
+            [self.group_key.cpk, self.group_key.h],
+            [alpha, member_key.y],
+            out=sig.nym2,
         )
 
         ## Add extra encryption of h^y with epk
@@ -397,8 +460,10 @@ class Group(
         sig.ehy1.set_object(self.group_key.g * alpha2)
 
         # ehy2 = epk*alpha2+h*y
-        sig.ehy2.set_object(
-            (self.group_key.epk * alpha2) + (self.group_key.h * member_key.y)
+        G1.muln(
+            [self.group_key.epk, self.group_key.h],
+            [alpha2, member_key.y],
+            out=sig.ehy2,
         )
 
         # AA = A*r1
@@ -474,7 +539,7 @@ class Group(
     def verify(self, message: str, signature: str) -> dict[str, Any]:
         message = str(message)
         ret = {"status": "fail"}
-        sig = Signature.from_b64(signature)
+        sig = signature_cache.get(Signature, signature)
 
         ## Auxiliar variables for the spk
         A_d = sig.A_ - sig.d
@@ -522,71 +587,127 @@ class Group(
             self._logger.debug("spk.rep_verify failed")
         return ret
 
-    def blind(
-        self, message: str, signature: str, blind_key: BlindKey | None = None
-    ) -> dict[str, Any]:
-        if blind_key is None:
-            blind_key = BlindKey.from_random(self.group_key)
-        message = str(message)
-        sig = Signature.from_b64(signature)
-
+    def _blind(
+        self, message: str, nym1: G1, nym2: G1, blind_key_public: G1
+    ) -> BlindSignature:
         ## Pick alpha, beta, gamma at random from Z^*_p
         alpha = Fr.from_random()
         beta = Fr.from_random()
         gamma = Fr.from_random()
 
         ## Rerandomize the pseudonym encryption under the cpk and
-        ## add an encryption layer for the pseudonym under the bpk
+        ## add an encryption layer for the pseudonym under the bpk.
+        ## Every base is fixed, see blind_many()
         bsig = BlindSignature()
-        bsig.nym1.set_object(sig.nym1 + (self.group_key.g * beta))
+        bsig.nym1.set_object(nym1 + (self.group_key.g * beta))
         bsig.nym2.set_object(self.group_key.g * alpha)
-        bsig.nym3.set_object(
-            sig.nym2 + (self.group_key.cpk * beta) + (blind_key.pk * alpha)
-        )
+        self.group_key.cpk.mul(beta, out=bsig.nym3).iadd(
+            blind_key_public * alpha
+        ).iadd(nym2)
 
         ##  Encrypt the (hash of the) message
         h = hashlib.sha256()
         h.update(message.encode())
         c = G1.from_hash(h.digest())
         bsig.c1.set_object(self.group_key.g * gamma)
-        bsig.c2.set_object(c + (blind_key.pk * gamma))
+        bsig.c2.set_object(c + (blind_key_public * gamma))
+        return bsig
+
+    def blind(
+        self, message: str, signature: str, blind_key: BlindKey | None = None
+    ) -> dict[str, Any]:
+        if blind_key is None:
+            blind_key = BlindKey.from_random(self.group_key)
+        sig = signature_cache.get(Signature, signature)
+        bsig = self._blind(str(message), sig.nym1, sig.nym2, blind_key.pk)
         return {
             "status": "success",
             "blind_signature": bsig.to_b64(),
             "blind_key": blind_key.to_b64(),
         }
 
+    def blind_many(
+        self,
+        pairs: Iterable[tuple[str, str]],
+        blind_key: BlindKey,
+        workers: int | None = None,
+    ) -> Iterator[str]:
+        """blind() each (message, signature) pair with the same blind key,
+        streaming the blinded signatures in order. The pairs are processed
+        by chunks on the worker pool (see parallel_map()), only the
+        pseudonym of each signature is decoded, and the multiplications
+        by the blinding public key go through a comb table once the batch
+        is large enough to pay for it
+        """
+        pk = G1.from_object(blind_key.pk)
+        pk.fixed_base(FixedBaseTable.LAZY_USES)
+
+        def blind(pair: tuple[str, str]) -> str:
+            message, signature = pair
+            ## Only the pseudonym is used
+            nym1, nym2 = Signature.decode_fields(signature, ("nym1", "nym2"))
+            return self._blind(str(message), nym1, nym2, pk).to_b64()
+
+        return parallel_map(blind, pairs, workers)
+
+    def _convert(
+        self, blind_signature: str, pk: G1, r: Fr, neg_csk_r: Fr
+    ) -> str:
+        bsig = BlindSignature.from_b64(blind_signature)
+        r1 = Fr.from_random()
+        r2 = Fr.from_random()
+        ## Decrypt nym and raise to r, then re-randomize it:
+        ## nym1 = nym2*r + g*r1
+        ## nym2 = (nym1*-csk + nym3)*r + pk*r1
+        csig = BlindSignature()
+        bsig.nym2.mul(r, out=csig.nym1).iadd(self.group_key.g * r1)
+        G1.muln([bsig.nym1, bsig.nym3], [neg_csk_r, r], out=csig.nym2).iadd(
+            pk * r1
+        )
+        ## nym3 is empty (default value 0)
+
+        ## Re-randomize ciphertext
+        csig.c1.set_object(bsig.c1 + (self.group_key.g * r2))
+        csig.c2.set_object(bsig.c2 + (pk * r2))
+        return csig.to_b64()
+
     def convert(
         self, blind_signatures: list[str], blind_key_public: str
     ) -> dict[str, Any]:
-        r = Fr.from_random()
-        neg_csk = -self.manager_key.csk
-        converted_signatures = []
-        pk = G1.from_b64(blind_key_public)
-        for bsig_b64 in blind_signatures:
-            bsig = BlindSignature.from_b64(bsig_b64)
-            r1 = Fr.from_random()
-            r2 = Fr.from_random()
-            ## Decrypt nym and raise to r
-            cnym1p = bsig.nym2 * r
-            cnym2p = ((bsig.nym1 * neg_csk) + bsig.nym3) * r
-
-            ## Re-randomize nym
-            csig = BlindSignature()
-            csig.nym1.set_object(cnym1p + (self.group_key.g * r1))
-            csig.nym2.set_object(cnym2p + (pk * r1))
-            ## nym3 is empty (default value 0)
-
-            ## Re-randomize ciphertext
-            csig.c1.set_object(bsig.c1 + (self.group_key.g * r2))
-            csig.c2.set_object(bsig.c2 + (pk * r2))
-            converted_signatures.append(csig.to_b64())
-        durstenfeld_perm(converted_signatures)
         return {
             "status": "success",
-            "converted_signatures": converted_signatures,
+            "converted_signatures": list(
+                self.convert_many(blind_signatures, blind_key_public, 1)
+            ),
         }
 
+    def convert_many(
+        self,
+        blind_signatures: Sequence[str],
+        blind_key_public: str,
+        workers: int | None = None,
+    ) -> Iterator[str]:
+        """convert() streaming the converted signatures.
+
+        All of them are converted with the same r, so that signatures of
+        the same member keep matching pseudonyms. They are produced in a
+        random order, so they cannot be matched with the blinded ones by
+        position. The conversions run by chunks on the worker pool (see
+        parallel_map()), and the multiplications by the blinding public
+        key go through a comb table once the batch is large enough
+        """
+        r = Fr.from_random()
+        neg_csk_r = -self.manager_key.csk * r
+        pk = G1.from_b64(blind_key_public)
+        pk.fixed_base(FixedBaseTable.LAZY_USES)
+        order = list(range(len(blind_signatures)))
+        durstenfeld_perm(order)
+        return parallel_map(
+            lambda i: self._convert(blind_signatures[i], pk, r, neg_csk_r),
+            order,
+            workers,
+        )
+
     @staticmethod
     def unblind(
         converted_signature: str, blind_key: BlindKey
@@ -608,16 +729,22 @@ class Group(
         }
 
 
-def durstenfeld_perm(input_list: list[str]) -> None:
+_rng = secrets.SystemRandom()
+
+
+def durstenfeld_perm(input_list: list[Any]) -> None:
     """
     Uses Durstenfeld variant of the Fisher-Yates in place permutation
     algorithm to output a random permutation of the given array.
 
     See https://en.wikipedia.org/wiki/Fisher%E2%80%93Yates_shuffle#The_modern_algorithm
     for a definition of the algorithm.
+
+    convert_many() relies on it to hide the order of its inputs, so the
+    indexes come from the system CSPRNG.
     """
-    for i in range(len(input_list) - 2):
-        j = random.randint(i, len(input_list))
+    for i in range(len(input_list) - 1):
+        j = _rng.randint(i, len(input_list) - 1)
         tmp = input_list[i]
         input_list[i] = input_list[j]
         input_list[j] = tmp
@@ -14,16 +14,22 @@ from pygroupsig.utils.helpers import (
     MetadataManagerKeyMixin,
     MetadataMemberKeyMixin,
     MetadataSignatureMixin,
+    OpeningTable,
+    PrecomputeMixin,
     ReprMixin,
+    pairing_find,
+    signature_cache,
 )
 from pygroupsig.utils.mcl import G1, G2, GT, Fr
 
 
 class MetadataMixin:
+    __slots__ = ()
     _name = "klap20"
 
 
 class GroupKey(
+    PrecomputeMixin,
     B64Mixin,
     InfoMixin,
     ReprMixin,
@@ -38,6 +44,18 @@ class GroupKey(
     ZZ0: G2
     ZZ1: G2
 
+    _precompute = ("gg", "XX", "YY")
+    _fixed_base = ("g", "gg", "ZZ0", "ZZ1")
+
+    __slots__ = (  # noqa: RUF023 (wire order)
+        "g",
+        "gg",
+        "XX",
+        "YY",
+        "ZZ0",
+        "ZZ1",
+    )
+
     def __init__(self) -> None:
         self.g = G1()  # Random generator of G1
         self.gg = G2()  # Random generator of G1
@@ -60,6 +78,8 @@ class ManagerKey(
     z0: Fr
     z1: Fr
 
+    __slots__ = ("x", "y", "z0", "z1")
+
     def __init__(self) -> None:
         self.x = Fr()  # Issuer component x
         self.y = Fr()  # Issuer component y
@@ -80,6 +100,8 @@ class MemberKey(
     v: G1
     w: G1
 
+    __slots__ = ("alpha", "u", "v", "w")
+
     def __init__(self) -> None:
         self.alpha = Fr()
         self.u = G1()
@@ -100,6 +122,8 @@ class Signature(
     ww: G1
     pi: spk.DiscreteLogProof
 
+    __slots__ = ("uu", "vv", "ww", "pi")  # noqa: RUF023 (wire order)
+
     def __init__(self) -> None:
         self.uu = G1()
         self.vv = G1()
@@ -118,6 +142,9 @@ class Group(
         self.group_key = GroupKey()
         self.manager_key = ManagerKey()
         self.gml = GML()
+        ## Opening values of each GML member for both coins b, see
+        ## precompute_open()
+        self._opening = OpeningTable(self._open_entry)
 
     def setup(self) -> None:
         ## Initializes the Issuer's key
@@ -142,6 +169,9 @@ class Group(
         self.group_key.ZZ0.set_object(self.group_key.gg * self.manager_key.z0)
         self.group_key.ZZ1.set_object(self.group_key.gg * self.manager_key.z1)
 
+        ## Pairing tables of the fixed G2 operands
+        self.group_key.precompute()
+
     def join_mgr(self, message: dict[str, Any] | None = None) -> dict[str, Any]:
         ret = {"status": "error"}
         if message is None:
@@ -195,7 +225,9 @@ class Group(
                 if spk.general_representation_verify(
                     y, g, i, prods, proof, n.to_bytes(), manual=True
                 ):
-                    v = (u * self.manager_key.x) + (w * self.manager_key.y)
+                    v = G1.muln(
+                        [u, w], [self.manager_key.x, self.manager_key.y]
+                    )
                     # Add the tuple (i,SS0,SS1,ff0,ff1,tau) to the GML
                     tau = GT.pairing(f, self.group_key.gg)
                     # Currently, KLAP20 identities are just uint64_t's
@@ -206,7 +238,13 @@ class Group(
                     h.update(ff1.to_bytes())
                     h.update(tau.to_bytes())
 
-                    self.gml[h.hexdigest()] = (SS0, SS1, ff0, ff1, tau)
+                    ## Keeps the opening values in sync if they already are
+                    self._opening.store(
+                        self.gml,
+                        h.hexdigest(),
+                        (SS0, SS1, ff0, ff1, tau),
+                        self._opening_key(),
+                    )
 
                     ret["status"] = "success"
                     ret["v"] = v.to_b64()
@@ -307,16 +345,17 @@ class Group(
             # Min = v
             member_key.v = G1.from_b64(message["v"])
             # Check correctness: e(v,gg) = e(u,XX)e(w,YY)
-            e1 = GT.pairing(member_key.v, self.group_key.gg)
-            e2 = GT.pairing(member_key.u, self.group_key.XX)
-            e3 = GT.pairing(member_key.w, self.group_key.YY)
-            e4 = e2 * e3
-            if e1 == e4:
+            ## i.e. e(u,XX)*e(w,YY)*e(-v,gg) == 1
+            e = GT.multi_pairing(
+                [member_key.u, member_key.w, -member_key.v],
+                [self.group_key.XX, self.group_key.YY, self.group_key.gg],
+            )
+            if e.is_one():
                 ret["status"] = "success"
             else:
                 ret["status"] = "fail"
                 ret["message"] = "Invalid message content"
-                self._logger.debug("e1 != e4")
+                self._logger.debug("e(v,gg) != e(u,XX)e(w,YY)")
         else:
             ret["message"] = (
                 f"Phase not supported for {self.__class__.__name__}{self._name.upper()}"
@@ -329,9 +368,9 @@ class Group(
         ## Randomize u, v and w
         r = Fr.from_random()
         sig = Signature()
-        sig.uu.set_object(member_key.u * r)
-        sig.vv.set_object(member_key.v * r)
-        sig.ww.set_object(member_key.w * r)
+        member_key.u.mul(r, out=sig.uu)
+        member_key.v.mul(r, out=sig.vv)
+        member_key.w.mul(r, out=sig.ww)
 
         ## Compute signature of knowledge of alpha
         proof = spk.discrete_log_sign(sig.ww, sig.uu, member_key.alpha, message)
@@ -345,54 +384,74 @@ class Group(
     def verify(self, message: str, signature: str) -> dict[str, Any]:
         message = str(message)
         ret = {"status": "fail"}
-        sig = Signature.from_b64(signature)
+        sig = signature_cache.get(Signature, signature)
         ## Verify SPK
         if spk.discrete_log_verify(sig.ww, sig.uu, sig.pi, message):
-            # e1 = e(vv,gg)
-            e1 = GT.pairing(sig.vv, self.group_key.gg)
-            # e2 = e(uu,XX)
-            e2 = GT.pairing(sig.uu, self.group_key.XX)
-            # e3 = e(ww,YY)
-            e3 = GT.pairing(sig.ww, self.group_key.YY)
-            e4 = e2 * e3
-            ## Compare the result with the received challenge
-            if e1 == e4:
+            ## e(vv,gg) == e(uu,XX)*e(ww,YY)
+            ## <=> e(uu,XX)*e(ww,YY)*e(-vv,gg) == 1
+            e = GT.multi_pairing(
+                [sig.uu, sig.ww, -sig.vv],
+                [self.group_key.XX, self.group_key.YY, self.group_key.gg],
+            )
+            if e.is_one():
                 ret["status"] = "success"
             else:
                 ret["message"] = "Invalid signature"
-                self._logger.debug("e1 != e4")
+                self._logger.debug("e(vv,gg) != e(uu,XX)e(ww,YY)")
         else:
             ret["message"] = "Invalid signature"
             self._logger.debug("spk.dlog_G1_verify failed")
         return ret
 
-    def open(self, signature: str) -> dict[str, Any]:
+    def _opening_key(self) -> tuple:
+        return self.manager_key.z0.to_bytes(), self.manager_key.z1.to_bytes()
+
+    def _open_entry(self, entry: tuple) -> tuple[G2, G2]:
+        ## ff_b - SS_b*z_b for both coins b
+        SS0, SS1, ff0, ff1, _ = entry
+        return (
+            (ff0 - SS0 * self.manager_key.z0).normalize(),
+            (ff1 - SS1 * self.manager_key.z1).normalize(),
+        )
+
+    def precompute_open(self) -> None:
+        """Compute the opening values of the GML members that do not have
+        them yet (e.g. after loading a GML). Done by open() if needed, and
+        kept up to date by join_mgr() afterwards
+        """
+        self._opening.sync(self.gml, self._opening_key())
+
+    def open(
+        self, signature: str, workers: int | None = None
+    ) -> dict[str, Any]:
         ret = {"status": "fail"}
-        sig = Signature.from_b64(signature)
+        sig = signature_cache.get(Signature, signature)
+        opening = self._opening.sync(self.gml, self._opening_key())
         b = random.randint(0, 1)
-        for mem_id, (SS0, SS1, ff0, ff1, tau) in self.gml.items():
-            if b:
-                aux = -(SS1 * self.manager_key.z1)
-                ff = ff1 + aux
-            else:
-                aux = -(SS0 * self.manager_key.z0)
-                ff = ff0 + aux
-            e1 = GT.pairing(sig.uu, ff)
-            e2 = GT.pairing(sig.ww, self.group_key.gg)
-            e3 = GT.pairing(self.group_key.g, ff)
-            if e1 == e2 and tau == e3:
-                ret["status"] = "success"
-                ret["id"] = mem_id
-                proof = spk.pairing_homomorphism_sign2(
-                    ff, sig.uu, self.group_key.g, e2, e3, tau, sig.to_b64()
-                )
-                ret["proof"] = proof.to_b64()
-                break
+        ids = list(opening)
+        ffs = [values[b] for values in opening.values()]
+        ## e(uu,ff) == e(ww,gg), the right side does not depend on the member
+        e2 = GT.pairing(sig.ww, self.group_key.gg)
+
+        def check(i: int) -> bool:
+            ## e(g,ff) == tau, only checked for the matching member
+            return GT.pairing(self.group_key.g, ffs[i]) == self.gml[ids[i]][4]
+
+        idx = pairing_find(sig.uu, ffs, e2, workers, check)
+        if idx >= 0:
+            mem_id, ff = ids[idx], ffs[idx]
+            tau = self.gml[mem_id][4]
+            ret["status"] = "success"
+            ret["id"] = mem_id
+            proof = spk.pairing_homomorphism_sign2(
+                ff, sig.uu, self.group_key.g, e2, tau, tau, sig.to_b64()
+            )
+            ret["proof"] = proof.to_b64()
         return ret
 
     def open_verify(self, signature: str, proof: str) -> dict[str, Any]:
         ret = {"status": "fail"}
-        sig = Signature.from_b64(signature)
+        sig = signature_cache.get(Signature, signature)
         proof_ = spk.PairingHomomorphismProof2.from_b64(proof)
         e2 = GT.pairing(sig.ww, self.group_key.gg)
         if spk.pairing_homomorphism_verify2(
@@ -13,16 +13,22 @@ from pygroupsig.utils.helpers import (
     MetadataManagerKeyMixin,
     MetadataMemberKeyMixin,
     MetadataSignatureMixin,
+    OpeningTable,
+    PrecomputeMixin,
     ReprMixin,
+    pairing_find,
+    signature_cache,
 )
 from pygroupsig.utils.mcl import G1, G2, GT, Fr
 
 
 class MetadataMixin:
+    __slots__ = ()
     _name = "ps16"
 
 
 class GroupKey(
+    PrecomputeMixin,
     B64Mixin,
     InfoMixin,
     ReprMixin,
@@ -35,6 +41,11 @@ class GroupKey(
     X: G2
     Y: G2
 
+    _precompute = ("gg", "X", "Y")
+    _fixed_base = ("g", "Y")
+
+    __slots__ = ("g", "gg", "X", "Y")  # noqa: RUF023 (wire order)
+
     def __init__(self) -> None:
         self.g = G1()  # Random generator of G1
         self.gg = G2()  # Random generator of G2
@@ -53,6 +64,8 @@ class ManagerKey(
     x: Fr
     y: Fr
 
+    __slots__ = ("x", "y")
+
     def __init__(self) -> None:
         self.x = Fr()
         self.y = Fr()
@@ -70,6 +83,8 @@ class MemberKey(
     sigma1: G1
     sigma2: G1
 
+    __slots__ = ("sk", "sigma1", "sigma2")  # noqa: RUF023 (wire order)
+
     def __init__(self) -> None:
         self.sk = Fr()
         self.sigma1 = G1()
@@ -88,6 +103,8 @@ class Signature(
     sigma2: G1
     pi: spk.DiscreteLogProof
 
+    __slots__ = ("sigma1", "sigma2", "pi")  # noqa: RUF023 (wire order)
+
     def __init__(self) -> None:
         self.sigma1 = G1()
         self.sigma2 = G1()
@@ -105,6 +122,8 @@ class Group(
         self.group_key = GroupKey()
         self.manager_key = ManagerKey()
         self.gml = GML()
+        ## ttau of each GML member, see precompute_open()
+        self._opening = OpeningTable(lambda entry: entry[1])
 
     def setup(self) -> None:
         ## Set manager key
@@ -117,6 +136,9 @@ class Group(
         self.group_key.X.set_object(self.group_key.gg * self.manager_key.x)
         self.group_key.Y.set_object(self.group_key.gg * self.manager_key.y)
 
+        ## Pairing tables of the fixed G2 operands
+        self.group_key.precompute()
+
     def join_mgr(self, message: dict[str, Any] | None = None) -> dict[str, Any]:
         ret = {"status": "error"}
         if message is None:
@@ -142,23 +164,27 @@ class Group(
                 if spk.discrete_log_verify(
                     tau, self.group_key.g, proof, n.to_bytes()
                 ):
-                    e1 = GT.pairing(tau, self.group_key.Y)
-                    e2 = GT.pairing(self.group_key.g, ttau)
+                    ## e(tau,Y) == e(g,ttau) <=> e(tau,Y)*e(-g,ttau) == 1
+                    e = GT.multi_pairing(
+                        [tau, -self.group_key.g], [self.group_key.Y, ttau]
+                    )
 
-                    if e1 == e2:
+                    if e.is_one():
                         ## Compute the partial member key
                         u = Fr.from_random()
                         sigma1 = self.group_key.g * u
-                        sigma2 = (
-                            (tau * self.manager_key.y)
-                            + (self.group_key.g * self.manager_key.x)
-                        ) * u
+                        sigma2 = G1.muln(
+                            [tau, self.group_key.g],
+                            [self.manager_key.y * u, self.manager_key.x * u],
+                        )
 
                         ## Add the tuple (i,tau,ttau) to the GML
                         h = hashlib.sha256()
                         h.update(tau.to_bytes())
                         h.update(ttau.to_bytes())
-                        self.gml[h.hexdigest()] = (tau, ttau)
+                        self._opening.store(
+                            self.gml, h.hexdigest(), (tau, ttau)
+                        )
 
                         ## Mout = (sigma1,sigma2)
                         ret["status"] = "success"
@@ -265,17 +291,21 @@ class Group(
     def verify(self, message: str, signature: str) -> dict[str, Any]:
         message = str(message)
         ret = {"status": "fail"}
-        sig = Signature.from_b64(signature)
+        sig = signature_cache.get(Signature, signature)
 
         # e1 = e(-sigma1,X)
-        e1 = GT.pairing(-sig.sigma1, self.group_key.X)
         # e2 = e(sigma2,gg)
-        e2 = GT.pairing(sig.sigma2, self.group_key.gg)
         # e3 = e(sigma1*s,Y)
-        e3 = GT.pairing(sig.sigma1 * sig.pi.s, self.group_key.Y)
-
         # R = ((e1*e2)**-c)*e3
-        R = ~((e1 * e2) ** sig.pi.c) * e3
+        ## Optimized R = e(sigma1*c,X) * e(-sigma2*c,gg) * e(sigma1*s,Y)
+        R = GT.multi_pairing(
+            [
+                sig.sigma1 * sig.pi.c,
+                (sig.sigma2 * sig.pi.c).ineg(),
+                sig.sigma1 * sig.pi.s,
+            ],
+            [self.group_key.X, self.group_key.gg, self.group_key.Y],
+        )
 
         h = hashlib.sha256()
         h.update(sig.sigma1.to_bytes())
@@ -294,31 +324,43 @@ class Group(
             self._logger.debug("c != sig.pi.c")
         return ret
 
-    def open(self, signature: str) -> dict[str, Any]:
+    def precompute_open(self) -> None:
+        """Collect the ttau of the GML members (decoding them, for GML
+        files). Done by open() if needed, and kept up to date by join_mgr()
+        afterwards
+        """
+        self._opening.sync(self.gml)
+
+    def open(
+        self, signature: str, workers: int | None = None
+    ) -> dict[str, Any]:
         ret = {"status": "fail"}
-        sig = Signature.from_b64(signature)
-        e1 = GT.pairing(sig.sigma2, self.group_key.gg)
-        e2 = GT.pairing(sig.sigma1, self.group_key.X)
-        e4 = e1 / e2
-        for mem_id, (_, ttau) in self.gml.items():
-            e3 = GT.pairing(sig.sigma1, ttau)
-            if e4 == e3:
-                ret["status"] = "success"
-                ret["id"] = mem_id
-                proof = spk.pairing_homomorphism_sign(
-                    sig.sigma1, e3, ttau, sig.to_b64()
-                )
-                ret["proof"] = proof.to_b64()
-                break
+        sig = signature_cache.get(Signature, signature)
+        opening = self._opening.sync(self.gml)
+        ids, ttaus = list(opening), list(opening.values())
+        # e4 = e(sigma2,gg) / e(sigma1,X)
+        e4 = GT.multi_pairing(
+            [sig.sigma2, -sig.sigma1], [self.group_key.gg, self.group_key.X]
+        )
+        ## e(sigma1,ttau) == e4
+        idx = pairing_find(sig.sigma1, ttaus, e4, workers)
+        if idx >= 0:
+            ret["status"] = "success"
+            ret["id"] = ids[idx]
+            proof = spk.pairing_homomorphism_sign(
+                sig.sigma1, e4, ttaus[idx], sig.to_b64()
+            )
+            ret["proof"] = proof.to_b64()
         return ret
 
     def open_verify(self, signature: str, proof: str) -> dict[str, Any]:
         ret = {"status": "fail"}
-        sig = Signature.from_b64(signature)
+        sig = signature_cache.get(Signature, signature)
         proof_ = spk.PairingHomomorphismProof.from_b64(proof)
-        e1 = GT.pairing(sig.sigma2, self.group_key.gg)
-        e2 = GT.pairing(sig.sigma1, self.group_key.X)
-        e4 = e1 / e2
+        # e4 = e(sigma2,gg) / e(sigma1,X)
+        e4 = GT.multi_pairing(
+            [sig.sigma2, -sig.sigma1], [self.group_key.gg, self.group_key.X]
+        )
         if spk.pairing_homomorphism_verify(
             sig.sigma1, e4, proof_, sig.to_b64()
         ):
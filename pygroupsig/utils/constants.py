@@ -1,5 +1,6 @@
 import ctypes
 import os
+from typing import Callable
 
 # src/bn_c384_256.cpp
 MCLBN_FP_UNIT_SIZE: int = 6
@@ -17,9 +18,19 @@ BLS12_381_Q: str = "1 3527010695874666181871391160110601448900299527927752402199
 
 # In pygroupsig/utils/constants.py
 LIB_PATH: str = os.environ.get("MCL_LIB_PATH", "/usr/local/lib/mcl")
+# Set to 0 to disable the lazily built fixed-base comb tables
+FIXED_BASE_TABLES: bool = os.environ.get("PYGROUPSIG_FIXED_BASE", "1") != "0"
 MCL_LIB: str = "libmcl.so"
 MCL384_LIB: str = "libmclbn384_256.so"
 lib: ctypes.CDLL | None = None
+_loaders: list[Callable[[ctypes.CDLL], None]] = []
+
+
+def on_load(callback: Callable[[ctypes.CDLL], None]) -> None:
+    """Run callback with the mcl library now (if loaded) and on every load"""
+    _loaders.append(callback)
+    if lib is not None:
+        callback(lib)
 
 
 def load_library() -> None:
@@ -30,3 +41,5 @@ def load_library() -> None:
     lib = ctypes.CDLL(f"{LIB_PATH}/{MCL384_LIB}")
     if lib.mclBn_init(MCL_BLS12_381, MCLBN_COMPILED_TIME_VAR):
         raise RuntimeError("mcl library could not be initialized")
+    for callback in _loaders:
+        callback(lib)
@@ -0,0 +1,385 @@
+"""Binary GML/CRL file, memory mapped and decoded lazily
+
+Layout (little endian):
+  header         magic, version, number of fields, key size, capacity,
+                 number of records and one class code per field
+  id index       capacity u32 slots: hash(member id) -> record number + 1
+  element index  capacity u32 slots: hash(first element) -> record number + 1
+  records        capacity / 2 fixed-size records: u8 member id length, the
+                 member id padded to the key size, then every field with its
+                 fixed serialized width
+
+Both indexes use linear probing and are kept at most half full. Appending
+past that rewrites the file with twice the capacity. Replacing the first
+element of an entry leaves its old element slot in place (lookups compare
+the record itself), so the element index is also rebuilt once its used
+slots reach half the capacity. The field classes are taken from the first
+record
+"""
+
+import array
+import hashlib
+import mmap
+import os
+import struct
+import threading
+from collections.abc import Iterable, Iterator, Mapping
+from typing import Any, Type, TypeVar
+
+from pygroupsig.utils.helpers import ContainerDict, new_version
+from pygroupsig.utils.mcl import G1, G2, GT, Base, Fr
+
+MAGIC = b"\xa7GML"
+VERSION = 1
+## Member ids are sha256 hex digests
+KEY_SIZE = 64
+MIN_CAPACITY = 64
+
+_HEADER = struct.Struct("<4sBBBxII16s")
+_SLOT = struct.Struct("<I")
+_CLASSES: tuple[Type[Base], ...] = (Fr, G1, G2, GT)
+
+T = TypeVar("T", bound="ContainerFile")
+
+
+def _slot_hash(b: bytes) -> int:
+    return int.from_bytes(hashlib.sha256(b).digest()[:8], "little")
+
+
+def _capacity(n: int) -> int:
+    ## Smallest power of two keeping n records at most half the slots
+    return max(MIN_CAPACITY, 1 << (2 * n - 1).bit_length())
+
+
+class ContainerFile(Mapping):
+    """Member id -> tuple of elements, like ContainerDict, backed by a
+    memory mapped file. Entries are decoded on access, lookup() uses the
+    element index. Entries can be added or replaced, not deleted. version
+    changes with every update
+    """
+
+    def __init__(self, path: str | os.PathLike, readonly: bool = False) -> None:
+        self.path = os.fspath(path)
+        self.readonly = readonly
+        self._lock = threading.RLock()
+        self.version = new_version()
+        self._file = open(self.path, "rb" if readonly else "r+b")
+        try:
+            self._map()
+        except ValueError:
+            self._file.close()
+            raise
+
+    @classmethod
+    def create(
+        cls: Type[T], path: str | os.PathLike, key_size: int = KEY_SIZE
+    ) -> T:
+        with open(path, "wb") as f:
+            f.write(
+                _HEADER.pack(MAGIC, VERSION, 0, key_size, MIN_CAPACITY, 0, b"")
+            )
+            f.truncate(_HEADER.size + 8 * MIN_CAPACITY)
+        return cls(path)
+
+    @classmethod
+    def from_container(
+        cls: Type[T],
+        path: str | os.PathLike,
+        container: Mapping[str, tuple],
+        key_size: int = KEY_SIZE,
+    ) -> T:
+        """Export a GML/CRL (or any member id -> elements mapping)"""
+        ret = cls.create(path, key_size)
+        ret.update(container.items())
+        return ret
+
+    @classmethod
+    def from_b64(
+        cls: Type[T],
+        path: str | os.PathLike,
+        s: str | bytes,
+        key_size: int = KEY_SIZE,
+    ) -> T:
+        """Export a GML/CRL stored with ContainerDict.to_b64()"""
+        return cls.from_container(path, ContainerDict.from_b64(s), key_size)
+
+    def to_container(self) -> ContainerDict:
+        return ContainerDict(self.items())
+
+    def to_b64(self) -> str:
+        return self.to_container().to_b64()
+
+    def _map(self) -> None:
+        self._mm = mmap.mmap(
+            self._file.fileno(),
+            0,
+            access=mmap.ACCESS_READ if self.readonly else mmap.ACCESS_WRITE,
+        )
+        try:
+            magic, version, n, key_size, capacity, count, codes = (
+                _HEADER.unpack_from(self._mm, 0)
+            )
+        except struct.error as e:
+            self._mm.close()
+            raise ValueError("Invalid GML/CRL file") from e
+        if magic != MAGIC or version != VERSION:
+            self._mm.close()
+            raise ValueError(f"Invalid GML/CRL file (v{version})")
+        self._key_size = key_size
+        self._capacity = capacity
+        self._count = count
+        self._ids = _HEADER.size
+        self._elements = self._ids + 4 * capacity
+        self._records = self._elements + 4 * capacity
+        ## Used element index slots, stale ones of replaced entries included
+        slots = array.array("I")
+        slots.frombytes(self._mm[self._elements : self._records])
+        self._used = capacity - slots.count(0)
+        ## Field offsets inside a record
+        self._offsets = [1 + key_size]
+        self._set_classes(tuple(_CLASSES[c] for c in codes[:n]))
+        size = self._records
+        if self._classes:
+            size += (capacity // 2) * self._record_size
+        if len(self._mm) < size or count > capacity // 2:
+            self._mm.close()
+            raise ValueError("Truncated GML/CRL file")
+
+    def _header(self) -> bytes:
+        return _HEADER.pack(
+            MAGIC,
+            VERSION,
+            len(self._classes),
+            self._key_size,
+            self._capacity,
+            self._count,
+            bytes(_CLASSES.index(c) for c in self._classes),
+        )
+
+    def _encode_key(self, mem_id: str) -> bytes:
+        key = mem_id.encode()
+        if len(key) > self._key_size:
+            raise ValueError(f"Member id longer than {self._key_size} bytes")
+        return key
+
+    def _encode(self, key: bytes, values: tuple) -> bytes:
+        if tuple(type(v) for v in values) != self._classes:
+            raise TypeError(
+                f"Expected ({', '.join(c.__name__ for c in self._classes)})"
+            )
+        return b"".join(
+            [bytes([len(key)]), key.ljust(self._key_size, b"\x00")]
+            + [v.to_bytes() for v in values]
+        )
+
+    def _offset(self, n: int) -> int:
+        return self._records + n * self._record_size
+
+    def _key(self, n: int) -> bytes:
+        off = self._offset(n)
+        return self._mm[off + 1 : off + 1 + self._mm[off]]
+
+    def _field(self, n: int, i: int = 0) -> bytes:
+        off = self._offset(n)
+        return self._mm[off + self._offsets[i] : off + self._offsets[i + 1]]
+
+    def _decode(self, n: int) -> tuple:
+        return tuple(
+            c.from_bytes(self._field(n, i)) for i, c in enumerate(self._classes)
+        )
+
+    @staticmethod
+    def _insert(buffer: Any, base: int, capacity: int, h: int, n: int) -> None:
+        mask = capacity - 1
+        i = h & mask
+        for _ in range(capacity):
+            if not _SLOT.unpack_from(buffer, base + 4 * i)[0]:
+                _SLOT.pack_into(buffer, base + 4 * i, n + 1)
+                return
+            i = (i + 1) & mask
+        raise ValueError("Full GML/CRL index")
+
+    def _find(self, base: int, h: int, match: Any) -> int:
+        """Record number of the first match in an index, -1 if none"""
+        mask = self._capacity - 1
+        i = h & mask
+        for _ in range(self._capacity):
+            (rec,) = _SLOT.unpack_from(self._mm, base + 4 * i)
+            if rec == 0:
+                return -1
+            if match(rec - 1):
+                return rec - 1
+            i = (i + 1) & mask
+        return -1
+
+    def _find_key(self, key: bytes) -> int:
+        return self._find(
+            self._ids, _slot_hash(key), lambda n: self._key(n) == key
+        )
+
+    def _rewrite(self, capacity: int, records: list[bytes]) -> None:
+        """Write a new file with the given records and rebuilt indexes"""
+        ids = bytearray(4 * capacity)
+        elements = bytearray(4 * capacity)
+        first = slice(self._offsets[0], self._offsets[1])
+        for n, raw in enumerate(records):
+            self._insert(ids, 0, capacity, _slot_hash(raw[1 : 1 + raw[0]]), n)
+            self._insert(elements, 0, capacity, _slot_hash(raw[first]), n)
+        self._capacity = capacity
+        self._count = len(records)
+        tmp = f"{self.path}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(self._header())
+            f.write(ids)
+            f.write(elements)
+            f.write(b"".join(records))
+            f.truncate(
+                _HEADER.size
+                + 8 * capacity
+                + (capacity // 2) * (self._record_size)
+            )
+            f.flush()
+            os.fsync(f.fileno())
+        self._mm.close()
+        self._file.close()
+        os.replace(tmp, self.path)
+        self._file = open(self.path, "r+b")
+        self._map()
+
+    def __getitem__(self, mem_id: str) -> tuple:
+        with self._lock:
+            n = self._find_key(self._encode_key(mem_id))
+            if n < 0:
+                raise KeyError(mem_id)
+            return self._decode(n)
+
+    def __contains__(self, mem_id: object) -> bool:
+        if not isinstance(mem_id, str):
+            return False
+        with self._lock:
+            return self._find_key(self._encode_key(mem_id)) >= 0
+
+    def __iter__(self) -> Iterator[str]:
+        for n in range(self._count):
+            with self._lock:
+                key = self._key(n)
+            yield key.decode()
+
+    def __len__(self) -> int:
+        return self._count
+
+    def lookup(self, element: Any) -> str | None:
+        """Member id of the entry whose first element is element"""
+        if not self._classes:
+            return None
+        data = element.to_bytes()
+        with self._lock:
+            n = self._find_element(data)
+            return None if n < 0 else self._key(n).decode()
+
+    def __setitem__(self, mem_id: str, values: tuple) -> None:
+        self.update([(mem_id, values)])
+
+    def update(self, entries: Iterable[tuple[str, tuple]]) -> None:
+        """Add or replace entries. New entries are appended in place while
+        the indexes have room, otherwise the file is rewritten once
+        """
+        if self.readonly:
+            raise ValueError(f"{self.path} is opened read-only")
+        entries = list(entries)
+        if not entries:
+            return
+        with self._lock:
+            if not self._classes:
+                self._set_classes(tuple(type(v) for v in entries[0][1]))
+            try:
+                encoded = {}
+                for mem_id, values in entries:
+                    key = self._encode_key(mem_id)
+                    encoded[key] = self._encode(key, values)
+            except (TypeError, ValueError):
+                if not self._count:
+                    self._set_classes(())
+                raise
+            new = [k for k in encoded if self._find_key(k) < 0]
+            self.version = new_version()
+            ## Every entry may take an element index slot
+            half = self._capacity // 2
+            if (
+                self._count + len(new) > half
+                or self._used + len(encoded) > half
+                or len(self._mm) < self._offset(half)
+            ):
+                records = [
+                    encoded.pop(self._key(n), None) or self._raw(n)
+                    for n in range(self._count)
+                ]
+                records.extend(encoded.values())
+                self._rewrite(_capacity(len(records)), records)
+                return
+            for key, raw in encoded.items():
+                n = self._find_key(key)
+                if n < 0:
+                    n = self._count
+                    self._count += 1
+                    self._insert(
+                        self._mm, self._ids, self._capacity, _slot_hash(key), n
+                    )
+                off = self._offset(n)
+                self._mm[off : off + self._record_size] = raw
+                first = raw[self._offsets[0] : self._offsets[1]]
+                if self._find_element(first) < 0:
+                    self._insert(
+                        self._mm,
+                        self._elements,
+                        self._capacity,
+                        _slot_hash(first),
+                        n,
+                    )
+                    self._used += 1
+            self._mm[: _HEADER.size] = self._header()
+
+    def items(self) -> Iterator[tuple[str, tuple]]:  # type: ignore
+        for n in range(self._count):
+            with self._lock:
+                entry = self._key(n).decode(), self._decode(n)
+            yield entry
+
+    def _set_classes(self, classes: tuple) -> None:
+        if len(classes) > 16 or any(c not in _CLASSES for c in classes):
+            raise TypeError("Unsupported GML/CRL entry")
+        self._classes = classes
+        self._offsets = self._offsets[:1]
+        for c in classes:
+            self._offsets.append(self._offsets[-1] + c.byte_size())
+        self._record_size = self._offsets[-1]
+
+    def _raw(self, n: int) -> bytes:
+        off = self._offset(n)
+        return self._mm[off : off + self._record_size]
+
+    def _find_element(self, data: bytes) -> int:
+        return self._find(
+            self._elements, _slot_hash(data), lambda n: self._field(n) == data
+        )
+
+    def flush(self) -> None:
+        if not self.readonly:
+            self._mm.flush()
+
+    def close(self) -> None:
+        with self._lock:
+            if not self._mm.closed:
+                self.flush()
+                self._mm.close()
+            self._file.close()
+
+    def __enter__(self: T) -> T:
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+
+GMLFile = ContainerFile
+CRLFile = ContainerFile
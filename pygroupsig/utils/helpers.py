@@ -1,35 +1,244 @@
 # mypy: disable-error-code="misc"
 
+import functools
+import hashlib
 import importlib
+import itertools
 import json
+import os
+import struct
+import threading
 from base64 import b64decode, b64encode
-from typing import Any, KeysView, Type, TypeVar
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    Any,
+    Callable,
+    Collection,
+    Iterable,
+    Iterator,
+    KeysView,
+    Sequence,
+    Type,
+    TypeVar,
+)
+
+from typing_extensions import Self
 
 from pygroupsig.interfaces import Container
-from pygroupsig.utils.mcl import Fr
+from pygroupsig.utils.mcl import (
+    G1,
+    G2,
+    GT,
+    Base,
+    FixedBaseTable,
+    Fr,
+    PrecomputedG2,
+)
 
 _SEQ = 3
 _START = 0
 
+## Binary wire format of the containers: a header (magic, version, scheme
+## id, container type id) followed by the fields in declaration order.
+## Scalars and group elements use their fixed serialized width, ints 8
+## bytes, lists a 2-byte count and a 1-byte item kind, str and dict (JSON)
+## a 4-byte length. Nested objects (e.g. spk proofs) are written field by
+## field. Ids are only ever appended to
+WIRE_MAGIC = b"\xa7GS"
+WIRE_VERSION = 1
+_WIRE_SCHEMES = (
+    "bbs04",
+    "ps16",
+    "cpy06",
+    "klap20",
+    "gl19",
+    "dl21",
+    "dl21seq",
+)
+_WIRE_TYPES = (
+    "GroupKey",
+    "ManagerKey",
+    "MemberKey",
+    "Signature",
+    "RevocationManagerKey",
+    "BlindKey",
+    "BlindSignature",
+)
+_LIST_FR = 0
+_LIST_STR = 1
+
 T = TypeVar("T", bound="Container")
 
 
+@functools.cache
+def _slot_names(cls: type) -> tuple[str, ...]:
+    names: list[str] = []
+    for klass in reversed(cls.__mro__):
+        slots = vars(klass).get("__slots__", ())
+        if isinstance(slots, str):
+            slots = (slots,)
+        names.extend(s for s in slots if s not in ("__dict__", "__weakref__"))
+    return tuple(names)
+
+
+def fields(obj: Any) -> dict[str, Any]:
+    """Field name -> value of a container, in declaration order.
+
+    Containers declare their fields in __slots__ (no per instance
+    __dict__), attributes of objects that still have one are included.
+    The slot order is the encoding order, so container __slots__ are not
+    sorted
+    """
+    ret = {
+        k: getattr(obj, k)
+        for k in _slot_names(type(obj))
+        if hasattr(obj, k)
+    }
+    if hasattr(obj, "__dict__"):
+        ret.update(vars(obj))
+    return ret
+
+
 class ReprMixin:
+    __slots__ = ()
+
     def __repr__(self) -> str:
-        rep = json.dumps({k: str(v) for k, v in vars(self).items()})
+        rep = json.dumps({k: str(v) for k, v in fields(self).items()})
         return f"{self.__class__} {rep}"
 
 
 class InfoMixin:
+    __slots__ = ()
+
     _name: str
     _container_name: str
 
     def info(self) -> tuple[str, str, KeysView]:
-        return self._name, self._container_name, vars(self).keys()
+        return self._name, self._container_name, fields(self).keys()
+
+
+def _pack_str(s: bytes) -> bytes:
+    return struct.pack("<I", len(s)) + s
+
+
+def _unpack_str(buffer: bytes, pos: int) -> tuple[bytes, int]:
+    (sz,) = struct.unpack_from("<I", buffer, pos)
+    pos += 4
+    if pos + sz > len(buffer):
+        raise ValueError("Truncated binary encoding")
+    return buffer[pos : pos + sz], pos + sz
+
+
+def _wire_encode(obj: Any) -> bytes:
+    dump = []
+    for v in fields(obj).values():
+        if isinstance(v, Base):
+            dump.append(v.to_bytes())
+        elif isinstance(v, int):
+            dump.append(struct.pack("<q", v))
+        elif isinstance(v, str):
+            dump.append(_pack_str(v.encode()))
+        elif isinstance(v, dict):
+            dump.append(_pack_str(json.dumps(v).encode()))
+        elif isinstance(v, list):
+            kind = _LIST_STR if v and isinstance(v[0], str) else _LIST_FR
+            dump.append(struct.pack("<HB", len(v), kind))
+            for el in v:
+                if kind == _LIST_STR:
+                    dump.append(_pack_str(el.encode()))
+                else:
+                    dump.append(el.to_bytes())
+        else:
+            dump.append(_wire_encode(v))
+    return b"".join(dump)
+
+
+def _wire_decode(
+    obj: Any, buffer: bytes, pos: int, only: Collection[str] | None = None
+) -> int:
+    for k, v in fields(obj).items():
+        if isinstance(v, Base):
+            sz = v.byte_size()
+            if pos + sz > len(buffer):
+                raise ValueError("Truncated binary encoding")
+            if only is None or k in only:
+                v.set_bytes(buffer[pos : pos + sz])
+            pos += sz
+        elif isinstance(v, int):
+            (i,) = struct.unpack_from("<q", buffer, pos)
+            setattr(obj, k, i)
+            pos += 8
+        elif isinstance(v, str):
+            s, pos = _unpack_str(buffer, pos)
+            setattr(obj, k, s.decode())
+        elif isinstance(v, dict):
+            s, pos = _unpack_str(buffer, pos)
+            setattr(obj, k, json.loads(s))
+        elif isinstance(v, list):
+            n, kind = struct.unpack_from("<HB", buffer, pos)
+            pos += 3
+            v.clear()
+            for _ in range(n):
+                if kind == _LIST_STR:
+                    s, pos = _unpack_str(buffer, pos)
+                    v.append(s.decode())
+                else:
+                    sz = Fr.byte_size()
+                    if pos + sz > len(buffer):
+                        raise ValueError("Truncated binary encoding")
+                    v.append(Fr.from_bytes(buffer[pos : pos + sz]))
+                    pos += sz
+        else:
+            pos = _wire_decode(v, buffer, pos)
+    return pos
 
 
 # noinspection PyUnresolvedReferences
 class B64Mixin:
+    __slots__ = ()
+
+    def _wire_header(self) -> bytes:
+        scheme_name = self.info()[0]  # type: ignore
+        return WIRE_MAGIC + bytes(
+            [
+                WIRE_VERSION,
+                _WIRE_SCHEMES.index(scheme_name) + 1,
+                _WIRE_TYPES.index(self.__class__.__name__) + 1,
+            ]
+        )
+
+    def to_bytes(self) -> bytes:
+        """Binary wire format, much more compact than to_b64()"""
+        return self._wire_header() + _wire_encode(self)
+
+    def _set_wire(self, s: bytes, only: Collection[str] | None = None) -> None:
+        header = self._wire_header()
+        if not s.startswith(WIRE_MAGIC):
+            raise ValueError("Invalid binary encoding")
+        if s[len(WIRE_MAGIC)] != WIRE_VERSION:
+            raise ValueError(f"Unsupported binary encoding v{s[3]}")
+        if s[: len(header)] != header:
+            scheme_name = self.info()[0]  # type: ignore
+            raise ValueError(
+                f"Expected a {scheme_name} {self.__class__.__name__}"
+            )
+        try:
+            pos = _wire_decode(self, s, len(header), only)
+        except struct.error as e:
+            raise ValueError("Truncated binary encoding") from e
+        if pos != len(s):
+            raise ValueError(f"{len(s) - pos} trailing bytes")
+
+    def set_bytes(self, s: bytes) -> None:
+        self._set_wire(s)
+
+    @classmethod
+    def from_bytes(cls: Type[T], s: bytes) -> T:
+        ret = cls()
+        ret.set_bytes(s)  # type: ignore
+        return ret
+
     def to_b64(self) -> str:
         scheme_name, container_name, var = self.info()  # type: ignore
         dump: dict[str, Any] = {}
@@ -51,11 +260,22 @@ class B64Mixin:
         return b64encode(json.dumps(msg).encode()).decode()
 
     def set_b64(self, s: str | bytes) -> None:
+        self._set_b64(s)
+
+    def _set_b64(
+        self, s: str | bytes, only: Collection[str] | None = None
+    ) -> None:
         if isinstance(s, str):
             s = s.encode()
         elif not isinstance(s, bytes):
             raise TypeError(f"Invalid {s} type. Expected str/bytes")
-        data = json.loads(b64decode(s))
+        ## The binary format is accepted as is or base64 encoded
+        if s.startswith(WIRE_MAGIC):
+            return self._set_wire(s, only)
+        raw = b64decode(s)
+        if raw.startswith(WIRE_MAGIC):
+            return self._set_wire(raw, only)
+        data = json.loads(raw)
         if "key" in data or "signature" in data:
             if "key" in data:
                 d = data["key"]
@@ -65,6 +285,8 @@ class B64Mixin:
         else:
             it = data
         for k, v in it.items():
+            if only is not None and k not in only:
+                continue
             obj = getattr(self, k)
             if isinstance(it[k], list):
                 obj.extend([Fr.from_b64(el) for el in it[k]])
@@ -81,6 +303,90 @@ class B64Mixin:
         ret.set_b64(s)
         return ret
 
+    @classmethod
+    def decode_fields(cls, s: str | bytes, only: Sequence[str]) -> tuple:
+        """Values of the fields listed in only, in that order, decoded
+        without the others. Deserializing a point checks its order, which
+        costs about as much as a scalar multiplication, so this is much
+        cheaper when a few fields are needed
+        """
+        ret = cls()
+        ret._set_b64(s, only)
+        return tuple(getattr(ret, k) for k in only)
+
+
+# noinspection PyUnresolvedReferences
+class PrecomputeMixin:
+    """Precomputations over the fixed elements of a group key.
+
+    Pairing tables of the G2 elements listed in _precompute (the fixed
+    pairing operands) are built when the key is loaded (or by the scheme
+    setup) unless a matching dump from precomputed_to_bytes() is given.
+    Comb tables of the elements listed in _fixed_base (the fixed bases of
+    scalar multiplications) are built lazily, once they have been used
+    often enough to pay off
+    """
+
+    __slots__ = ()
+
+    _precompute: tuple[str, ...] = ()
+    _fixed_base: tuple[str, ...] = ()
+
+    def precompute(self) -> None:
+        for v in self._precompute:
+            getattr(self, v).precompute()
+        self.fixed_base()
+
+    def fixed_base(self, lazy: int = FixedBaseTable.LAZY_USES) -> None:
+        for v in self._fixed_base:
+            getattr(self, v).fixed_base(lazy)
+
+    def precomputed_to_bytes(self) -> bytes:
+        dump = []
+        for v in self._precompute:
+            obj = getattr(self, v)
+            dump.append((obj.precomputed or obj.precompute()).to_bytes())
+        return b"".join(dump)
+
+    def set_b64(
+        self, s: str | bytes, precomputed: bytes | None = None
+    ) -> None:
+        super().set_b64(s)  # type: ignore
+        self._set_precomputed(precomputed)
+
+    def set_bytes(self, s: bytes, precomputed: bytes | None = None) -> None:
+        super().set_bytes(s)  # type: ignore
+        self._set_precomputed(precomputed)
+
+    def _set_precomputed(self, precomputed: bytes | None) -> None:
+        sz = PrecomputedG2.byte_size()
+        for i, v in enumerate(self._precompute):
+            obj = getattr(self, v)
+            if precomputed is not None:
+                table = precomputed[i * sz : (i + 1) * sz]
+                if len(table) == sz and obj.set_precomputed(
+                    PrecomputedG2.from_bytes(table)
+                ):
+                    continue
+            obj.precompute()
+        self.fixed_base()
+
+    @classmethod
+    def from_b64(
+        cls: Type[T], s: str | bytes, precomputed: bytes | None = None
+    ) -> T:
+        ret = cls()
+        ret.set_b64(s, precomputed)
+        return ret
+
+    @classmethod
+    def from_bytes(
+        cls: Type[T], s: bytes, precomputed: bytes | None = None
+    ) -> T:
+        ret = cls()
+        ret.set_bytes(s, precomputed)
+        return ret
+
 
 class JoinMixin:
     @staticmethod
@@ -92,7 +398,85 @@ class JoinMixin:
         return _START
 
 
+_versions = itertools.count(1)
+
+
+def new_version() -> int:
+    """Process-wide increasing number, tags each GML/CRL state"""
+    return next(_versions)
+
+
 class ContainerDict(dict):
+    """Member id -> tuple of elements (GML/CRL entries).
+
+    A reverse index from the serialized first element of each entry
+    (e.g. CPY06's A) to its member id is kept in sync with the dict,
+    imports included, so lookup() needs no scan. version changes with
+    every modification, so results derived from the entries can be cached
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__()
+        self._index: dict[bytes, Any] = {}
+        self.version = new_version()
+        self.update(*args, **kwargs)
+
+    def __reduce__(self) -> tuple:
+        return self.__class__, (dict(self),)
+
+    def _unindex(self, key: Any) -> None:
+        value = dict.__getitem__(self, key)
+        if value and self._index.get(value[0].to_bytes()) == key:
+            del self._index[value[0].to_bytes()]
+
+    def __setitem__(self, key: Any, value: tuple) -> None:
+        if key in self:
+            self._unindex(key)
+        super().__setitem__(key, value)
+        if value:
+            self._index[value[0].to_bytes()] = key
+        self.version = new_version()
+
+    def __delitem__(self, key: Any) -> None:
+        self._unindex(key)
+        super().__delitem__(key)
+        self.version = new_version()
+
+    def pop(self, key: Any, *default: Any) -> Any:
+        if key in self:
+            self._unindex(key)
+            self.version = new_version()
+        return super().pop(key, *default)
+
+    def popitem(self) -> tuple[Any, tuple]:
+        key, value = super().popitem()
+        if value and self._index.get(value[0].to_bytes()) == key:
+            del self._index[value[0].to_bytes()]
+        self.version = new_version()
+        return key, value
+
+    def clear(self) -> None:
+        super().clear()
+        self._index.clear()
+        self.version = new_version()
+
+    def update(self, *args: Any, **kwargs: Any) -> None:  # type: ignore
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+    def setdefault(self, key: Any, default: Any = None) -> Any:
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def __ior__(self, other: Any) -> Self:  # type: ignore
+        self.update(other)
+        return self
+
+    def lookup(self, element: Any) -> Any | None:
+        """Member id of the entry whose first element equals element"""
+        return self._index.get(element.to_bytes())
+
     def to_b64(self) -> str:
         exp = {}
         for el, values in self.items():
@@ -130,21 +514,273 @@ GML = ContainerDict
 CRL = ContainerDict
 
 
+class LRUCache:
+    """Bounded, thread-safe LRU mapping with hit and miss counters.
+    maxsize=0 disables it
+    """
+
+    def __init__(self, maxsize: int = 1024) -> None:
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[Any, Any] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def lookup(self, k: Any) -> tuple[bool, Any]:
+        """(True, value) on a hit, (False, None) on a miss"""
+        with self._lock:
+            if k in self._entries:
+                self._entries.move_to_end(k)
+                self.hits += 1
+                return True, self._entries[k]
+            self.misses += 1
+            return False, None
+
+    def store(self, k: Any, value: Any) -> None:
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self._entries[k] = value
+            self._entries.move_to_end(k)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def discard(self, k: Any) -> None:
+        with self._lock:
+            self._entries.pop(k, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> dict[str, int | float]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
+
+
+class SignatureCache(LRUCache):
+    """Decoded signatures keyed by the sha256 of their encoding, so a
+    signature going through verify, open and trace is only parsed once.
+    Cached containers are shared and must not be modified
+    """
+
+    def get(self, cls: Type[T], s: str | bytes) -> T:
+        if isinstance(s, str):
+            s = s.encode()
+        elif not isinstance(s, bytes):
+            raise TypeError(f"Invalid {s} type. Expected str/bytes")
+        k = (cls, hashlib.sha256(s).digest())
+        hit, ret = self.lookup(k)
+        if not hit:
+            ## Parsed outside the lock, invalid encodings are not cached
+            ret = cls.from_b64(s)  # type: ignore
+            self.store(k, ret)
+        return ret
+
+
+signature_cache = SignatureCache()
+
+_pool: ThreadPoolExecutor | None = None
+_pool_lock = threading.Lock()
+
+
+def thread_pool() -> ThreadPoolExecutor:
+    """Pool shared by the scans over GML/CRL entries. The mcl calls
+    release the GIL, so the scans run in parallel
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ThreadPoolExecutor(
+                max_workers=os.cpu_count() or 1,
+                thread_name_prefix="pygroupsig",
+            )
+        return _pool
+
+
+def parallel_find(
+    items: Sequence[Any],
+    match: Callable[[Any], bool],
+    workers: int | None = None,
+) -> int:
+    """Index of an item for which match() is true, -1 if none.
+
+    The items are split in one chunk per worker (default: one per CPU),
+    scanned by thread_pool(). Workers stop as soon as any of them finds a
+    match, so with several matches any of them may be returned. Must not
+    be called from the pool itself
+    """
+    n = len(items)
+    workers = min(workers or os.cpu_count() or 1, n)
+    if workers <= 1:
+        for i, item in enumerate(items):
+            if match(item):
+                return i
+        return -1
+
+    found = threading.Event()
+
+    def scan(start: int, stop: int) -> int:
+        for i in range(start, stop):
+            if found.is_set():
+                break
+            if match(items[i]):
+                found.set()
+                return i
+        return -1
+
+    step = -(-n // workers)
+    futures = [
+        thread_pool().submit(scan, start, min(start + step, n))
+        for start in range(0, n, step)
+    ]
+    ret = -1
+    for future in futures:
+        i = future.result()
+        if ret < 0:
+            ret = i
+    return ret
+
+
+def parallel_map(
+    func: Callable[[Any], Any],
+    items: Iterable[Any],
+    workers: int | None = None,
+    chunk: int = 64,
+) -> Iterator[Any]:
+    """func(item) for each item, yielded in order.
+
+    The items are read and computed by chunks on thread_pool() (default:
+    one worker per CPU). At most two chunks per worker are in flight, so
+    long streams are neither read nor buffered in full. Must not be
+    called from the pool itself
+    """
+    workers = workers or os.cpu_count() or 1
+    it = iter(items)
+    if workers <= 1:
+        for item in it:
+            yield func(item)
+        return
+
+    def run(batch: list[Any]) -> list[Any]:
+        return [func(item) for item in batch]
+
+    pending: deque = deque()
+    while True:
+        while len(pending) < 2 * workers:
+            batch = list(itertools.islice(it, chunk))
+            if not batch:
+                break
+            pending.append(thread_pool().submit(run, batch))
+        if not pending:
+            return
+        yield from pending.popleft().result()
+
+
+def pairing_find(
+    P: G1,
+    Qs: Sequence[G2],
+    target: GT,
+    workers: int | None = None,
+    check: Callable[[int], bool] | None = None,
+) -> int:
+    """Index of a point Q of Qs with e(P,Q) == target (and check(index)
+    true, for extra conditions only worth testing on a match), -1 if none.
+
+    This is the member scan of the opening algorithms: P comes from the
+    signature and Qs from the GML. P is normalized once, so the Miller
+    loops do not convert it again, and the scan runs through
+    parallel_find() with early stop
+    """
+    P = G1.from_object(P).normalize()
+
+    def match(i: int) -> bool:
+        if GT.pairing(P, Qs[i]) != target:
+            return False
+        return check is None or check(i)
+
+    return parallel_find(range(len(Qs)), match, workers)
+
+
+class OpeningTable:
+    """Per member values used by open(), derived once from the GML entries
+    with derive(entry) and cached.
+
+    sync() only derives the entries added since the last call, unless the
+    GML object was replaced or `key` (e.g. the opener key the values
+    depend on) changed. store() adds an entry to the GML and, if the table
+    was in sync, to the table as well. Entries are not expected to change
+    once added (member ids are digests of them)
+    """
+
+    __slots__ = ("_derive", "_state", "_values")
+
+    def __init__(self, derive: Callable[[tuple], Any]) -> None:
+        self._derive = derive
+        self._values: dict[str, Any] = {}
+        self._state: tuple | None = None
+
+    @staticmethod
+    def _gml_state(gml: Any, key: tuple) -> tuple:
+        return id(gml), getattr(gml, "version", None), key
+
+    def sync(self, gml: Any, key: tuple = ()) -> dict[str, Any]:
+        """Values of every GML member, by member id"""
+        state = self._gml_state(gml, key)
+        if state == self._state:
+            return self._values
+        if self._state is None or self._state[::2] != state[::2]:
+            self._values = {}
+        values = {}
+        for mem_id, entry in gml.items():
+            value = self._values.get(mem_id)
+            values[mem_id] = self._derive(entry) if value is None else value
+        self._values = values
+        self._state = state
+        return values
+
+    def store(
+        self, gml: Any, mem_id: str, entry: tuple, key: tuple = ()
+    ) -> None:
+        synced = self._state == self._gml_state(gml, key)
+        gml[mem_id] = entry
+        if synced:
+            self._values[mem_id] = self._derive(entry)
+            self._state = self._gml_state(gml, key)
+
+
 class MetadataGroupKeyMixin:
+    __slots__ = ()
     _container_name = "group"
 
 
 class MetadataManagerKeyMixin:
+    __slots__ = ()
     _container_name = "manager"
 
 
 class MetadataMemberKeyMixin:
+    __slots__ = ()
     _container_name = "member"
 
 
 class MetadataBlindKeyMixin:
+    __slots__ = ()
     _container_name = "blind"
 
 
 class MetadataSignatureMixin:
+    __slots__ = ()
     _container_name = "signature"
@@ -1,9 +1,9 @@
 # mypy: disable-error-code="misc,attr-defined,type-var,operator"
 
 import ctypes
-import logging
+import threading
 from base64 import b64decode, b64encode
-from typing import Any, Type, TypeVar
+from typing import Any, Sequence, Type, TypeVar
 
 from typing_extensions import Self
 
@@ -11,12 +11,44 @@ import pygroupsig.utils.constants as ct
 
 T = TypeVar("T", bound="Base")
 
+# Prototype of a mcl function: (symbol, argtypes, restype).
+# A symbol of None means MCL.format(<class name>, <function name>).
+# In argtypes, "self" stands for a pointer to the bound class and any other
+# string for a pointer to the class of that name. Both are resolved when
+# the tables are bound in load_library()
+Prototype = tuple[str | None, list[Any], Any]
+SELF = "self"
+
 
 class Base(ctypes.Structure):
     # ffi/go/lib/lib.go
     BUFFER_SZ: int = 2048
     MCL: str = "mclBn{}_{}"
 
+    _PROTOTYPES: dict[str, Prototype] = {
+        "isZero": (None, [SELF], ctypes.c_int),
+        "isEqual": (None, [SELF, SELF], ctypes.c_int),
+        "neg": (None, [SELF, SELF], None),
+        "add": (None, [SELF, SELF, SELF], None),
+        "sub": (None, [SELF, SELF, SELF], None),
+        "mul": (None, [SELF, SELF, SELF], None),
+        "serialize": (
+            None,
+            [ctypes.c_char_p, ctypes.c_size_t, SELF],
+            ctypes.c_size_t,
+        ),
+        "deserialize": (
+            None,
+            [SELF, ctypes.c_char_p, ctypes.c_size_t],
+            ctypes.c_size_t,
+        ),
+        "byteSize": ("mclBn_get{}ByteSize", [], ctypes.c_int),
+    }
+    # Prototyped mcl functions of the class, filled by bind(), and the
+    # symbols of the prototypes the library does not export
+    _funcs: dict[str, Any] = {}
+    _missing: dict[str, str] = {}
+
     def __str__(self) -> str:
         return f"{self.__class__} {self.get_str()}"
 
@@ -32,55 +64,61 @@ class Base(ctypes.Structure):
     def is_equal(self, y: Self) -> bool:
         return self.__eq__(y)
 
+    ## Arithmetic. Every binary operation has three flavours:
+    ## x + y allocates the result, x.add(y, out=z) writes it into z (which
+    ## may be x or y) and x.iadd(y) (also x += y) overwrites x
     def __neg__(self) -> Self:
         return self._call("neg", ret=True)
 
-    def neg(self) -> Self:
-        return self.__neg__()
+    def neg(self, out: Self | None = None) -> Self:
+        return self._call("neg", ret=True, out=out)
+
+    def ineg(self) -> Self:
+        return self._call("neg", ret=True, out=self)
 
     def __add__(self, y: Self) -> Self:
         return self._call("add", y, ret=True)
 
-    def add(self, y: Self) -> Self:
-        return self.__add__(y)
+    def add(self, y: Self, out: Self | None = None) -> Self:
+        return self._call("add", y, ret=True, out=out)
+
+    def iadd(self, y: Self) -> Self:
+        return self._call("add", y, ret=True, out=self)
+
+    def __iadd__(self, y: Self) -> Self:
+        return self.iadd(y)
 
     def __sub__(self, y: Self) -> Self:
         return self._call("sub", y, ret=True)
 
-    def sub(self, y: Self) -> Self:
-        return self.__sub__(y)
+    def sub(self, y: Self, out: Self | None = None) -> Self:
+        return self._call("sub", y, ret=True, out=out)
+
+    def isub(self, y: Self) -> Self:
+        return self._call("sub", y, ret=True, out=self)
+
+    def __isub__(self, y: Self) -> Self:
+        return self.isub(y)
 
     def __mul__(self, y: Self) -> Self:
         return self._call("mul", y, ret=True)
 
-    def mul(self, y: Self) -> Self:
-        return self.__mul__(y)
+    def mul(self, y: Self, out: Self | None = None) -> Self:
+        return self._call("mul", y, ret=True, out=out)
+
+    def imul(self, y: Self) -> Self:
+        return self._call("mul", y, ret=True, out=self)
+
+    def __imul__(self, y: Self) -> Self:
+        return self.imul(y)
 
     def to_bytes(self) -> bytes:
-        func = self._func(
-            "serialize",
-            [
-                ctypes.c_char_p,
-                ctypes.c_size_t,
-                ctypes.POINTER(self.__class__),
-            ],
-            ctypes.c_size_t,
-        )
         buffer = ctypes.create_string_buffer(self.BUFFER_SZ)
-        sz = func(buffer, self.BUFFER_SZ, self)
+        sz = self._func("serialize")(buffer, self.BUFFER_SZ, self)
         return buffer.raw[:sz]
 
     def set_bytes(self, buffer: bytes) -> None:
-        func = self._func(
-            "deserialize",
-            [
-                ctypes.POINTER(self.__class__),
-                ctypes.c_char_p,
-                ctypes.c_size_t,
-            ],
-            ctypes.c_size_t,
-        )
-        func(self, buffer, len(buffer))
+        self._func("deserialize")(self, buffer, len(buffer))
 
     @classmethod
     def from_bytes(cls: Type[T], buffer: bytes) -> T:
@@ -108,17 +146,23 @@ class Base(ctypes.Structure):
         return ret
 
     def set_object(self, y: Self) -> None:
-        return self.set_bytes(y.to_bytes())
+        # Elements are plain fixed-size limb structs: copying the memory is
+        # enough, no need to serialize and deserialize (and revalidate) them
+        if not isinstance(y, self.__class__):
+            return self.set_bytes(y.to_bytes())
+        ctypes.memmove(
+            ctypes.addressof(self), ctypes.addressof(y), ctypes.sizeof(self)
+        )
 
     @classmethod
     def from_object(cls: Type[T], y: T) -> T:
-        return cls.from_bytes(y.to_bytes())
+        if not isinstance(y, cls):
+            return cls.from_bytes(y.to_bytes())
+        return cls.from_buffer_copy(y)
 
     @classmethod
     def byte_size(cls: Type[T]) -> int:
-        func = getattr(ct.lib, f"mclBn_get{cls.__name__}ByteSize")
-        func.restype = ctypes.c_int
-        return func()
+        return cls._func("byteSize")()
 
     def to_file(self, file: str) -> None:
         with open(file, "w") as f:
@@ -134,14 +178,16 @@ class Base(ctypes.Structure):
         ret.set_file(file)
         return ret
 
-    def _call(self, fn: str, y: Self | None = None, ret: bool = False) -> Any:
-        argtypes = [ctypes.POINTER(self.__class__)] * (1 if y is None else 2)
-        restype = None if ret else ctypes.c_int
-        if ret:
-            argtypes.append(ctypes.POINTER(self.__class__))
-        func = self._func(fn, argtypes, restype)
+    def _call(
+        self,
+        fn: str,
+        y: Any | None = None,
+        ret: bool = False,
+        out: Self | None = None,
+    ) -> Any:
+        func = self._func(fn)
         if ret:
-            obj = self.__class__()
+            obj = self.__class__() if out is None else out
             if y is None:
                 func(obj, self)
             else:
@@ -152,33 +198,74 @@ class Base(ctypes.Structure):
                 return func(self)
             return func(self, y)
 
-    def _func(
-        self, fn: str, argtypes: list[Any], restype: Any | None = None
-    ) -> Any:
-        func = getattr(ct.lib, self.MCL.format(self.__class__.__name__, fn))
-        func.argtypes = argtypes
-        func.restype = restype
-        return func
+    @classmethod
+    def _func(cls, fn: str) -> Any:
+        try:
+            return cls._funcs[fn]
+        except KeyError:
+            if fn in cls._missing:
+                raise RuntimeError(
+                    f"{cls.__name__}.{fn}() is not available:"
+                    f" {cls._missing[fn]} is not in the mcl library"
+                ) from None
+            raise RuntimeError(
+                f"{cls.__name__}.{fn}() is not bound."
+                " Was load_library() called?"
+            ) from None
+
+    @classmethod
+    def bind(cls, lib: ctypes.CDLL) -> None:
+        """Build the table of prototyped mcl functions of this class"""
+        prototypes: dict[str, Prototype] = {}
+        # Mixins listed first in the bases override Base prototypes
+        for klass in reversed(cls.__mro__):
+            prototypes.update(vars(klass).get("_PROTOTYPES", {}))
+        funcs = {}
+        missing = {}
+        for fn, (symbol, argtypes, restype) in prototypes.items():
+            name = (symbol or cls.MCL).format(cls.__name__, fn)
+            try:
+                # lib[...] returns a fresh function pointer, so prototypes
+                # of different classes never clobber each other
+                func = lib[name]
+            except AttributeError:
+                # Not every class has every function (e.g. GT has no
+                # mulVec), _func() names the symbol if it is used
+                missing[fn] = name
+                continue
+            func.argtypes = [
+                ctypes.POINTER(cls if a == SELF else globals()[a])
+                if isinstance(a, str)
+                else a
+                for a in argtypes
+            ]
+            func.restype = restype
+            funcs[fn] = func
+        cls._funcs = funcs
+        cls._missing = missing
 
 
 # noinspection PyUnresolvedReferences
 class StrMixin:
+    _PROTOTYPES: dict[str, Prototype] = {
+        "setStr": (
+            None,
+            [SELF, ctypes.c_char_p, ctypes.c_size_t, ctypes.c_int],
+            ctypes.c_int,
+        ),
+        "getStr": (
+            None,
+            [ctypes.c_char_p, ctypes.c_size_t, SELF, ctypes.c_int],
+            ctypes.c_int,
+        ),
+    }
+
     def set_str(self, s: str | bytes, mode: int = 10) -> None:
         if isinstance(s, str):
             s = s.encode()
         elif not isinstance(s, bytes):
             raise TypeError(f"Invalid {s} type. Expected str/bytes")
-        func = self._func(
-            "setStr",
-            [
-                ctypes.POINTER(self.__class__),
-                ctypes.c_char_p,
-                ctypes.c_size_t,
-                ctypes.c_int,
-            ],
-            ctypes.c_int,
-        )
-        if func(self, s, len(s), mode):
+        if self._func("setStr")(self, s, len(s), mode):
             raise RuntimeError(
                 f"Failed to call {self.__class__.__name__}.setStr()"
             )
@@ -191,17 +278,7 @@ class StrMixin:
 
     def get_str(self, mode: int = 10) -> str:
         buf = ctypes.create_string_buffer(self.BUFFER_SZ)
-        func = self._func(
-            "getStr",
-            [
-                ctypes.c_char_p,
-                ctypes.c_size_t,
-                ctypes.POINTER(self.__class__),
-                ctypes.c_int,
-            ],
-            ctypes.c_int,
-        )
-        if not func(buf, self.BUFFER_SZ, self, mode):
+        if not self._func("getStr")(buf, self.BUFFER_SZ, self, mode):
             raise RuntimeError(
                 f"Failed to call {self.__class__.__name__}.getStr()"
             )
@@ -210,21 +287,22 @@ class StrMixin:
 
 # noinspection PyUnresolvedReferences
 class HashRandomCmpMixin:
+    _PROTOTYPES: dict[str, Prototype] = {
+        "setHashOf": (
+            None,
+            [SELF, ctypes.c_char_p, ctypes.c_size_t],
+            ctypes.c_int,
+        ),
+        "setByCSPRNG": (None, [SELF], ctypes.c_int),
+        "cmp": (None, [SELF, SELF], ctypes.c_int),
+    }
+
     def set_hash(self, s: str | bytes) -> None:
         if isinstance(s, str):
             s = bytes(bytearray.fromhex(s))
         elif not isinstance(s, bytes):
             raise TypeError(f"Invalid {s} type. Expected str/bytes")
-        func = self._func(
-            "setHashOf",
-            [
-                ctypes.POINTER(self.__class__),
-                ctypes.c_char_p,
-                ctypes.c_size_t,
-            ],
-            ctypes.c_int,
-        )
-        if func(self, s, len(s)):
+        if self._func("setHashOf")(self, s, len(s)):
             raise RuntimeError(
                 f"Failed to call {self.__class__.__name__}.setHashOf()"
             )
@@ -236,12 +314,7 @@ class HashRandomCmpMixin:
         return ret
 
     def set_random(self) -> None:
-        func = self._func(
-            "setByCSPRNG",
-            [ctypes.POINTER(self.__class__)],
-            ctypes.c_int,
-        )
-        if func(self):
+        if self._func("setByCSPRNG")(self):
             raise RuntimeError(
                 f"Failed to {self.__class__.__name__}.setByCSPNRG()"
             )
@@ -270,90 +343,258 @@ class HashRandomCmpMixin:
 
 # noinspection PyUnresolvedReferences
 class OneInvDivMixin:
+    _PROTOTYPES: dict[str, Prototype] = {
+        "isOne": (None, [SELF], ctypes.c_int),
+        "inv": (None, [SELF, SELF], None),
+        "div": (None, [SELF, SELF, SELF], None),
+    }
+
     def is_one(self) -> bool:
         return bool(self._call("isOne"))
 
     def __invert__(self) -> Self:
         return self._call("inv", ret=True)
 
-    def inv(self) -> Self:
-        return self.__invert__()
+    def inv(self, out: Self | None = None) -> Self:
+        return self._call("inv", ret=True, out=out)
+
+    def iinv(self) -> Self:
+        return self._call("inv", ret=True, out=self)
 
     def __truediv__(self, y: Self) -> Self:
         return self._call("div", y, ret=True)
 
-    def div(self, y: Self) -> Self:
-        return self.__truediv__(y)
+    def div(self, y: Self, out: Self | None = None) -> Self:
+        return self._call("div", y, ret=True, out=out)
+
+    def idiv(self, y: Self) -> Self:
+        return self._call("div", y, ret=True, out=self)
+
+    def __itruediv__(self, y: Self) -> Self:
+        return self.idiv(y)
 
 
 # noinspection PyUnresolvedReferences
 class MulFrMixin:
-    def __mul__(self, y: "Fr") -> Self:
-        func = self._func(
-            "mul", [ctypes.POINTER(self.__class__)] * 2 + [ctypes.POINTER(Fr)]
-        )
-        ret = self.__class__()
-        func(ret, self, y)
-        return ret
+    _PROTOTYPES: dict[str, Prototype] = {
+        "mul": (None, [SELF, SELF, "Fr"], None),
+        "normalize": (None, [SELF, SELF], None),
+        "normalizeVec": (None, [SELF, SELF, ctypes.c_size_t], None),
+    }
+
+    def _mul(self, y: "Fr", out: Self | None) -> Self:
+        fixed = getattr(self, "_fixed_base", None)
+        if fixed is not None and fixed.ready(self):
+            return fixed.mul(y, self.__class__() if out is None else out)
+        return self._call("mul", y, ret=True, out=out)
 
-    def mul(self, y: "Fr") -> Self:
-        return self.__mul__(y)
+    def __mul__(self, y: "Fr") -> Self:
+        return self._mul(y, None)
+
+    def mul(self, y: "Fr", out: Self | None = None) -> Self:
+        return self._mul(y, out)
+
+    def imul(self, y: "Fr") -> Self:
+        return self._mul(y, self)
+
+    def __imul__(self, y: "Fr") -> Self:
+        return self.imul(y)
+
+    def normalize(self) -> Self:
+        """Convert the point to affine coordinates in place. Pairings and
+        additions with affine points skip the conversion"""
+        self._func("normalize")(self, self)
+        return self
+
+    def fixed_base(self, lazy: int = 0) -> "FixedBaseTable":
+        """Multiply by this point through a comb table, built right away or
+        after `lazy` multiplications (see FixedBaseTable)"""
+        self._fixed_base = FixedBaseTable(self, lazy)
+        return self._fixed_base
+
+
+class FixedBaseTable:
+    """Comb table of a fixed G1/G2 point for scalar multiplications.
+
+    x*P is the sum of one precomputed multiple d*256^j*P per byte d of x,
+    i.e. 32 additions instead of a generic multiplication, which is about
+    twice as fast. The table (256 points per byte) costs as much as a few
+    hundred multiplications, so it can be built lazily after LAZY_USES
+    uses. It is rebuilt if the point changes
+
+    Memory: 32*256 affine points, i.e. about 1.2 MB per G1 point and
+    2.4 MB per G2 point, for every group instance in every process. Lazy
+    tables are not built when PYGROUPSIG_FIXED_BASE=0
+    """
+
+    LAZY_USES: int = 256
+    WINDOW: int = 256
+
+    def __init__(self, base: Any, lazy: int = 0) -> None:
+        self.lazy = lazy
+        self.uses = 0
+        self.rows: list[ctypes.Array] | None = None
+        # Raw limbs of the point, to detect later changes of the point
+        self._base = bytes(base)
+        # Concurrent first uses (parallel_map, ...) build a single table
+        self._lock = threading.Lock()
+        if lazy <= 0:
+            self.build(base)
+
+    def build(self, base: Any) -> None:
+        cls = base.__class__
+        add = cls._func("add")
+        b = cls.from_object(base)
+        rows = []
+        for _ in range(Fr.byte_size()):
+            row = (cls * self.WINDOW)()
+            for d in range(1, self.WINDOW):
+                add(row[d], row[d - 1], b)
+            # Additions of affine points are cheaper
+            cls._func("normalizeVec")(row, row, self.WINDOW)
+            # b = 256*b
+            add(b, row[self.WINDOW - 1], b)
+            rows.append(row)
+        self.rows = rows
+
+    def ready(self, base: Any) -> bool:
+        """Whether the table of base can be used, building it if due"""
+        raw = bytes(base)
+        if self.rows is not None and raw == self._base:
+            return True
+        with self._lock:
+            if raw != self._base:
+                self._base = raw
+                self.rows = None
+                self.uses = 0
+            if self.rows is None:
+                self.uses += 1
+                if self.uses <= self.lazy or (
+                    self.lazy > 0 and not ct.FIXED_BASE_TABLES
+                ):
+                    return False
+                self.build(base)
+        return True
+
+    def mul(self, y: "Fr", out: Any) -> Any:
+        add = out._func("add")
+        # All-zero limbs are the point at infinity
+        ctypes.memset(ctypes.addressof(out), 0, ctypes.sizeof(out))
+        # Fr serializes as 32 little endian bytes, one per table row
+        for row, d in zip(self.rows, y.to_bytes()):
+            if d:
+                add(out, out, row[d])
+        return out
 
 
 class MulVecMixin:
+    _PROTOTYPES: dict[str, Prototype] = {
+        "mulVec": (None, [SELF, SELF, "Fr", ctypes.c_size_t], None),
+    }
+
     @classmethod
-    def muln(cls: Type[T], x: ctypes.Array[T], y: ctypes.Array["Fr"]) -> T:
+    def muln(
+        cls: Type[T],
+        x: Sequence[T] | ctypes.Array[T],
+        y: Sequence["Fr"] | ctypes.Array["Fr"],
+        out: T | None = None,
+    ) -> T:
+        """Sum of the products x[i] * y[i] (multi-scalar multiplication).
+
+        Python sequences are accepted as well as ctypes arrays, so linear
+        combinations such as a*r - b*s can be written as
+        muln([a, b], [r, -s]) instead of one multiplication per term
+        """
         if len(x) != len(y):
-            logging.warn(f"muln: len(x)={len(x)} != len(y)={len(y)}")
-        ret = cls()
-        func = ret._func(  # noqa
-            "mulVec",
-            [ctypes.POINTER(cls)] * 2 + [ctypes.POINTER(Fr), ctypes.c_size_t],
-        )
-        func(ret, x, y, min(len(x), len(y)))
+            raise ValueError(f"muln: len(x)={len(x)} != len(y)={len(y)}")
+        n = len(x)
+        ret = cls() if out is None else out
+        if isinstance(x, ctypes.Array) and isinstance(y, ctypes.Array):
+            cls._func("mulVec")(ret, x, y, n)
+            return ret
+
+        ## Points with a fixed-base table are cheaper through it than as a
+        ## term of mulVec, the rest share a single mulVec call
+        plain, fixed = [], []
+        for i in range(n):
+            table = getattr(x[i], "_fixed_base", None)
+            if table is not None and table.ready(x[i]):
+                fixed.append((table, y[i]))
+            else:
+                plain.append(i)
+        if len(plain) > 1:
+            m = len(plain)
+            xs = (cls * m)(*[x[i] for i in plain])
+            ys = (Fr * m)(*[y[i] for i in plain])
+            cls._func("mulVec")(ret, xs, ys, m)
+        elif plain:
+            cls._func("mul")(ret, x[plain[0]], y[plain[0]])
+        elif fixed:
+            table, z = fixed.pop()
+            table.mul(z, ret)
+        else:
+            ctypes.memset(ctypes.addressof(ret), 0, ctypes.sizeof(ret))
+        if fixed:
+            aux = cls()
+            for table, z in fixed:
+                ret.iadd(table.mul(z, aux))
         return ret
 
 
 # noinspection PyUnresolvedReferences
 class PowMixin:
+    _PROTOTYPES: dict[str, Prototype] = {
+        "pow": (None, [SELF, SELF, SELF], None),
+    }
+
     def __pow__(self, y: Self) -> Self:
         return self._call("pow", y, ret=True)
 
-    def pow(self, y: Self) -> Self:
-        return self.__pow__(y)
+    def pow(self, y: Self, out: Self | None = None) -> Self:
+        return self._call("pow", y, ret=True, out=out)
+
+    def ipow(self, y: Self) -> Self:
+        return self._call("pow", y, ret=True, out=self)
+
+    def __ipow__(self, y: Self) -> Self:
+        return self.ipow(y)
 
 
 # noinspection PyUnresolvedReferences
 class PowFrMixin:
+    _PROTOTYPES: dict[str, Prototype] = {
+        "pow": (None, [SELF, SELF, "Fr"], None),
+    }
+
     def __pow__(self, y: "Fr") -> Self:
-        func = self._func(
-            "pow", [ctypes.POINTER(self.__class__)] * 2 + [ctypes.POINTER(Fr)]
-        )
-        ret = self.__class__()
-        func(ret, self, y)
-        return ret
+        return self._call("pow", y, ret=True)
+
+    def pow(self, y: "Fr", out: Self | None = None) -> Self:
+        return self._call("pow", y, ret=True, out=out)
 
-    def pow(self, y: "Fr") -> Self:
-        return self.__pow__(y)
+    def ipow(self, y: "Fr") -> Self:
+        return self._call("pow", y, ret=True, out=self)
+
+    def __ipow__(self, y: "Fr") -> Self:
+        return self.ipow(y)
 
 
 # noinspection PyUnresolvedReferences
 class HashAndMapMixin:
+    _PROTOTYPES: dict[str, Prototype] = {
+        "hashAndMapTo": (
+            None,
+            [SELF, ctypes.c_char_p, ctypes.c_size_t],
+            ctypes.c_int,
+        ),
+    }
+
     def set_hash(self, s: str | bytes) -> None:
         if isinstance(s, str):
             s = bytes(bytearray.fromhex(s))
         elif not isinstance(s, bytes):
             raise TypeError(f"Invalid {s} type. Expected str/bytes")
-        func = self._func(
-            "hashAndMapTo",
-            [
-                ctypes.POINTER(self.__class__),
-                ctypes.c_char_p,
-                ctypes.c_size_t,
-            ],
-            ctypes.c_int,
-        )
-        if func(self, s, len(s)):
+        if self._func("hashAndMapTo")(self, s, len(s)):
             raise RuntimeError(
                 f"Failed to call {self.__class__.__name__}.hashAndMapTo()"
             )
@@ -367,13 +608,14 @@ class HashAndMapMixin:
 
 # noinspection PyUnresolvedReferences
 class IntMixin:
+    _PROTOTYPES: dict[str, Prototype] = {
+        "setInt": (None, [SELF, ctypes.c_int64], ctypes.c_int),
+    }
+
     def set_int(self, i: int) -> None:
         if not isinstance(i, int):
             raise TypeError(f"Invalid {i} type. Expected int")
-        func = self._func(
-            "setInt", [ctypes.POINTER(self.__class__), ctypes.c_int64]
-        )
-        func(self, i)
+        self._func("setInt")(self, i)
 
     @classmethod
     def from_int(cls: Type[T], i: int) -> T:
@@ -462,35 +704,241 @@ class G2(
 ):
     _fields_ = [("x", Fp2), ("y", Fp2), ("z", Fp2)]
 
+    _PROTOTYPES: dict[str, Prototype] = {
+        "precompute": (
+            "mclBn_precomputeG2",
+            [ctypes.POINTER(ctypes.c_uint64), SELF],
+            None,
+        ),
+        "precomputeSize": (
+            "mclBn_getUint64NumToPrecompute",
+            [],
+            ctypes.c_int,
+        ),
+    }
+
+    def precompute(self) -> "PrecomputedG2":
+        """Attach a pairing table of this point.
+
+        GT.pairing() and GT.multi_pairing() use it as long as the point is
+        not modified afterwards
+        """
+        # Normalized points have a unique representation, the same one
+        # deserialized points get, so tables can be matched to reloaded keys
+        self.normalize()
+        self._precomputed = PrecomputedG2(self)
+        return self._precomputed
+
+    def set_precomputed(self, table: "PrecomputedG2") -> bool:
+        """Attach an existing table, if it was computed for this point"""
+        if not table.matches(self):
+            return False
+        self._precomputed = table
+        return True
+
+    @property
+    def precomputed(self) -> "PrecomputedG2 | None":
+        table = getattr(self, "_precomputed", None)
+        if table is None or not table.matches(self):
+            return None
+        return table
+
+
+class PrecomputedG2:
+    """Miller loop lines of a fixed G2 point (mclBn_precomputeG2).
+
+    The point and the table are kept as raw machine words, so the serialized
+    form is only meant to be loaded back by the same mcl build (e.g. to skip
+    the precomputation at startup). A loaded table is only used with the
+    exact point it was computed for
+    """
+
+    def __init__(self, base: G2, table: ctypes.Array | None = None) -> None:
+        # Raw limbs of the point, to detect later changes of the point
+        self._base = bytes(base)
+        if table is None:
+            table = (ctypes.c_uint64 * self.size())()
+            G2._func("precompute")(table, base)
+        self.table = table
+
+    @staticmethod
+    def size() -> int:
+        return G2._func("precomputeSize")()
+
+    @property
+    def base(self) -> G2:
+        return G2.from_buffer_copy(self._base)
+
+    def matches(self, q: G2) -> bool:
+        return bytes(q) == self._base
+
+    def to_bytes(self) -> bytes:
+        return self._base + bytes(self.table)
+
+    @classmethod
+    def byte_size(cls) -> int:
+        return ctypes.sizeof(G2) + cls.size() * ctypes.sizeof(ctypes.c_uint64)
+
+    @classmethod
+    def from_bytes(cls, buffer: bytes) -> "PrecomputedG2":
+        if len(buffer) != cls.byte_size():
+            raise ValueError(
+                f"Invalid precomputed table size {len(buffer)}."
+                f" Expected {cls.byte_size()}"
+            )
+        sz = ctypes.sizeof(G2)
+        table = (ctypes.c_uint64 * cls.size()).from_buffer_copy(buffer, sz)
+        return cls(G2.from_buffer_copy(buffer[:sz]), table)
+
+    def to_b64(self) -> str:
+        return b64encode(self.to_bytes()).decode()
+
+    @classmethod
+    def from_b64(cls, s: str | bytes) -> "PrecomputedG2":
+        if isinstance(s, str):
+            s = s.encode()
+        elif not isinstance(s, bytes):
+            raise TypeError(f"Invalid {s} type. Expected str/bytes")
+        return cls.from_bytes(b64decode(s))
+
 
 class GT(StrMixin, OneInvDivMixin, MulVecMixin, PowFrMixin, IntMixin, Base):
     D: int = 12
     _fields_ = [("d", Fp * D)]
 
+    _PROTOTYPES: dict[str, Prototype] = {
+        "powVec": (None, [SELF, SELF, "Fr", ctypes.c_size_t], None),
+        "pairing": ("mclBn_pairing", [SELF, "G1", "G2"], None),
+        "millerLoopVec": (
+            "mclBn_millerLoopVec",
+            [SELF, "G1", "G2", ctypes.c_size_t],
+            None,
+        ),
+        "finalExp": ("mclBn_finalExp", [SELF, SELF], None),
+        "precomputedMillerLoop": (
+            "mclBn_precomputedMillerLoop",
+            [SELF, "G1", ctypes.POINTER(ctypes.c_uint64)],
+            None,
+        ),
+        "precomputedMillerLoop2": (
+            "mclBn_precomputedMillerLoop2",
+            [
+                SELF,
+                "G1",
+                ctypes.POINTER(ctypes.c_uint64),
+                "G1",
+                ctypes.POINTER(ctypes.c_uint64),
+            ],
+            None,
+        ),
+        "precomputedMillerLoop2mixed": (
+            "mclBn_precomputedMillerLoop2mixed",
+            [SELF, "G1", "G2", "G1", ctypes.POINTER(ctypes.c_uint64)],
+            None,
+        ),
+    }
+
     @classmethod
     def byte_size(cls: Type[T]) -> int:
         return Fp.byte_size() * cls.D
 
     @classmethod
-    def pown(cls: Type[T], x: ctypes.Array[T], y: ctypes.Array["Fr"]) -> T:
+    def pown(
+        cls: Type[T],
+        x: Sequence[T] | ctypes.Array[T],
+        y: Sequence["Fr"] | ctypes.Array["Fr"],
+        out: T | None = None,
+    ) -> T:
+        """Product of the powers x[i] ** y[i] (multi-exponentiation).
+
+        Python sequences are accepted as well as ctypes arrays
+        """
         if len(x) != len(y):
-            logging.warn(f"pown: len(x)={len(x)} != len(y)={len(y)}")
-        ret = cls()
-        func = ret._func(  # noqa
-            "powVec",
-            [ctypes.POINTER(cls)] * 2 + [ctypes.POINTER(Fr), ctypes.c_size_t],
-        )
-        func(ret, x, y, min(len(x), len(y)))
+            raise ValueError(f"pown: len(x)={len(x)} != len(y)={len(y)}")
+        n = len(x)
+        ret = cls() if out is None else out
+        if not isinstance(x, ctypes.Array):
+            x = (cls * n)(*x)
+        if not isinstance(y, ctypes.Array):
+            y = (Fr * n)(*y)
+        if n:
+            cls._func("powVec")(ret, x, y, n)
+        else:
+            ret.set_int(1)
         return ret
 
     @classmethod
-    def pairing(cls: Type[T], e1: "G1", e2: "G2") -> T:
-        func = getattr(ct.lib, "mclBn_pairing")
-        func.argtypes = [
-            ctypes.POINTER(cls),
-            ctypes.POINTER(G1),
-            ctypes.POINTER(G2),
-        ]
-        ret = cls()
-        func(ret, e1, e2)
+    def pairing(cls: Type[T], e1: "G1", e2: "G2", out: T | None = None) -> T:
+        ret = cls() if out is None else out
+        table = e2.precomputed
+        if table is None:
+            cls._func("pairing")(ret, e1, e2)
+        else:
+            cls._func("precomputedMillerLoop")(ret, e1, table.table)
+            cls._func("finalExp")(ret, ret)
+        return ret
+
+    @classmethod
+    def multi_pairing(
+        cls: Type[T],
+        x: Sequence["G1"] | ctypes.Array["G1"],
+        y: Sequence["G2"] | ctypes.Array["G2"],
+        out: T | None = None,
+    ) -> T:
+        """Product of the pairings e(x[i], y[i]).
+
+        All the Miller loops are accumulated and a single final
+        exponentiation is applied, so this is much cheaper than multiplying
+        the individual pairings. Use negated points to compare products,
+        e.g. e(a, b) == e(c, d) iff multi_pairing([a, -c], [b, d]).is_one()
+        """
+        if len(x) != len(y):
+            raise ValueError(
+                f"multi_pairing: len(x)={len(x)} != len(y)={len(y)}"
+            )
+        n = len(x)
+        ret = cls() if out is None else out
+        if isinstance(y, ctypes.Array):
+            if not isinstance(x, ctypes.Array):
+                x = (G1 * n)(*x)
+            cls._func("millerLoopVec")(ret, x, y, n)
+            cls._func("finalExp")(ret, ret)
+            return ret
+
+        ## Pairs whose G2 point has a table use its precomputed lines (two
+        ## at a time) and the rest share a single millerLoopVec
+        plain, pre = [], []
+        for i in range(n):
+            table = y[i].precomputed
+            if table is None:
+                plain.append((x[i], y[i]))
+            else:
+                pre.append((x[i], table.table))
+        ret.set_int(1)
+        f = cls()
+        if len(pre) % 2 and plain:
+            (p1, q1), (p2, t2) = plain.pop(), pre.pop()
+            cls._func("precomputedMillerLoop2mixed")(f, p1, q1, p2, t2)
+            ret.imul(f)
+        elif len(pre) % 2:
+            cls._func("precomputedMillerLoop")(f, *pre.pop())
+            ret.imul(f)
+        for i in range(0, len(pre), 2):
+            cls._func("precomputedMillerLoop2")(f, *pre[i], *pre[i + 1])
+            ret.imul(f)
+        if plain:
+            m = len(plain)
+            xs = (G1 * m)(*[p for p, _ in plain])
+            ys = (G2 * m)(*[q for _, q in plain])
+            cls._func("millerLoopVec")(f, xs, ys, m)
+            ret.imul(f)
+        cls._func("finalExp")(ret, ret)
         return ret
+
+
+def bind_library(lib: ctypes.CDLL) -> None:
+    for cls in (Fp, Fr, Fp2, G1, G2, GT):
+        cls.bind(lib)
+
+
+ct.on_load(bind_library)
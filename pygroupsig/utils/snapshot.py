@@ -0,0 +1,126 @@
+"""Group snapshot: everything a long running service needs to start signing,
+verifying and opening without setup(), in one file
+
+Layout (little endian):
+  header    magic, version
+  sections  until the end of the file: u16 name length, name, u32 data
+            length, data
+
+Sections: scheme (the scheme name), group_key (wire format, with the
+pairings computed by setup), precomputed (pairing tables from
+precomputed_to_bytes()), one per manager key present in the group, gml
+(ContainerDict.to_b64(), for the schemes keeping one) and member/<name>
+for each member key
+"""
+
+import os
+import struct
+from collections.abc import Mapping
+from typing import Any
+
+from pygroupsig.definitions import group, key
+
+MAGIC = b"\xa7GSS"
+VERSION = 1
+MANAGER_KEYS = ("manager_key", "revocation_manager_key")
+
+_HEADER = struct.Struct("<4sB")
+_NAME = struct.Struct("<H")
+_DATA = struct.Struct("<I")
+
+
+def _section(name: str, data: bytes) -> bytes:
+    name_b = name.encode()
+    return _NAME.pack(len(name_b)) + name_b + _DATA.pack(len(data)) + data
+
+
+def _sections(buffer: bytes) -> dict[str, bytes]:
+    try:
+        magic, version = _HEADER.unpack_from(buffer, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"Invalid group snapshot (v{version})")
+        ret = {}
+        pos = _HEADER.size
+        while pos < len(buffer):
+            (n,) = _NAME.unpack_from(buffer, pos)
+            pos += _NAME.size
+            name = buffer[pos : pos + n].decode()
+            pos += n
+            (n,) = _DATA.unpack_from(buffer, pos)
+            pos += _DATA.size
+            if pos + n > len(buffer):
+                raise ValueError("Truncated group snapshot")
+            ret[name] = buffer[pos : pos + n]
+            pos += n
+    except (struct.error, UnicodeDecodeError) as e:
+        raise ValueError("Invalid group snapshot") from e
+    return ret
+
+
+def save(
+    path: str | os.PathLike,
+    gs: Any,
+    members: Mapping[str, Any] | None = None,
+) -> None:
+    """Write the group key, its precomputations, the manager keys, the GML
+    and the given member keys of gs. The file holds secret keys, so it is
+    only readable by its owner. It is replaced atomically
+    """
+    gk = gs.group_key
+    data = [
+        _HEADER.pack(MAGIC, VERSION),
+        _section("scheme", gk.info()[0].encode()),
+        _section("group_key", gk.to_bytes()),
+    ]
+    if hasattr(gk, "precomputed_to_bytes"):
+        data.append(_section("precomputed", gk.precomputed_to_bytes()))
+    for name in MANAGER_KEYS:
+        mkey = getattr(gs, name, None)
+        if mkey is not None:
+            data.append(_section(name, mkey.to_bytes()))
+    if getattr(gs, "gml", None):
+        data.append(_section("gml", gs.gml.to_b64().encode()))
+    for name, mkey in (members or {}).items():
+        data.append(_section(f"member/{name}", mkey.to_bytes()))
+    tmp = f"{os.fspath(path)}.tmp"
+    try:
+        fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "wb") as f:
+            f.write(b"".join(data))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+
+
+def load(path: str | os.PathLike) -> tuple[Any, dict[str, Any]]:
+    """Group instance and member keys (name -> key) stored with save().
+    The pairing tables are reused when they match the group key,
+    otherwise they are rebuilt
+    """
+    with open(path, "rb") as f:
+        sections = _sections(f.read())
+    try:
+        scheme = sections["scheme"].decode()
+        gk = sections["group_key"]
+    except (KeyError, UnicodeDecodeError) as e:
+        raise ValueError("Invalid group snapshot") from e
+    gs = group(scheme)()
+    if "precomputed" in sections:
+        gs.group_key.set_bytes(gk, sections["precomputed"])
+    else:
+        gs.group_key.set_bytes(gk)
+    for name in MANAGER_KEYS:
+        if name in sections:
+            getattr(gs, name).set_bytes(sections[name])
+    if "gml" in sections and hasattr(gs, "gml"):
+        gs.gml.set_b64(sections["gml"])
+    members = {
+        name.removeprefix("member/"): key(scheme, "member").from_bytes(data)
+        for name, data in sections.items()
+        if name.startswith("member/")
+    }
+    return gs, members
@@ -7,17 +7,18 @@ from typing import Any, Type, TypeVar
 
 from typing_extensions import Self
 
-from pygroupsig.utils.helpers import ReprMixin
+from pygroupsig.utils.helpers import ReprMixin, fields
 from pygroupsig.utils.mcl import G1, G2, GT, Fr
 
 T = TypeVar("T")
 
 
 class B64Mixin:
+    __slots__ = ()
+
     def to_b64(self) -> str:
         dump = {}
-        for v in vars(self):
-            obj = getattr(self, v)
+        for v, obj in fields(self).items():
             if isinstance(obj, list):
                 dump[v] = [
                     el.to_b64() if not isinstance(el, str) else f"str_{el}"
@@ -54,8 +55,7 @@ class B64Mixin:
         return ret
 
     def set_object(self, y: Self) -> None:
-        for v in vars(y):
-            s_obj = getattr(y, v)
+        for v, s_obj in fields(y).items():
             d_obj = getattr(self, v)
             if isinstance(s_obj, list):
                 d_obj.extend(s_obj)
@@ -69,6 +69,8 @@ class DiscreteLogProof(B64Mixin, ReprMixin):
     c: Fr
     s: Fr
 
+    __slots__ = ("c", "s")
+
     def __init__(self) -> None:
         self.c = Fr()
         self.s = Fr()
@@ -81,6 +83,8 @@ class DiscreteLogProof2(B64Mixin, ReprMixin):
     s: Fr
     x: list[str]
 
+    __slots__ = ("c", "s", "x")
+
     def __init__(self) -> None:
         self.c = Fr()
         self.s = Fr()
@@ -97,6 +101,8 @@ class GeneralRepresentationProof(B64Mixin, ReprMixin):
     c: Fr
     s: list[Fr]
 
+    __slots__ = ("c", "s")
+
     def __init__(self) -> None:
         self.c = Fr()
         self.s = []
@@ -108,6 +114,8 @@ class PairingHomomorphismProof(B64Mixin, ReprMixin):
     c: Fr
     s: G2
 
+    __slots__ = ("c", "s")
+
     def __init__(self) -> None:
         self.c = Fr()
         self.s = G2()
@@ -120,12 +128,20 @@ class PairingHomomorphismProof2(B64Mixin, ReprMixin):
     s: G2
     tau: GT
 
+    __slots__ = ("c", "s", "tau")
+
     def __init__(self) -> None:
         self.c = Fr()
         self.s = G2()
         self.tau = GT()
 
 
+def _muln(terms: list[tuple[Any, Fr]]) -> Any:
+    """Sum of the products point*scalar, all points in the same group"""
+    cls = type(terms[0][0])
+    return cls.muln([p for p, _ in terms], [s for _, s in terms])
+
+
 def general_representation_sign(
     y: list[Any],
     g: list[Any],
@@ -139,26 +155,24 @@ def general_representation_sign(
 
     ## Compute the challenges according to the relations defined by
     ## the i indexes
-    gr = [g[j[1]] * r[j[0]] for j in i]
+    gr = [(g[j[1]], r[j[0]]) for j in i]
 
-    ## Compute the challenge products
-    prod = []
+    ## Compute the challenge products, one multi-scalar multiplication each
+    terms = []
     if not manual:
         idx = 0
         for j in range(len(y)):
-            prod.append(gr[idx])
-            idx += 1
-            if prods[j] > 1:
-                ## We use prods to specify how the i indexes are 'assigned' per
-                ## random 'challenge'
-                for k in range(prods[j] - 1):
-                    prod[j] = prod[j] + gr[idx]
-                    idx += 1
+            ## We use prods to specify how the i indexes are 'assigned' per
+            ## random 'challenge'
+            n = max(prods[j], 1)
+            terms.append(gr[idx : idx + n])
+            idx += n
     else:
         for j in range(4):
-            prod.append(gr[j])
-        prod.append(gr[4] + gr[5])
-        prod.append(gr[6] + gr[7])
+            terms.append([gr[j]])
+        terms.append(gr[4:6])
+        terms.append(gr[6:8])
+    prod = [_muln(t) for t in terms]
 
     ## Compute the hash:
     ## pi->c = Hash(msg, y[1..ny], g[1..ng], i[1,1], i[1,2] .. i[ni,1], i[ni,2], prod[1..ny])
@@ -214,31 +228,27 @@ def general_representation_verify(
     manual: bool = False,
 ) -> bool:
     ## Compute the challenge products -- manually until fixing issue23
-    prod = []
+    ## Each product y[j]*c + sum(g*s) is a single multi-scalar multiplication
+    gs = [(g[j[1]], proof.s[j[0]]) for j in i]
+    terms = []
     if not manual:
         idx = 0
         for j in range(len(y)):
-            prod.append(y[j] * proof.c)
-            if prods[j] >= 1:
-                ## We use prods to specify how the i indexes are 'assigned' per
-                ## random 'challenge'
-                for k in range(prods[j]):
-                    gs = g[i[idx][1]] * proof.s[i[idx][0]]
-                    prod[j] = prod[j] + gs
-                    idx += 1
+            ## We use prods to specify how the i indexes are 'assigned' per
+            ## random 'challenge'
+            n = max(prods[j], 0)
+            terms.append([(y[j], proof.c)] + gs[idx : idx + n])
+            idx += n
     else:
         for idx, j in enumerate(y):
-            p = j * proof.c
             if idx == 5:
                 idy = idx + 1
             else:
                 idy = idx
-            gs = g[i[idy][1]] * proof.s[i[idy][0]]
-            prod.append(p + gs)
+            terms.append([(j, proof.c), gs[idy]])
             if idx > 3:
-                idy += 1
-                gs = g[i[idy][1]] * proof.s[i[idy][0]]
-                prod[-1] = prod[-1] + gs
+                terms[-1].append(gs[idy + 1])
+    prod = [_muln(t) for t in terms]
     ## if pi is correct, then pi->c must equal:
     ## Hash(msg, y[1..ny], g[1..ng], i[1,1], i[1,2] .. i[ni,1], i[ni,2], prod[1..ny])
     ## where prod[j] = y[j]^c*g[i[j,2]]^s[i[j,1]]
@@ -309,7 +319,7 @@ def discrete_log_verify(
 ) -> bool:
     ## If pi (proof) is correct, then pi.c must equal Hash(msg||G||g||g*pi.s+g*pi.c)
     ## Compute g*pi.s + g*pi.c
-    gsGc = (g * proof.s) + (G * proof.c)
+    gsGc = G1.muln([g, G], [proof.s, proof.c])
 
     ## Compute the hash
     h = hashlib.sha256()
@@ -1,13 +1,51 @@
 import logging
+import os
+import tempfile
+import threading
 import unittest
+from base64 import b64encode
+from contextlib import ExitStack, contextmanager
+from unittest.mock import patch
 
-from pygroupsig import crl, gml, group, key, signature
+from pygroupsig import crl, gml, group, key, signature, signature_cache
 from pygroupsig.definitions import SCHEMES
+from pygroupsig.utils.gmlfile import GMLFile
+from pygroupsig.utils.helpers import SignatureCache, fields
+from pygroupsig.utils.mcl import G1, G2, GT
 
 for scheme in SCHEMES:
     logging.getLogger(f"pygroupsig.schemes.{scheme}").setLevel(logging.CRITICAL)
 
 
+@contextmanager
+def termwise_muln():
+    """Compute muln/pown one scalar multiplication (or power) per term"""
+
+    def muln(cls, x, y, out=None):
+        ret = cls()
+        for p, s in zip(x, y):
+            ret.iadd(p * s)
+        if out is not None:
+            out.set_object(ret)
+            return out
+        return ret
+
+    def pown(cls, x, y, out=None):
+        ret = GT.from_int(1)
+        for e, s in zip(x, y):
+            ret.imul(e**s)
+        if out is not None:
+            out.set_object(ret)
+            return out
+        return ret
+
+    with ExitStack() as stack:
+        for cls in (G1, G2):
+            stack.enter_context(patch.object(cls, "muln", classmethod(muln)))
+        stack.enter_context(patch.object(GT, "pown", classmethod(pown)))
+        yield
+
+
 class SetUpMixin:
     scheme: str
 
@@ -52,9 +90,9 @@ class TestBase(AddMemberMixin):
         self.group = group(self.scheme)()
 
     def test_1a_initialGroupState(self):
-        for v in vars(self.group.group_key):
+        for v in fields(self.group.group_key):
             self.assertTrue(getattr(self.group.group_key, v).is_zero())
-        for v in vars(self.group.manager_key):
+        for v in fields(self.group.manager_key):
             self.assertTrue(getattr(self.group.manager_key, v).is_zero())
         if hasattr(self.group, "gml"):
             self.assertFalse(self.group.gml)
@@ -63,14 +101,14 @@ class TestBase(AddMemberMixin):
 
     def test_1b_groupStateAfterSetup(self):
         self.group.setup()
-        for v in vars(self.group.group_key):
+        for v in fields(self.group.group_key):
             self.assertFalse(getattr(self.group.group_key, v).is_zero())
-        for v in vars(self.group.manager_key):
+        for v in fields(self.group.manager_key):
             self.assertFalse(getattr(self.group.manager_key, v).is_zero())
 
     def test_1c_initialMemKeyState(self):
         memkey = key(self.scheme, "member")()
-        for v in vars(memkey):
+        for v in fields(memkey):
             el = getattr(memkey, v)
             if isinstance(el, int):
                 self.assertEqual(el, -1)
@@ -89,7 +127,7 @@ class TestBase(AddMemberMixin):
             self.assertEqual(msg1["status"], "success")
             msg2 = self.group.join_mem(msg1, memkey)
             self.assertEqual(msg2["status"], "success")
-        for v in vars(memkey):
+        for v in fields(memkey):
             el = getattr(memkey, v)
             if isinstance(el, int):
                 self.assertNotEqual(el, -1)
@@ -133,6 +171,64 @@ class TestBase(AddMemberMixin):
         ver_msg = self.group.verify(text, sig_msg["signature"])
         self.assertEqual(ver_msg["status"], "fail")
 
+    def test_1i_validSignatureFixedBase(self):
+        self.group.setup()
+        ## Comb tables right away, and a copy of the group without them
+        self.group.group_key.fixed_base(lazy=0)
+        gs = group(self.scheme)()
+        gs.group_key = key(self.scheme, "group").from_b64(
+            self.group.group_key.to_b64()
+        )
+        memkey = self.addMember()
+        text = "Hello world!"
+        for signer, verifier in ((self.group, gs), (gs, self.group)):
+            sig_msg = signer.sign(text, memkey)
+            self.assertEqual(sig_msg["status"], "success")
+            ver_msg = verifier.verify(text, sig_msg["signature"])
+            self.assertEqual(ver_msg["status"], "success")
+            ver_msg = verifier.verify("World hello!", sig_msg["signature"])
+            self.assertEqual(ver_msg["status"], "fail")
+
+    def test_1j_validSignatureTermwiseMuln(self):
+        ## Multi-scalar multiplications must match the term by term results
+        self.group.setup()
+        with termwise_muln():
+            memkey = self.addMember()
+            sig_ref = self.group.sign("Hello world!", memkey)["signature"]
+        sig_msm = self.group.sign("Hello world!", memkey)["signature"]
+        ver_msg = self.group.verify("Hello world!", sig_ref)
+        self.assertEqual(ver_msg["status"], "success")
+        with termwise_muln():
+            ver_msg = self.group.verify("Hello world!", sig_msm)
+            self.assertEqual(ver_msg["status"], "success")
+            ver_msg = self.group.verify("World hello!", sig_msm)
+            self.assertEqual(ver_msg["status"], "fail")
+
+    def test_1k_signatureCache(self):
+        self.group.setup()
+        memkey = self.addMember()
+        text = "Hello world!"
+        sig_b64 = self.group.sign(text, memkey)["signature"]
+        stats = signature_cache.stats()
+        for _ in range(3):
+            ver_msg = self.group.verify(text, sig_b64)
+            self.assertEqual(ver_msg["status"], "success")
+        self.assertEqual(signature_cache.stats()["misses"], stats["misses"] + 1)
+        self.assertEqual(signature_cache.stats()["hits"], stats["hits"] + 2)
+        sig_cls = signature(self.scheme)
+        self.assertIs(
+            signature_cache.get(sig_cls, sig_b64),
+            signature_cache.get(sig_cls, sig_b64.encode()),
+        )
+        ## Least recently used entries are evicted first
+        cache = SignatureCache(maxsize=1)
+        sig1 = cache.get(sig_cls, sig_b64)
+        sig2_b64 = self.group.sign(text, memkey)["signature"]
+        cache.get(sig_cls, sig2_b64)
+        self.assertEqual(len(cache), 1)
+        self.assertIsNot(cache.get(sig_cls, sig_b64), sig1)
+        self.assertEqual(cache.stats()["misses"], 3)
+
 
 class TestOpen:
     def test_2a_openSignature(self):
@@ -348,6 +444,31 @@ class TestBlind(AddMemberMixin, SetUpMixin):
         )
         self.assertNotEqual(unblind1_msg["nym"], unblind2_msg["nym"])
 
+    @patch("pygroupsig.utils.mcl.FixedBaseTable.LAZY_USES", 2)
+    def test_3f_blindManyConvertMany(self):
+        memkeys = [self.addMember(), self.addMember()]
+        texts = [f"Hello world {i}!" for i in range(8)]
+        signatures = [
+            self.group.sign(text, memkeys[i % 2])["signature"]
+            for i, text in enumerate(texts)
+        ]
+        bkey = key(self.scheme, "blind").from_random(self.group.group_key)
+        wire = [
+            signature(self.scheme).from_b64(s).to_bytes() for s in signatures
+        ]
+        for workers, sigs in ((1, signatures), (2, wire)):
+            bsigs = list(self.group.blind_many(zip(texts, sigs), bkey, workers))
+            self.assertEqual(len(bsigs), len(texts))
+            csigs = list(
+                self.group.convert_many(bsigs, bkey.public(), workers)
+            )
+            self.assertEqual(len(csigs), len(texts))
+            nyms = [self.group.unblind(c, bkey)["nym"] for c in csigs]
+            ## Both members keep one pseudonym across the batch
+            self.assertEqual(sorted(map(nyms.count, set(nyms))), [4, 4])
+        conv_msg = self.group.convert(bsigs, bkey.public())
+        self.assertEqual(len(conv_msg["converted_signatures"]), len(texts))
+
 
 class TestLink(AddMemberMixin, SetUpMixin):
     def test_3a_identify(self):
@@ -472,6 +593,27 @@ class TestLink(AddMemberMixin, SetUpMixin):
         )
         self.assertEqual(idenver_msg["status"], "fail")
 
+    def test_3l_linkManyAndVerificationScope(self):
+        memkey = self.addMember()
+        texts = [f"Hello world {i}!" for i in range(20)]
+        signatures = [
+            self.group.sign(text, memkey, scope="fed")["signature"]
+            for text in texts
+        ]
+        iden_msg = self.group.link(
+            "password", texts, signatures, memkey, scope="fed"
+        )
+        self.assertEqual(iden_msg["status"], "success")
+        idenver_msg = self.group.link_verify(
+            "password", texts, signatures, iden_msg["proof"], scope="fed"
+        )
+        self.assertEqual(idenver_msg["status"], "success")
+        texts[7] = "World hello!"
+        idenver_msg = self.group.link_verify(
+            "password", texts, signatures, iden_msg["proof"], scope="fed"
+        )
+        self.assertEqual(idenver_msg["status"], "fail")
+
 
 class TestLinkSeq(AddMemberMixin, SetUpMixin):
     def test_3i_seqlinkAndVerification(self):
@@ -567,6 +709,37 @@ class TestLinkSeq(AddMemberMixin, SetUpMixin):
         )
         self.assertEqual(idenver_msg["status"], "fail")
 
+    @patch("pygroupsig.schemes.dl21.LINK_CHUNK", 2)
+    def test_3m_seqlinkVerifyStream(self):
+        memkey = self.addMember()
+        texts = [f"Hello world {i}!" for i in range(7)]
+        signatures = [
+            self.group.sign(text, memkey, state=i)["signature"]
+            for i, text in enumerate(texts)
+        ]
+        iden_msg = self.group.seqlink("password", texts, signatures, memkey)
+        self.assertEqual(iden_msg["status"], "success")
+        read = []
+
+        def pairs(texts):
+            for pair in zip(texts, signatures):
+                read.append(pair)
+                yield pair
+
+        idenver_msg = self.group.seqlink_verify_stream(
+            "password", pairs(texts), iden_msg["proof"]
+        )
+        self.assertEqual(idenver_msg["status"], "success")
+        self.assertEqual(len(read), len(texts))
+        ## Stops at the chunk holding the invalid signature
+        read.clear()
+        texts[2] = "World hello!"
+        idenver_msg = self.group.seqlink_verify_stream(
+            "password", pairs(texts), iden_msg["proof"]
+        )
+        self.assertEqual(idenver_msg["status"], "fail")
+        self.assertEqual(len(read), 4)
+
 
 class TestBaseExportImport(AddMemberMixin, SetUpMixin):
     def test_4a_exportImportGroupKey(self):
@@ -619,6 +792,20 @@ class TestBaseExportImport(AddMemberMixin, SetUpMixin):
         else:
             raise unittest.SkipTest("Requires GML")
 
+    def test_4e_gmlIndex(self):
+        if hasattr(self.group, "gml"):
+            self.addMember()
+            self.addMember()
+            imported = gml.from_b64(self.group.gml.to_b64())
+            for mem_id, entry in self.group.gml.items():
+                self.assertEqual(self.group.gml.lookup(entry[0]), mem_id)
+                self.assertEqual(imported.lookup(entry[0]), mem_id)
+            mem_id, entry = imported.popitem()
+            self.assertIsNone(imported.lookup(entry[0]))
+            self.assertEqual(self.group.gml.lookup(entry[0]), mem_id)
+        else:
+            raise unittest.SkipTest("Requires GML")
+
     def test_4f_exportImportCRL(self):
         if hasattr(self.group, "crl"):
             memkey1 = self.addMember()
@@ -638,6 +825,59 @@ class TestBaseExportImport(AddMemberMixin, SetUpMixin):
         else:
             raise unittest.SkipTest("Requires CRL")
 
+    def test_4g_exportImportPrecomputedGroupKey(self):
+        memkey = self.addMember()
+        sig_msg = self.group.sign("Hello world!", memkey)
+        grpkey_b64 = self.group.group_key.to_b64()
+        tables = self.group.group_key.precomputed_to_bytes()
+        other = group(self.scheme)()
+        other.setup()
+        for t in (tables, other.group_key.precomputed_to_bytes(), None):
+            gs = group(self.scheme)()
+            gs.group_key = key(self.scheme, "group").from_b64(grpkey_b64, t)
+            self.assertEqual(str(gs.group_key), str(self.group.group_key))
+            for v in gs.group_key._precompute:
+                table = getattr(gs.group_key, v).precomputed
+                self.assertIsNotNone(table)
+                if t is tables:
+                    self.assertEqual(
+                        table.to_bytes(),
+                        getattr(self.group.group_key, v).precomputed.to_bytes(),
+                    )
+            ver_msg = gs.verify("Hello world!", sig_msg["signature"])
+            self.assertEqual(ver_msg["status"], "success")
+
+    def test_4h_exportImportBytes(self):
+        memkey = self.addMember()
+        text = "Hello world!"
+        sig = signature(self.scheme).from_b64(
+            self.group.sign(text, memkey)["signature"]
+        )
+        for obj in (
+            self.group.group_key,
+            self.group.manager_key,
+            memkey,
+            sig,
+        ):
+            data = obj.to_bytes()
+            self.assertLess(len(data), len(obj.to_b64()))
+            self.assertEqual(str(type(obj).from_bytes(data)), str(obj))
+            ## Auto-detected by the b64 import, raw or encoded
+            self.assertEqual(str(type(obj).from_b64(data)), str(obj))
+            self.assertEqual(
+                str(type(obj).from_b64(b64encode(data))), str(obj)
+            )
+            with self.assertRaises(ValueError):
+                type(obj).from_bytes(data[:-1])
+            with self.assertRaises(ValueError):
+                type(obj).from_bytes(data + b"\x00")
+        ver_msg = self.group.verify(text, sig.to_bytes())
+        self.assertEqual(ver_msg["status"], "success")
+        ver_msg = self.group.verify(text, b64encode(sig.to_bytes()).decode())
+        self.assertEqual(ver_msg["status"], "success")
+        with self.assertRaises(ValueError):
+            key(self.scheme, "member").from_bytes(sig.to_bytes())
+
 
 class TestBlindExportImport:
     def test_4f_exportImportBlindKey(self):
@@ -650,3 +890,261 @@ class TestBlindExportImport:
         self.assertEqual(str(blindkey1), str(blindkey))
         blindkey2 = key(self.scheme, "blind").from_b64(blindkey_b64)
         self.assertEqual(str(blindkey2), str(blindkey))
+        blindkey3 = key(self.scheme, "blind").from_bytes(blindkey.to_bytes())
+        self.assertEqual(str(blindkey3), str(blindkey))
+
+
+class TestBatchVerify(AddMemberMixin, SetUpMixin):
+    def _signatures(self, n):
+        memkey = self.addMember()
+        messages = [f"Hello world {i}!" for i in range(n)]
+        signatures = [
+            self.group.sign(msg, memkey)["signature"] for msg in messages
+        ]
+        return messages, signatures
+
+    def test_6a_verifyBatch(self):
+        messages, signatures = self._signatures(5)
+        ver_msg = self.group.verify_batch(messages, signatures)
+        self.assertEqual(ver_msg["status"], "success")
+        ver_msg = self.group.verify_batch([], [])
+        self.assertEqual(ver_msg["status"], "success")
+
+    def test_6b_verifyBatchInvalidSignatures(self):
+        messages, signatures = self._signatures(6)
+        messages[1] = "World hello!"
+        gs, memkey = self.addMemberIsolated()
+        signatures[4] = gs.sign(messages[4], memkey)["signature"]
+        ver_msg = self.group.verify_batch(messages, signatures)
+        self.assertEqual(ver_msg["status"], "fail")
+        self.assertEqual(ver_msg["failed"], [1, 4])
+
+    def test_6d_verifyBatchMalformedSignatures(self):
+        messages, signatures = self._signatures(4)
+        signatures[0] = "not a signature"
+        signatures[2] = signatures[2][:-8]
+        ver_msg = self.group.verify_batch(messages, signatures)
+        self.assertEqual(ver_msg["status"], "fail")
+        self.assertEqual(ver_msg["failed"], [0, 2])
+
+    def test_6c_verifyBatchLengthMismatch(self):
+        messages, signatures = self._signatures(2)
+        ver_msg = self.group.verify_batch(messages[:1], signatures)
+        self.assertEqual(ver_msg["status"], "error")
+
+
+class TestVerifyAndTrace(AddMemberMixin, SetUpMixin):
+    def _revoke(self, memkey):
+        self.group.reveal(self.group.gml.lookup(memkey.A))
+
+    def test_8a_verifyAndTrace(self):
+        memkey1 = self.addMember()
+        memkey2 = self.addMember()
+        sig1 = self.group.sign("Hello world!", memkey1)["signature"]
+        sig2 = self.group.sign("Hello world!", memkey2)["signature"]
+        ver_msg = self.group.verify_and_trace("Hello world!", sig1)
+        self.assertEqual(ver_msg["status"], "success")
+        self.assertFalse(ver_msg["revoked"])
+        self._revoke(memkey1)
+        ver_msg = self.group.verify_and_trace("Hello world!", sig1)
+        self.assertEqual(ver_msg["status"], "fail")
+        self.assertTrue(ver_msg["revoked"])
+        ver_msg = self.group.verify_and_trace("Hello world!", sig2)
+        self.assertEqual(ver_msg["status"], "success")
+        ver_msg = self.group.verify_and_trace("World hello!", sig2)
+        self.assertEqual(ver_msg["status"], "fail")
+        self.assertNotIn("revoked", ver_msg)
+
+    def test_8b_verifyAndTraceCache(self):
+        memkey = self.addMember()
+        sig = self.group.sign("Hello world!", memkey)["signature"]
+        for _ in range(3):
+            ver_msg = self.group.verify_and_trace("Hello world!", sig)
+            self.assertEqual(ver_msg["status"], "success")
+        stats = self.group.verdict_cache.stats()
+        self.assertEqual((stats["hits"], stats["misses"]), (2, 1))
+        self.assertAlmostEqual(stats["hit_rate"], 2 / 3)
+        ## A CRL change invalidates the cached verdicts
+        self._revoke(memkey)
+        ver_msg = self.group.verify_and_trace("Hello world!", sig)
+        self.assertTrue(ver_msg["revoked"])
+        self.assertEqual(self.group.verdict_cache.stats()["misses"], 2)
+
+    def test_8c_traceParallel(self):
+        memkeys = [self.addMember() for _ in range(6)]
+        sigs = [
+            self.group.sign("Hello world!", m)["signature"] for m in memkeys
+        ]
+        for memkey in memkeys[::2]:
+            self._revoke(memkey)
+        for workers in (1, 2, 4):
+            for idx, sig in enumerate(sigs):
+                ver_msg = self.group.verify_and_trace(
+                    "Hello world!", sig, workers=workers
+                )
+                self.assertEqual(ver_msg["revoked"], idx % 2 == 0)
+                self.group.verdict_cache.clear()
+
+    def test_8d_verifyAndTraceBatch(self):
+        memkeys = [self.addMember() for _ in range(3)]
+        sigs = [
+            self.group.sign("Hello world!", m)["signature"] for m in memkeys
+        ]
+        self._revoke(memkeys[1])
+        messages = ["Hello world!", "Hello world!", "World hello!"]
+        expected = [
+            self.group.verify_and_trace(m, s) for m, s in zip(messages, sigs)
+        ]
+        self.assertEqual(
+            [v["status"] for v in expected], ["success", "fail", "fail"]
+        )
+        self.group.verdict_cache.clear()
+        ## Verified in one batch, then from the cached verdicts
+        for misses in (3, 3):
+            ret = self.group.verify_and_trace_batch(messages, sigs)
+            self.assertEqual(ret, expected)
+            self.assertEqual(self.group.verdict_cache.stats()["misses"], misses)
+        self.assertEqual(self.group.verify_and_trace_batch([], []), [])
+        with self.assertRaises(ValueError):
+            self.group.verify_and_trace_batch(messages, sigs[:2])
+
+    def test_8e_verifyAndTraceCacheGroupKey(self):
+        memkey = self.addMember()
+        sig = self.group.sign("Hello world!", memkey)["signature"]
+        ver_msg = self.group.verify_and_trace("Hello world!", sig)
+        self.assertEqual(ver_msg["status"], "success")
+        ## Verdicts of the previous group key are not reused
+        group_key = self.group.group_key
+        self.group.group_key = group_key.__class__.from_b64(
+            group_key.to_b64()
+        )
+        self.group.setup()
+        ver_msg = self.group.verify_and_trace("Hello world!", sig)
+        self.assertEqual(ver_msg["status"], "fail")
+        ver_msg = self.group.verify_and_trace_batch(["Hello world!"], [sig])
+        self.assertEqual(ver_msg[0]["status"], "fail")
+        self.group.group_key = group_key
+        ver_msg = self.group.verify_and_trace("Hello world!", sig)
+        self.assertEqual(ver_msg["status"], "success")
+
+
+class TestOpenScan(AddMemberMixin, SetUpMixin):
+    def _openAll(self, gs, signatures, **kwargs):
+        return [gs.open(s, **kwargs)["id"] for s in signatures]
+
+    def test_9a_openMembers(self):
+        memkeys = [self.addMember() for _ in range(5)]
+        signatures = [
+            self.group.sign("Hello world!", m)["signature"] for m in memkeys
+        ]
+        ids = self._openAll(self.group, signatures)
+        self.assertEqual(len(set(ids)), len(memkeys))
+        self.assertEqual(set(ids), set(self.group.gml))
+        for workers in (1, 2, 4):
+            self.assertEqual(
+                self._openAll(self.group, signatures, workers=workers), ids
+            )
+        ## Members joining afterwards can be opened too
+        memkey = self.addMember()
+        sig = self.group.sign("Hello world!", memkey)["signature"]
+        open_msg = self.group.open(sig)
+        self.assertEqual(open_msg["status"], "success")
+        self.assertNotIn(open_msg["id"], ids)
+        openver_msg = self.group.open_verify(sig, open_msg["proof"])
+        self.assertEqual(openver_msg["status"], "success")
+
+    def test_9b_openImportedGML(self):
+        memkeys = [self.addMember() for _ in range(3)]
+        signatures = [
+            self.group.sign("Hello world!", m)["signature"] for m in memkeys
+        ]
+        ids = self._openAll(self.group, signatures)
+        gs = group(self.scheme)()
+        gs.group_key = key(self.scheme, "group").from_b64(
+            self.group.group_key.to_b64()
+        )
+        gs.manager_key = key(self.scheme, "manager").from_b64(
+            self.group.manager_key.to_b64()
+        )
+        gs.gml = gml.from_b64(self.group.gml.to_b64())
+        self.assertEqual(self._openAll(gs, signatures), ids)
+        ## Replacing the GML drops its members
+        gs.gml = gml()
+        open_msg = gs.open(signatures[0])
+        self.assertEqual(open_msg["status"], "fail")
+
+    def test_9c_openGMLFile(self):
+        memkeys = [self.addMember() for _ in range(3)]
+        signatures = [
+            self.group.sign("Hello world!", m)["signature"] for m in memkeys
+        ]
+        ids = self._openAll(self.group, signatures)
+        with tempfile.TemporaryDirectory() as tmp:
+            with GMLFile.from_container(
+                os.path.join(tmp, "gml.bin"), self.group.gml
+            ) as gml_file:
+                self.group.gml = gml_file
+                self.assertEqual(self._openAll(self.group, signatures), ids)
+                ## Members joining afterwards are stored in the file
+                memkey = self.addMember()
+                sig = self.group.sign("Hello world!", memkey)["signature"]
+                open_msg = self.group.open(sig)
+                self.assertEqual(open_msg["status"], "success")
+                self.assertIn(open_msg["id"], gml_file)
+                self.assertNotIn(open_msg["id"], ids)
+
+
+class TestOfflineSign(AddMemberMixin, SetUpMixin):
+    def test_7a_offlineSign(self):
+        from pygroupsig.schemes.cpy06 import OfflineSigner
+
+        signer = OfflineSigner(self.group, self.addMember(), 4, watermark=1)
+        signer.fill()
+        self.assertEqual(len(signer), 4)
+        signatures = [
+            signer.sign("Hello world!")["signature"] for _ in range(5)
+        ]
+        ## Presignatures are used only once
+        self.assertEqual(len(set(signatures)), 5)
+        for sig in signatures:
+            ver_msg = self.group.verify("Hello world!", sig)
+            self.assertEqual(ver_msg["status"], "success")
+            ver_msg = self.group.verify("World hello!", sig)
+            self.assertEqual(ver_msg["status"], "fail")
+        stats = signer.stats()
+        self.assertEqual((stats["hits"], stats["misses"]), (4, 1))
+        self.assertEqual(stats["available"], 0)
+
+    def test_7b_offlineSignRefill(self):
+        from pygroupsig.schemes.cpy06 import OfflineSigner
+
+        with OfflineSigner(self.group, self.addMember(), 3, 1) as signer:
+            sig_msg = signer.sign("Hello world!")
+            with signer._cond:
+                signer._cond.wait_for(lambda: len(signer) == 3, timeout=30)
+            self.assertEqual(len(signer), 3)
+        self.assertIsNone(signer._thread)
+        ver_msg = self.group.verify("Hello world!", sig_msg["signature"])
+        self.assertEqual(ver_msg["status"], "success")
+
+    def test_7c_offlineSignInvalidWatermark(self):
+        from pygroupsig.schemes.cpy06 import OfflineSigner
+
+        with self.assertRaises(ValueError):
+            OfflineSigner(self.group, self.addMember(), size=4, watermark=4)
+
+    def test_7d_offlineSignConcurrentFill(self):
+        from pygroupsig.schemes.cpy06 import OfflineSigner
+
+        with OfflineSigner(self.group, self.addMember(), 4, 1) as signer:
+            threads = [threading.Thread(target=signer.fill) for _ in range(4)]
+            for t in threads:
+                t.start()
+            for _ in range(6):
+                signer.sign("Hello world!")
+                self.assertLessEqual(len(signer), 4)
+            for t in threads:
+                t.join()
+            with signer._cond:
+                signer._cond.wait_for(lambda: len(signer) == 4, timeout=30)
+            self.assertEqual(len(signer), 4)
@@ -0,0 +1,85 @@
+import asyncio
+import os
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from unittest.mock import Mock, patch
+
+from backend import groupsig_utils
+from backend.crypto_worker import (
+    CryptoWorker,
+    CryptoWorkerBusy,
+    _verify_cache_stats,
+)
+
+
+class TestCryptoWorker(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.worker = CryptoWorker(workers=1, max_pending=1)
+
+    def tearDown(self):
+        self.worker.stop()
+
+    async def test_busy(self):
+        slow = asyncio.ensure_future(self.worker._run(time.sleep, 0.5))
+        await asyncio.sleep(0)
+        with self.assertRaises(CryptoWorkerBusy):
+            await self.worker._run(abs, -1)
+        await slow
+        self.assertEqual(await self.worker._run(abs, -1), 1)
+        stats = self.worker.stats()
+        self.assertEqual((stats["pending"], stats["rejected"]), (0, 1))
+
+    async def test_brokenPool(self):
+        self.worker.start()
+        pool = self.worker._pool
+        with patch.object(pool, "shutdown", wraps=pool.shutdown) as shutdown:
+            with self.assertRaises(BrokenProcessPool):
+                await self.worker._run(os._exit, 1)
+        shutdown.assert_called_once_with(wait=False)
+        self.assertIsNone(self.worker._pool)
+        ## The next call starts a new pool
+        self.assertEqual(await self.worker._run(abs, -2), 2)
+        self.assertIsNot(self.worker._pool, pool)
+
+    def test_verifyCacheStatsNoKeys(self):
+        gsm = Mock(**{"verify_cache_stats.return_value": None})
+        with patch.object(groupsig_utils, "_gsm", gsm):
+            self.assertEqual(_verify_cache_stats(), {"pid": os.getpid()})
+
+    async def test_verifyMany(self):
+        calls = []
+
+        def verify_many(messages, signatures, group_id):
+            calls.append((messages, group_id))
+            return [s == f"sig {m}" for m, s in zip(messages, signatures)]
+
+        worker = CryptoWorker(workers=3, max_pending=3)
+        ## Threads standing in for the worker processes
+        worker._pool = ThreadPoolExecutor(3)
+        self.addCleanup(worker.stop)
+        messages = [f"m{i}" for i in range(7)]
+        signatures = [f"sig {m}" for m in messages]
+        signatures[4] = "bad"
+        with patch("backend.crypto_worker._verify_many", verify_many):
+            verdicts = await worker.verify_many(messages, signatures, "g")
+            self.assertEqual(await worker.verify_many([], []), [])
+            ## The 3 chunks need 3 free slots, none is taken otherwise
+            slow = asyncio.ensure_future(worker._run(time.sleep, 0.2))
+            await asyncio.sleep(0)
+            with self.assertRaises(CryptoWorkerBusy):
+                await worker.verify_many(messages, signatures, "g")
+            self.assertEqual(worker.pending, 1)
+            await slow
+        ## One batch per worker, verdicts in order
+        self.assertEqual(verdicts, [True] * 4 + [False] + [True] * 2)
+        self.assertEqual(
+            sorted(calls),
+            [(messages[0:3], "g"), (messages[3:6], "g"), (messages[6:], "g")],
+        )
+        self.assertEqual(worker.stats()["pending"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,110 @@
+import os
+import tempfile
+import unittest
+
+from pygroupsig import gml
+from pygroupsig.utils.gmlfile import MIN_CAPACITY, ContainerFile
+from pygroupsig.utils.mcl import G1, G2, Fr
+
+
+def _entry() -> tuple:
+    return (G1.from_random(), G2.from_random(), Fr.from_random())
+
+
+class TestContainerFile(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.dir.name, "gml.bin")
+        self.gml = gml()
+        for i in range(10):
+            self.gml[f"{i:064x}"] = _entry()
+
+    def tearDown(self):
+        self.dir.cleanup()
+
+    def assertEntriesEqual(self, a, b):
+        self.assertEqual(sorted(a), sorted(b))
+        for k in a:
+            self.assertEqual(
+                [v.to_bytes() for v in a[k]], [v.to_bytes() for v in b[k]]
+            )
+
+    def test_exportB64(self):
+        with ContainerFile.from_b64(self.path, self.gml.to_b64()) as f:
+            self.assertEntriesEqual(f, self.gml)
+            self.assertEntriesEqual(gml.from_b64(f.to_b64()), self.gml)
+        with ContainerFile(self.path, readonly=True) as f:
+            self.assertEqual(len(f), len(self.gml))
+            self.assertEntriesEqual(f, self.gml)
+            with self.assertRaises(ValueError):
+                f["0" * 64] = _entry()
+
+    def test_lookup(self):
+        with ContainerFile.from_container(self.path, self.gml) as f:
+            for k, v in self.gml.items():
+                self.assertIn(k, f)
+                self.assertEqual(f.lookup(v[0]), k)
+            self.assertNotIn("f" * 64, f)
+            self.assertIsNone(f.lookup(G1.from_random()))
+            with self.assertRaises(KeyError):
+                f["f" * 64]
+
+    def test_append(self):
+        with ContainerFile.create(self.path) as f:
+            self.assertEqual(len(f), 0)
+            self.assertIsNone(f.lookup(G1.from_random()))
+            for k, v in self.gml.items():
+                f[k] = v
+        ## Growing past the initial capacity rewrites the indexes
+        with ContainerFile(self.path) as f:
+            for i in range(10, MIN_CAPACITY):
+                self.gml[f"{i:064x}"] = _entry()
+                f[f"{i:064x}"] = self.gml[f"{i:064x}"]
+            self.assertGreater(f._capacity, MIN_CAPACITY)
+        with ContainerFile(self.path, readonly=True) as f:
+            self.assertEntriesEqual(f, self.gml)
+            for k, v in self.gml.items():
+                self.assertEqual(f.lookup(v[0]), k)
+
+    def test_replace(self):
+        with ContainerFile.from_container(self.path, self.gml) as f:
+            k = next(iter(self.gml))
+            old = self.gml[k]
+            self.gml[k] = _entry()
+            f[k] = self.gml[k]
+            self.assertEqual(len(f), len(self.gml))
+            self.assertEntriesEqual(f, self.gml)
+            self.assertEqual(f.lookup(self.gml[k][0]), k)
+            self.assertIsNone(f.lookup(old[0]))
+
+    def test_replaceMany(self):
+        ## Stale element slots of replaced entries must not fill the index
+        with ContainerFile.from_container(self.path, self.gml) as f:
+            k = next(iter(self.gml))
+            for _ in range(8 * MIN_CAPACITY):
+                self.gml[k] = _entry()
+                f[k] = self.gml[k]
+                self.assertLessEqual(f._used, f._capacity // 2)
+            self.assertEqual(f._capacity, MIN_CAPACITY)
+            self.assertEntriesEqual(f, self.gml)
+            for key, v in self.gml.items():
+                self.assertEqual(f.lookup(v[0]), key)
+            self.assertIsNone(f.lookup(G1.from_random()))
+        with ContainerFile(self.path, readonly=True) as f:
+            self.assertLessEqual(f._used, f._capacity // 2)
+            self.assertEntriesEqual(f, self.gml)
+
+    def test_invalid(self):
+        with ContainerFile.from_container(self.path, self.gml) as f:
+            with self.assertRaises(TypeError):
+                f["0" * 64] = (G1.from_random(),)
+            with self.assertRaises(ValueError):
+                f["0" * 65] = _entry()
+        with open(self.path, "r+b") as fp:
+            fp.write(b"GML")
+        with self.assertRaises(ValueError):
+            ContainerFile(self.path)
+
+
+if __name__ == "__main__":
+    unittest.main()
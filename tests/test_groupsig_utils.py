@@ -0,0 +1,246 @@
+import asyncio
+import hashlib
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from backend.groupsig_utils import (
+    GroupRegistry,
+    GroupSignatureManager,
+    Histogram,
+    VerificationCoalescer,
+)
+from pygroupsig import group, key
+from pygroupsig.utils import snapshot
+
+
+def _add_member(gs):
+    memkey = key(gs._name, "member")()
+    msg2 = None
+    for _ in range(0, gs.join_seq() + 1, 2):
+        msg1 = gs.join_mgr(msg2)
+        msg2 = gs.join_mem(msg1, memkey)
+    return memkey
+
+
+class TestHistogram(unittest.TestCase):
+    def test_observe(self):
+        h = Histogram((1, 10))
+        for v in (0.5, 1, 5, 50):
+            h.observe(v)
+        stats = h.stats()
+        self.assertEqual(stats["buckets"], {"1": 2, "10": 1, "+inf": 1})
+        self.assertEqual(stats["count"], 4)
+        self.assertEqual(stats["sum"], 56.5)
+        self.assertEqual(stats["mean"], 56.5 / 4)
+        self.assertEqual(Histogram((1,)).stats()["mean"], 0.0)
+
+
+class TestVerificationCoalescer(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.calls = []
+
+    async def _verify_many(self, messages, signatures, group_id=None):
+        self.calls.append((list(messages), group_id))
+        await asyncio.sleep(0)
+        return [s == f"sig {m}" for m, s in zip(messages, signatures)]
+
+    async def test_batch(self):
+        c = VerificationCoalescer(self._verify_many, window=0.01, max_batch=8)
+        verdicts = await asyncio.gather(
+            *[c.verify(f"m{i}", f"sig m{i}") for i in range(5)],
+            c.verify("m5", "bad"),
+        )
+        self.assertEqual(verdicts, [True] * 5 + [False])
+        self.assertEqual(self.calls, [([f"m{i}" for i in range(6)], None)])
+        stats = c.stats()
+        self.assertEqual(stats["batch_size"]["count"], 1)
+        self.assertEqual(stats["batch_size"]["sum"], 6)
+        self.assertEqual(stats["latency_ms"]["count"], 6)
+        self.assertEqual(c._tasks, set())
+
+    async def test_maxBatchAndGroups(self):
+        c = VerificationCoalescer(self._verify_many, window=10, max_batch=2)
+        verdicts = await asyncio.gather(
+            c.verify("a", "sig a", "g1"),
+            c.verify("b", "sig b", "g2"),
+            c.verify("c", "sig c", "g1"),
+            c.verify("d", "sig d", "g2"),
+        )
+        ## Full batches are flushed without waiting for the window
+        self.assertEqual(verdicts, [True] * 4)
+        self.assertEqual(
+            sorted(self.calls), [(["a", "c"], "g1"), (["b", "d"], "g2")]
+        )
+
+    async def test_errors(self):
+        async def failing(messages, signatures, group_id=None):
+            raise ValueError("no keys")
+
+        async def short(messages, signatures, group_id=None):
+            return [True] * (len(signatures) - 1)
+
+        c = VerificationCoalescer(failing, window=0.001)
+        with self.assertRaises(ValueError):
+            await c.verify("a", "sig a")
+        c = VerificationCoalescer(short, window=0.001)
+        results = await asyncio.wait_for(
+            asyncio.gather(
+                c.verify("a", "sig a"),
+                c.verify("b", "sig b"),
+                return_exceptions=True,
+            ),
+            timeout=5,
+        )
+        for result in results:
+            self.assertIsInstance(result, RuntimeError)
+
+
+class TestVerdictCache(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.dir = tempfile.TemporaryDirectory()
+        cls.path = os.path.join(cls.dir.name, "group.bin")
+        gs = group("cpy06")()
+        gs.setup()
+        snapshot.save(cls.path, gs, {"doctor": _add_member(gs)})
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.dir.cleanup()
+
+    def setUp(self):
+        self.gsm = GroupSignatureManager(snapshot_path=self.path)
+        self.cache = self.gsm.gm.verdict_cache
+
+    def test_cached(self):
+        sig = self.gsm.sign("Hello world!")
+        self.assertTrue(self.gsm.verify("Hello world!", sig))
+        self.assertTrue(self.gsm.verify("Hello world!", sig))
+        self.assertEqual(
+            self.gsm.verify_many(["Hello world!", "Hello"], [sig, sig]),
+            [True, False],
+        )
+        ## One cache, one entry per verdict
+        stats = self.gsm.verify_cache_stats()
+        self.assertEqual(stats, self.cache.stats())
+        self.assertEqual(stats["hits"], 2)
+        self.assertEqual(stats["misses"], 2)
+        self.assertEqual(len(self.cache), 2)
+
+    def test_errorsNotCached(self):
+        sig = self.gsm.sign("Hello world!")
+        with patch.object(
+            self.gsm.gm, "verify", side_effect=RuntimeError("busy")
+        ):
+            self.assertFalse(self.gsm.verify("Hello world!", sig))
+        self.assertEqual(len(self.cache), 0)
+        self.assertTrue(self.gsm.verify("Hello world!", sig))
+        ## A failed batch is verified one by one, without caching errors
+        with patch.object(
+            self.gsm.gm, "verify_batch", side_effect=RuntimeError("busy")
+        ):
+            self.assertEqual(
+                self.gsm.verify_many(
+                    ["Hello world!", "Hello"], [sig, "not a signature"]
+                ),
+                [True, False],
+            )
+        self.assertEqual(len(self.cache), 1)
+
+
+class TestGroupRegistry(unittest.IsolatedAsyncioTestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.groups = []
+        for _ in range(2):
+            gs = group("cpy06")()
+            gs.setup()
+            cls.groups.append((gs, _add_member(gs)))
+
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.registry = GroupRegistry(self.dir.name, max_groups=1)
+        self.ids = [
+            self.registry.register(gs, {"alice": mk}, {"alice": "0xABC"})
+            for gs, mk in self.groups
+        ]
+
+    def tearDown(self):
+        self.dir.cleanup()
+
+    def test_register(self):
+        self.assertEqual(self.registry.group_ids(), sorted(self.ids))
+        self.assertEqual(self.registry.members(self.ids[0]), ["alice"])
+        path = os.path.join(self.dir.name, self.ids[0], "members")
+        for name in ("alice.key", "alice.owner"):
+            mode = os.stat(os.path.join(path, name)).st_mode
+            self.assertEqual(mode & 0o777, 0o600)
+        self.assertTrue(self.registry.is_owner(self.ids[0], "alice", "0xabc"))
+        self.assertFalse(self.registry.is_owner(self.ids[0], "alice", "0xdef"))
+        self.assertFalse(self.registry.is_owner(self.ids[0], "bob", "0xabc"))
+        self.assertFalse(self.registry.is_owner(None, "alice", "0xabc"))
+        self.assertFalse(self.registry.is_owner(self.ids[0], None, "0xabc"))
+
+    def test_errors(self):
+        with self.assertRaises(ValueError):
+            self.registry.get("../keys")
+        with self.assertRaises(ValueError):
+            self.registry.member_key(self.ids[0], "../alice")
+        with self.assertRaises(KeyError):
+            self.registry.get("0" * 64)
+        with self.assertRaises(KeyError):
+            self.registry.member_key(self.ids[0], "bob")
+
+    def test_routing(self):
+        ## Signatures verify in their own group only
+        sigs = [self.registry.sign(g, "alice", "Hello") for g in self.ids]
+        self.assertTrue(self.registry.verify(self.ids[0], "Hello", sigs[0]))
+        self.assertTrue(self.registry.verify(self.ids[1], "Hello", sigs[1]))
+        self.assertFalse(self.registry.verify(self.ids[0], "Hello", sigs[1]))
+        self.assertEqual(
+            self.registry.verify_many(self.ids[1], ["Hello"] * 2, sigs),
+            [False, True],
+        )
+
+    def test_mockSignatures(self):
+        ## Only the default manager accepts the hex digests sign() falls
+        ## back to, and nothing accepts an empty signature
+        digest = hashlib.sha256(b"Hello").hexdigest()
+        for sig in ("", digest, "not base64!"):
+            self.assertFalse(self.registry.verify(self.ids[0], "Hello", sig))
+        self.assertEqual(
+            self.registry.verify_many(self.ids[0], ["Hello"] * 2, ["", digest]),
+            [False, False],
+        )
+        manager = self.registry.get(self.ids[0])
+        with patch.object(manager.gm, "sign", side_effect=RuntimeError):
+            self.assertIsNone(self.registry.sign(self.ids[0], "alice", "Hello"))
+
+    def test_eviction(self):
+        first = self.registry.get(self.ids[0])
+        self.assertIs(self.registry.get(self.ids[0]), first)
+        self.registry.get(self.ids[1])
+        ## max_groups=1: the first group is loaded again
+        self.assertIsNot(self.registry.get(self.ids[0]), first)
+        self.assertEqual(len(self.registry.groups), 1)
+        self.assertEqual(self.registry.stats()["groups"]["hits"], 1)
+
+    async def test_coalescer(self):
+        async def verify_many(messages, signatures, group_id=None):
+            return self.registry.verify_many(group_id, messages, signatures)
+
+        sigs = [self.registry.sign(g, "alice", "Hello") for g in self.ids]
+        c = VerificationCoalescer(verify_many, window=0.01)
+        verdicts = await asyncio.gather(
+            c.verify("Hello", sigs[0], self.ids[0]),
+            c.verify("Hello", sigs[1], self.ids[1]),
+            c.verify("Hello", sigs[1], self.ids[0]),
+        )
+        self.assertEqual(verdicts, [True, True, False])
+        self.assertEqual(c.stats()["batch_size"]["count"], 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,8 +1,21 @@
+import ctypes
+import threading
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from unittest.mock import patch
 
 import pygroupsig.utils.constants as ct
-from pygroupsig.utils.mcl import G1, G2, GT, Fp, Fp2, Fr
+from pygroupsig.utils.mcl import (
+    G1,
+    G2,
+    GT,
+    FixedBaseTable,
+    Fp,
+    Fp2,
+    Fr,
+    PrecomputedG2,
+)
 
 
 class FBaseTest(unittest.TestCase):
@@ -518,6 +531,24 @@ class GBaseTest(unittest.TestCase):
         z.muln(x, y)
         self.assertEqual(z.get_str(), "0")
 
+    def _testMulVecSequence(self, cls):
+        for n in range(5):
+            x = [cls.from_random() for _ in range(n)]
+            y = [Fr.from_random() for _ in range(n)]
+            expected = cls()
+            for i in range(n):
+                expected += x[i] * y[i]
+            self.assertIs(cls.muln(x, y) == expected, True)
+            self.assertIs(cls.muln((cls * n)(*x), y) == expected, True)
+            # Points with fixed-base tables are mixed with plain ones
+            for i in range(0, n, 2):
+                x[i].fixed_base()
+            self.assertIs(cls.muln(x, y) == expected, True)
+            if n:
+                out = x[-1]
+                self.assertIs(cls.muln(x, y, out=out), out)
+                self.assertIs(out == expected, True)
+
     def _testAdd(self, cls):
         x = cls.from_generator()
         y = Fr()
@@ -600,6 +631,9 @@ class TestG1(GBaseTest):
     def testMulVec(self):
         self._testMulVec(G1)
 
+    def testMulVecSequence(self):
+        self._testMulVecSequence(G1)
+
     def testAdd(self):
         self._testAdd(G1)
 
@@ -647,6 +681,9 @@ class TestG2(GBaseTest):
     def testMulVec(self):
         self._testMulVec(G2)
 
+    def testMulVecSequence(self):
+        self._testMulVecSequence(G2)
+
     def testAdd(self):
         self._testAdd(G2)
 
@@ -773,6 +810,322 @@ class TestGT(FBaseTest):
             E *= e[i] ** s[i]
         EE = GT.pown(e, s)
         self.assertIs(E == EE, True)
+        self.assertIs(GT.pown(list(e), list(s)) == E, True)
+        self.assertIs(GT.pown([], []).is_one(), True)
+
+    def testMultiPairing(self):
+        n = 3
+        P = [G1.from_hash(str(i).encode()) for i in range(n)]
+        Q = [G2.from_hash(str(i).encode()) for i in range(n)]
+        E = GT.from_int(1)
+        for i in range(n):
+            E *= GT.pairing(P[i], Q[i])
+        self.assertIs(GT.multi_pairing(P, Q) == E, True)
+        # ctypes arrays are used as they are
+        p = (G1 * n)(*P)
+        q = (G2 * n)(*Q)
+        self.assertIs(GT.multi_pairing(p, q) == E, True)
+        # Pairing equations: e(aP,Q) == e(P,aQ)
+        a = Fr.from_random()
+        e = GT.multi_pairing([P[0] * a, -P[0]], [Q[0], Q[0] * a])
+        self.assertIs(e.is_one(), True)
+        e = GT.multi_pairing([P[0] * a, -P[0]], [Q[0], Q[0]])
+        self.assertIs(e.is_one(), False)
+        self.assertIs(GT.multi_pairing([], []).is_one(), True)
+
+    def testLengthMismatch(self):
+        ## A dropped factor could turn a failing check into a passing one
+        P = G1.from_hash(b"1")
+        Q = G2.from_hash(b"1")
+        a = Fr.from_random()
+        with self.assertRaises(ValueError):
+            GT.multi_pairing([P, -P], [Q])
+        with self.assertRaises(ValueError):
+            GT.multi_pairing((G1 * 2)(P, -P), (G2 * 1)(Q))
+        with self.assertRaises(ValueError):
+            GT.pown([GT.pairing(P, Q)] * 2, [a])
+        with self.assertRaises(ValueError):
+            G1.muln([P, P], [a])
+        with self.assertRaises(ValueError):
+            G2.muln((G2 * 1)(Q), (Fr * 2)(a, a))
+
+
+class TestPrecomputedG2(unittest.TestCase):
+    def testPairing(self):
+        P = G1.from_random()
+        Q = G2.from_random()
+        e = GT.pairing(P, Q)
+        self.assertIsNone(Q.precomputed)
+        table = Q.precompute()
+        self.assertIs(Q.precomputed, table)
+        self.assertIs(GT.pairing(P, Q) == e, True)
+        # Modified points don't use a stale table
+        Q.iadd(G2.from_random())
+        self.assertIsNone(Q.precomputed)
+        self.assertIs(
+            GT.pairing(P, Q) == GT.pairing(P, G2.from_object(Q)), True
+        )
+
+    def testMultiPairing(self):
+        n = 5
+        P = [G1.from_random() for _ in range(n)]
+        Q = [G2.from_random() for _ in range(n)]
+        e = GT.multi_pairing((G1 * n)(*P), (G2 * n)(*Q))
+        # Every mix of precomputed and plain G2 points
+        for mask in range(1 << n):
+            Qs = [G2.from_object(q) for q in Q]
+            for i in range(n):
+                if mask & (1 << i):
+                    Qs[i].precompute()
+            self.assertIs(GT.multi_pairing(P, Qs) == e, True)
+
+    def testSerialization(self):
+        P = G1.from_random()
+        Q = G2.from_random()
+        table = Q.precompute()
+        t1 = PrecomputedG2.from_bytes(table.to_bytes())
+        t2 = PrecomputedG2.from_b64(table.to_b64())
+        self.assertEqual(t1.to_bytes(), table.to_bytes())
+        self.assertEqual(t2.to_bytes(), table.to_bytes())
+        self.assertIs(t1.base == Q, True)
+        # Tables only attach to the point they were computed for
+        Q1 = G2.from_b64(Q.to_b64())
+        self.assertIs(Q1.set_precomputed(t1), True)
+        self.assertIs(GT.pairing(P, Q1) == GT.pairing(P, Q), True)
+        self.assertIs(G2.from_random().set_precomputed(t1), False)
+        with self.assertRaises(ValueError):
+            PrecomputedG2.from_bytes(table.to_bytes()[:-1])
+
+
+class TestFixedBase(unittest.TestCase):
+    def _scalars(self):
+        return (
+            [Fr(), Fr.from_int(1), Fr.from_int(255), Fr.from_int(256)]
+            + [-Fr.from_int(1)]
+            + [Fr.from_random() for _ in range(20)]
+        )
+
+    def testMul(self):
+        for cls in (G1, G2):
+            P = cls.from_random()
+            Q = cls.from_object(P)
+            Q.fixed_base()
+            for r in self._scalars():
+                self.assertIs(Q * r == P * r, True)
+                out = cls()
+                self.assertIs(Q.mul(r, out=out), out)
+                self.assertIs(out == P * r, True)
+            r = Fr.from_random()
+            Q.imul(r)
+            self.assertIs(Q == P * r, True)
+
+    def testLazy(self):
+        P = G1.from_random()
+        Q = G1.from_object(P)
+        table = Q.fixed_base(lazy=2)
+        r = Fr.from_random()
+        for _ in range(2):
+            self.assertIs(Q * r == P * r, True)
+            self.assertIsNone(table.rows)
+        self.assertIs(Q * r == P * r, True)
+        self.assertIsNotNone(table.rows)
+        # A modified point starts over
+        Q.iadd(P)
+        self.assertIs(Q * r == (P + P) * r, True)
+        self.assertIsNone(table.rows)
+
+    def testLazyThreads(self):
+        P = G1.from_random()
+        Q = G1.from_object(P)
+        table = Q.fixed_base(lazy=2)
+        r = Fr.from_random()
+        build = FixedBaseTable.build
+        builds = []
+
+        def counted(self, base):
+            builds.append(self)
+            build(self, base)
+
+        barrier = threading.Barrier(8)
+
+        def mul(_):
+            barrier.wait()
+            return Q * r
+
+        with patch.object(FixedBaseTable, "build", counted):
+            with ThreadPoolExecutor(8) as ex:
+                rets = list(ex.map(mul, range(8)))
+        self.assertEqual(builds, [table])
+        for ret in rets:
+            self.assertIs(ret == P * r, True)
+
+    def testLazyDisabled(self):
+        P = G1.from_random()
+        Q = G1.from_object(P)
+        table = Q.fixed_base(lazy=1)
+        r = Fr.from_random()
+        with patch.object(ct, "FIXED_BASE_TABLES", False):
+            for _ in range(3):
+                self.assertIs(Q * r == P * r, True)
+        self.assertIsNone(table.rows)
+        # Explicit tables are still built
+        with patch.object(ct, "FIXED_BASE_TABLES", False):
+            self.assertIsNotNone(Q.fixed_base().rows)
+
+
+class TestBind(unittest.TestCase):
+    def testTablesBound(self):
+        for cls in (Fp, Fr, Fp2, G1, G2, GT):
+            self.assertIn("add", cls._funcs)
+            self.assertIn("serialize", cls._funcs)
+        self.assertIn("pairing", GT._funcs)
+        self.assertIn("mulVec", G1._funcs)
+        self.assertNotIn("mulVec", GT._funcs)
+
+    def testTablesArePerClass(self):
+        self.assertIsNot(G1._funcs["mul"], G2._funcs["mul"])
+        self.assertIsNot(Fr._funcs["add"], Fp._funcs["add"])
+
+    def testUnboundFunction(self):
+        with self.assertRaises(RuntimeError):
+            Fp2._func("setStr")
+
+    def testMissingSymbol(self):
+        self.assertEqual(GT._missing["mulVec"], "mclBnGT_mulVec")
+        self.assertNotIn("add", GT._missing)
+        with self.assertRaisesRegex(RuntimeError, "mclBnGT_mulVec"):
+            GT._func("mulVec")
+
+    def testReload(self):
+        x = G1.from_random()
+        a = Fr.from_random()
+        ct.load_library()
+        self.assertIs((x * a) == (x * a), True)
+        self.assertEqual(G1.byte_size(), 48)
+
+
+class TestCopy(unittest.TestCase):
+    def _values(self):
+        return [
+            Fr.from_random(),
+            Fp.from_random(),
+            G1.from_random(),
+            G2.from_random(),
+            GT.pairing(G1.from_random(), G2.from_random()),
+        ]
+
+    def testSetObject(self):
+        for x in self._values():
+            y = x.__class__()
+            y.set_object(x)
+            self.assertIs(x == y, True)
+            self.assertEqual(x.to_bytes(), y.to_bytes())
+            x.set_object(x.__class__())
+            self.assertIs(x.is_zero(), True)
+            self.assertIs(y.is_zero(), False)
+
+    def testFromObject(self):
+        for x in self._values():
+            y = x.__class__.from_object(x)
+            self.assertIsInstance(y, x.__class__)
+            self.assertIs(x == y, True)
+            self.assertNotEqual(ctypes.addressof(x), ctypes.addressof(y))
+
+
+class TestInPlace(unittest.TestCase):
+    def _pairs(self):
+        return [
+            (Fr.from_random(), Fr.from_random()),
+            (Fp.from_random(), Fp.from_random()),
+            (G1.from_random(), G1.from_random()),
+            (G2.from_random(), G2.from_random()),
+        ]
+
+    def testOut(self):
+        for x, y in self._pairs():
+            for fn in ("add", "sub"):
+                out = x.__class__()
+                ret = getattr(x, fn)(y, out=out)
+                self.assertIs(ret, out)
+                self.assertIs(out == getattr(x, fn)(y), True)
+            out = x.__class__()
+            self.assertIs(x.neg(out=out), out)
+            self.assertIs(out == -x, True)
+
+    def testOutAliasing(self):
+        for x, y in self._pairs():
+            expected = x + y
+            self.assertIs(x.add(y, out=y), y)
+            self.assertIs(y == expected, True)
+
+    def testInPlace(self):
+        for x, y in self._pairs():
+            for fn, op in (("iadd", "__add__"), ("isub", "__sub__")):
+                expected = getattr(x, op)(y)
+                addr = ctypes.addressof(x)
+                self.assertIs(getattr(x, fn)(y), x)
+                self.assertEqual(ctypes.addressof(x), addr)
+                self.assertIs(x == expected, True)
+            expected = -x
+            self.assertIs(x.ineg(), x)
+            self.assertIs(x == expected, True)
+
+    def testAugmentedAssignment(self):
+        x, y = Fr.from_random(), Fr.from_random()
+        z = x
+        expected = (((x + y) - y) * y) / y
+        x += y
+        x -= y
+        x *= y
+        x /= y
+        self.assertIs(x, z)
+        self.assertIs(x == expected, True)
+
+    def testMulFr(self):
+        r = Fr.from_random()
+        for x in (G1.from_random(), G2.from_random()):
+            expected = x * r
+            out = x.__class__()
+            self.assertIs(x.mul(r, out=out), out)
+            self.assertIs(out == expected, True)
+            z = x
+            x *= r
+            self.assertIs(x, z)
+            self.assertIs(x == expected, True)
+
+    def testInvDiv(self):
+        x, y = Fr.from_random(), Fr.from_random()
+        out = Fr()
+        self.assertIs(x.inv(out=out), out)
+        self.assertIs(out == ~x, True)
+        expected = x / y
+        self.assertIs(x.idiv(y), x)
+        self.assertIs(x == expected, True)
+        expected = ~x
+        self.assertIs(x.iinv(), x)
+        self.assertIs(x == expected, True)
+
+    def testPow(self):
+        e = GT.pairing(G1.from_random(), G2.from_random())
+        r = Fr.from_random()
+        expected = e**r
+        out = GT()
+        self.assertIs(e.pow(r, out=out), out)
+        self.assertIs(out == expected, True)
+        z = e
+        e **= r
+        self.assertIs(e, z)
+        self.assertIs(e == expected, True)
+        f = GT.pairing(G1.from_random(), G2.from_random())
+        expected = e * f
+        self.assertIs(e.imul(f), e)
+        self.assertIs(e == expected, True)
+
+    def testPairingOut(self):
+        g1, g2 = G1.from_random(), G2.from_random()
+        out = GT()
+        self.assertIs(GT.pairing(g1, g2, out=out), out)
+        self.assertIs(out == GT.pairing(g1, g2), True)
 
 
 if __name__ == "__main__":
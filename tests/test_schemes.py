@@ -3,13 +3,17 @@ import unittest
 from tests.helpers import (
     TestBase,
     TestBaseExportImport,
+    TestBatchVerify,
     TestBlind,
     TestBlindExportImport,
     TestLink,
     TestLinkSeq,
+    TestOfflineSign,
     TestOpen,
+    TestOpenScan,
     TestOpenVerify,
     TestReveal,
+    TestVerifyAndTrace,
 )
 
 
@@ -31,6 +35,10 @@ class Test_2b_PS16ExportImportOps(TestBaseExportImport, unittest.TestCase):
     scheme = "ps16"
 
 
+class Test_2c_PS16OpenOps(TestOpenScan, unittest.TestCase):
+    scheme = "ps16"
+
+
 class Test_3a_CPY06GroupOps(TestOpen, TestBase, unittest.TestCase):
     scheme = "cpy06"
 
@@ -43,6 +51,18 @@ class Test_3c_CPY06ExportImportOps(TestBaseExportImport, unittest.TestCase):
     scheme = "cpy06"
 
 
+class Test_3d_CPY06BatchOps(TestBatchVerify, unittest.TestCase):
+    scheme = "cpy06"
+
+
+class Test_3e_CPY06OfflineSignOps(TestOfflineSign, unittest.TestCase):
+    scheme = "cpy06"
+
+
+class Test_3f_CPY06TraceOps(TestVerifyAndTrace, unittest.TestCase):
+    scheme = "cpy06"
+
+
 class Test_4a_KLAP20GroupOps(
     TestOpenVerify, TestOpen, TestBase, unittest.TestCase
 ):
@@ -53,6 +73,10 @@ class Test_4b_KLAP20ExportImportOps(TestBaseExportImport, unittest.TestCase):
     scheme = "klap20"
 
 
+class Test_4c_KLAP20OpenOps(TestOpenScan, unittest.TestCase):
+    scheme = "klap20"
+
+
 class Test_5a_GL19GroupOps(TestBase, unittest.TestCase):
     scheme = "gl19"
 
@@ -79,6 +103,10 @@ class Test_6c_DL21ExportImportOps(TestBaseExportImport, unittest.TestCase):
     scheme = "dl21"
 
 
+class Test_6d_DL21BatchOps(TestBatchVerify, unittest.TestCase):
+    scheme = "dl21"
+
+
 class Test_7a_DL21SEQGroupOps(TestBase, unittest.TestCase):
     scheme = "dl21seq"
 
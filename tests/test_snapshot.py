@@ -0,0 +1,94 @@
+import os
+import tempfile
+import unittest
+
+from pygroupsig import group, key
+from pygroupsig.utils import snapshot
+
+
+def _add_member(gs):
+    memkey = key(gs._name, "member")()
+    msg2 = None
+    for _ in range(0, gs.join_seq() + 1, 2):
+        msg1 = gs.join_mgr(msg2)
+        msg2 = gs.join_mem(msg1, memkey)
+    return memkey
+
+
+class TestSnapshot(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.dir.name, "group.bin")
+        self.group = group("cpy06")()
+        self.group.setup()
+        self.memkey = _add_member(self.group)
+
+    def tearDown(self):
+        self.dir.cleanup()
+
+    def test_roundtrip(self):
+        snapshot.save(self.path, self.group, {"doctor": self.memkey})
+        gs, members = snapshot.load(self.path)
+        self.assertEqual(list(members), ["doctor"])
+        self.assertEqual(members["doctor"].to_b64(), self.memkey.to_b64())
+        for name in ("group_key", "manager_key", "revocation_manager_key"):
+            self.assertEqual(
+                getattr(gs, name).to_b64(), getattr(self.group, name).to_b64()
+            )
+        self.assertEqual(gs.gml.to_b64(), self.group.gml.to_b64())
+        sig = gs.sign("Hello world!", members["doctor"])["signature"]
+        self.assertEqual(
+            self.group.verify("Hello world!", sig)["status"], "success"
+        )
+        partial_g = gs.open(sig)["partial_g"]
+        partial_r = gs.open(sig, group_manager_partial=partial_g)["partial_r"]
+        ret = gs.open(
+            sig,
+            group_manager_partial=partial_g,
+            revocation_manager_partial=partial_r,
+        )
+        self.assertEqual(ret["status"], "success")
+
+    def test_permissions(self):
+        snapshot.save(self.path, self.group, {"doctor": self.memkey})
+        self.assertEqual(os.stat(self.path).st_mode & 0o777, 0o600)
+        self.assertEqual(os.listdir(self.dir.name), ["group.bin"])
+
+    def test_precomputedMismatch(self):
+        ## Tables of another group key are rebuilt
+        other = group("cpy06")()
+        other.setup()
+        snapshot.save(self.path, self.group)
+        with open(self.path, "rb") as f:
+            data = f.read()
+        data = data.replace(
+            self.group.group_key.precomputed_to_bytes(),
+            other.group_key.precomputed_to_bytes(),
+        )
+        with open(self.path, "wb") as f:
+            f.write(data)
+        gs, members = snapshot.load(self.path)
+        self.assertEqual(members, {})
+        sig = self.group.sign("Hello world!", self.memkey)["signature"]
+        self.assertEqual(gs.verify("Hello world!", sig)["status"], "success")
+
+    def test_otherSchemes(self):
+        for scheme in ("bbs04", "ps16", "gl19"):
+            gs = group(scheme)()
+            gs.setup()
+            snapshot.save(self.path, gs)
+            loaded, _ = snapshot.load(self.path)
+            self.assertEqual(loaded.group_key.to_b64(), gs.group_key.to_b64())
+            self.assertEqual(
+                loaded.manager_key.to_b64(), gs.manager_key.to_b64()
+            )
+
+    def test_invalid(self):
+        snapshot.save(self.path, self.group)
+        with open(self.path, "rb") as f:
+            data = f.read()
+        for bad in (b"", b"\x00" * 16, data[:-10]):
+            with open(self.path, "wb") as f:
+                f.write(bad)
+            with self.assertRaises(ValueError):
+                snapshot.load(self.path)